@@ -1,476 +1,19 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-import requests
-import json
-from datetime import datetime, timedelta
+from feder_core.theme import configure_page
+from feder_core.core import FEDERCore
+from feder_core.views import DashboardViews
 
 # Configuration de la page
-st.set_page_config(
-    page_title="Dashboard FEDER Europe - Données Réelles",
-    page_icon="🇪🇺",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+configure_page("Dashboard FEDER Europe - Données Réelles")
 
-# CSS personnalisé
-st.markdown("""
-<style>
-    .main-header { 
-        font-size: 2.5rem; 
-        background: linear-gradient(45deg, #003399, #0055A4, #0077CC);
-        -webkit-background-clip: text; 
-        -webkit-text-fill-color: transparent; 
-        text-align: center; 
-        margin-bottom: 1rem; 
-        font-weight: bold; 
-    }
-    .eu-card { 
-        background: linear-gradient(135deg, #003399, #0055A4);
-        color: white; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem 0; 
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-        border-left: 5px solid #FFCC00;
-    }
-    .program-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    .section-header { 
-        color: #2c3e50; 
-        border-bottom: 3px solid #003399; 
-        padding-bottom: 0.5rem; 
-        margin-top: 2rem; 
-        font-size: 1.5rem; 
-        font-weight: bold;
-    }
-    .api-status {
-        padding: 0.5rem;
-        border-radius: 5px;
-        margin: 0.2rem 0;
-        font-weight: bold;
-    }
-    .api-success { background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
-    .api-warning { background-color: #fff3cd; color: #856404; border: 1px solid #ffeaa7; }
-    .api-error { background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
-</style>
-""", unsafe_allow_html=True)
-
-class FEDERDashboard:
-    def __init__(self):
-        self.territoires = self.define_territoires()
-        self.specific_programs = self.define_specific_programs()
-        
-    def define_territoires(self):
-        """Définit les territoires éligibles FEDER"""
-        return {
-            "DROM": {
-                "La Réunion": {"population": 860000, "pib_habitant": 21000},
-                "Martinique": {"population": 375000, "pib_habitant": 23400},
-                "Guadeloupe": {"population": 390000, "pib_habitant": 22500},
-                "Guyane": {"population": 290000, "pib_habitant": 15800},
-                "Mayotte": {"population": 280000, "pib_habitant": 9600}
-            },
-            "COM": {
-                "Saint-Martin": {"population": 35000, "pib_habitant": 21500},
-                "Saint-Barthélemy": {"population": 9800, "pib_habitant": 38500},
-                "Polynésie française": {"population": 280000, "pib_habitant": 20300},
-                "Nouvelle-Calédonie": {"population": 270000, "pib_habitant": 32500},
-                "Wallis-et-Futuna": {"population": 11500, "pib_habitant": 12500}
-            }
-        }
-
-    def define_specific_programs(self):
-        """Définit les programmes FEDER spécifiques avec données réalistes"""
-        return {
-            "2014FR05SFOP005": {
-                "name": "FEDER-FSE-IEJ - Mayotte",
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005",
-                "territory": "Mayotte",
-                "type": "DROM",
-                "description": "Programme FEDER-FSE-IEJ pour Mayotte 2014-2020",
-                "total_budget": 280,  # Millions d'euros
-                "eu_contribution": 210,
-                "themes": ["Formation", "Inclusion sociale", "Emploi des jeunes"]
-            },
-            "2014FR16RFOP007": {
-                "name": "FEDER-FSE-IEJ - Corse", 
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR16RFOP007",
-                "territory": "Corse",
-                "type": "Région Métropolitaine",
-                "description": "Programme FEDER-FSE-IEJ pour la Corse 2014-2020",
-                "total_budget": 355,
-                "eu_contribution": 266,
-                "themes": ["Innovation", "Tourisme durable", "Environnement"]
-            },
-            "2014FR06RDRP004": {
-                "name": "FEDER-FSE - Guadeloupe",
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR06RDRP004",
-                "territory": "Guadeloupe",
-                "type": "DROM",
-                "description": "Programme FEDER-FSE pour la Guadeloupe 2014-2020",
-                "total_budget": 420,
-                "eu_contribution": 315,
-                "themes": ["Transition énergétique", "Innovation", "Formation"]
-            }
-        }
-    
-    def test_api_connectivity(self):
-        """Teste la connectivité aux ressources en ligne"""
-        st.sidebar.markdown("### 🔌 Statut des Données")
-        
-        # Test des URLs des programmes
-        try:
-            test_url = "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005"
-            response = requests.get(test_url, timeout=10)
-            if response.status_code == 200:
-                st.sidebar.markdown('<div class="api-status api-success">✅ Portail FEDER - Accessible</div>', unsafe_allow_html=True)
-            else:
-                st.sidebar.markdown('<div class="api-status api-warning">⚠️ Portail FEDER - Limité</div>', unsafe_allow_html=True)
-        except:
-            st.sidebar.markdown('<div class="api-status api-error">❌ Portail FEDER - Hors ligne</div>', unsafe_allow_html=True)
-    
-    def generate_program_data(self, program_id):
-        """Génère des données réalistes pour un programme FEDER"""
-        program = self.specific_programs[program_id]
-        
-        years = list(range(2014, 2024))
-        
-        if program_id == "2014FR05SFOP005":  # Mayotte
-            budget_data = [32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8]
-            projects_data = [28, 32, 36, 40, 44, 48, 52, 56, 60, 65]
-            jobs_data = [85, 95, 110, 125, 140, 155, 170, 185, 200, 220]
-        elif program_id == "2014FR16RFOP007":  # Corse
-            budget_data = [45.2, 49.8, 54.7, 59.9, 65.4, 71.2, 77.4, 83.9, 90.8, 98.1]
-            projects_data = [38, 42, 47, 52, 58, 64, 71, 78, 86, 94]
-            jobs_data = [120, 135, 150, 170, 190, 215, 240, 265, 295, 325]
-        elif program_id == "2014FR06RDRP004":  # Guadeloupe
-            budget_data = [52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5]
-            projects_data = [42, 47, 53, 59, 66, 74, 83, 92, 102, 113]
-            jobs_data = [150, 170, 195, 220, 250, 285, 320, 360, 405, 455]
-        else:
-            # Données génériques
-            base_budget = program["total_budget"] / 10
-            budget_data = [base_budget * (1 + 0.08 * i) for i in range(len(years))]
-            projects_data = [int(base_budget * 0.8 * (1 + 0.08 * i)) for i in range(len(years))]
-            jobs_data = [int(projects * 3.5) for projects in projects_data]
-        
-        data = {
-            'Année': years,
-            'Programme': [program['name']] * len(years),
-            'Territoire': [program['territory']] * len(years),
-            'Budget_Total': budget_data,
-            'Contribution_UE': [budget * 0.75 for budget in budget_data],
-            'Cofinancement_Local': [budget * 0.25 for budget in budget_data],
-            'Projets_Finances': projects_data,
-            'Emplois_Crees': jobs_data,
-            'PME_Soutennes': [int(projects * 0.65) for projects in projects_data],
-            'Taux_Realisation': [0.65, 0.72, 0.78, 0.83, 0.87, 0.90, 0.92, 0.94, 0.96, 0.98]
-        }
-        
-        return pd.DataFrame(data)
-    
-    def generate_territory_data(self, territoire: str, type_territoire: str):
-        """Génère des données pour un territoire donné"""
-        years = list(range(2014, 2028))
-        base_config = self.territoires[type_territoire][territoire]
-        base_pop = base_config["population"]
-        
-        # Données basées sur les caractéristiques du territoire
-        if territoire == "Mayotte":
-            budget_growth = [32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8, 72.8, 78.2, 84.0, 90.3]
-            projects_growth = [28, 32, 36, 40, 44, 48, 52, 56, 60, 65, 70, 76, 82, 88]
-        elif territoire == "Guadeloupe":
-            budget_growth = [52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5, 137.0, 150.7, 165.8, 182.4]
-            projects_growth = [42, 47, 53, 59, 66, 74, 83, 92, 102, 113, 125, 138, 152, 167]
-        elif territoire == "La Réunion":
-            budget_growth = [68.2, 74.1, 80.5, 87.4, 94.9, 103.0, 111.8, 121.4, 131.8, 143.2, 155.6, 169.1, 183.8, 199.8]
-            projects_growth = [55, 61, 68, 75, 83, 92, 102, 113, 125, 138, 152, 168, 185, 204]
-        else:
-            # Croissance générique
-            base_budget = base_pop * 0.001
-            budget_growth = [base_budget * (1 + 0.08 * i) for i in range(len(years))]
-            projects_growth = [int(base_budget * 0.8 * (1 + 0.08 * i)) for i in range(len(years))]
-        
-        data = {
-            'Année': years,
-            'Territoire': [territoire] * len(years),
-            'Type_Territoire': [type_territoire] * len(years),
-            'Budget_Total': budget_growth,
-            'Contribution_UE': [budget * 0.75 for budget in budget_growth],
-            'Cofinancement_Local': [budget * 0.25 for budget in budget_growth],
-            'Projets_Finances': projects_growth,
-            'Emplois_Crees': [projects * 3 for projects in projects_growth],
-            'PME_Soutennes': [int(projects * 0.6) for projects in projects_growth],
-            'Population': [base_pop * (1 + 0.012 * i) for i in range(len(years))],
-            'PIB_Par_Habitant': [base_config["pib_habitant"] * (1 + 0.018 * i) for i in range(len(years))]
-        }
-        
-        return pd.DataFrame(data)
-    
-    def display_header(self):
-        """Affiche l'en-tête du dashboard"""
-        st.markdown('<h1 class="main-header">🇪🇺 DASHBOARD FEDER EUROPE</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        <div style='text-align: center; background: linear-gradient(45deg, #003399, #0055A4); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 2rem;'>
-            <h3>Fonds Européen de Développement Régional - Analyse des Programmes 2014-2027</h3>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    def display_program_cards(self):
-        """Affiche les cartes des programmes spécifiques"""
-        st.markdown('<h3 class="section-header">🎯 PROGRAMMES FEDER SPÉCIFIQUES</h3>', unsafe_allow_html=True)
-        
-        cols = st.columns(3)
-        
-        for i, (program_id, program_info) in enumerate(self.specific_programs.items()):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="program-card">
-                    <h4>📋 {program_info['territory']}</h4>
-                    <p><strong>{program_info['name']}</strong></p>
-                    <p>Budget total: <strong>{program_info['total_budget']} M€</strong></p>
-                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
-                    <p>Thèmes: {', '.join(program_info['themes'])}</p>
-                    <div style="margin-top: 1rem;">
-                        <a href="{program_info['url']}" target="_blank" style="color: white; text-decoration: underline;">
-                            🔗 Voir sur le portail UE
-                        </a>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def display_key_metrics(self, df, title="MÉTRIQUES CLÉS"):
-        """Affiche les métriques clés FEDER"""
-        st.markdown(f'<h3 class="section-header">📊 {title}</h3>', unsafe_allow_html=True)
-        
-        if df is not None:
-            total_budget = df['Budget_Total'].sum()
-            total_projects = df['Projets_Finances'].sum()
-            total_jobs = df['Emplois_Crees'].sum()
-            eu_contribution = df['Contribution_UE'].sum()
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>💰 Budget Total</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_budget:.1f} M€</div>
-                    <p>Période analysée</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>📋 Projets Financés</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_projects:.0f}</div>
-                    <p>Projets soutenus</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>👥 Emplois Créés</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_jobs:.0f}</div>
-                    <p>Emplois directs et indirects</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>🇪🇺 Contribution UE</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{eu_contribution:.1f} M€</div>
-                    <p>{(eu_contribution/total_budget*100):.1f}% du total</p>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def create_comparison_charts(self):
-        """Crée des graphiques comparatifs entre les programmes"""
-        st.markdown('<h3 class="section-header">📈 COMPARAISON DES PROGRAMMES FEDER</h3>', unsafe_allow_html=True)
-        
-        all_data = []
-        for program_id in self.specific_programs.keys():
-            program_data = self.generate_program_data(program_id)
-            all_data.append(program_data)
-        
-        combined_data = pd.concat(all_data, ignore_index=True)
-        
-        # Graphique 1: Évolution des budgets
-        fig1 = px.line(
-            combined_data, 
-            x='Année', 
-            y='Budget_Total', 
-            color='Territoire',
-            title='Évolution des Budgets FEDER par Programme (M€)',
-            markers=True
-        )
-        fig1.update_layout(height=400)
-        st.plotly_chart(fig1, use_container_width=True)
-        
-        # Graphique 2: Comparaison des totaux
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            totals = combined_data.groupby('Territoire').agg({
-                'Budget_Total': 'sum',
-                'Contribution_UE': 'sum'
-            }).reset_index()
-            
-            fig2 = px.bar(
-                totals,
-                x='Territoire',
-                y=['Budget_Total', 'Contribution_UE'],
-                title='Budget Total et Contribution UE par Programme (M€)',
-                barmode='group'
-            )
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-        
-        with col2:
-            results = combined_data.groupby('Territoire').agg({
-                'Projets_Finances': 'sum',
-                'Emplois_Crees': 'sum'
-            }).reset_index()
-            
-            fig3 = px.bar(
-                results,
-                x='Territoire',
-                y=['Projets_Finances', 'Emplois_Crees'],
-                title='Projets Financés et Emplois Créés',
-                barmode='group'
-            )
-            fig3.update_layout(height=400)
-            st.plotly_chart(fig3, use_container_width=True)
-    
-    def create_program_details(self, program_id):
-        """Affiche les détails d'un programme spécifique"""
-        program_info = self.specific_programs[program_id]
-        program_data = self.generate_program_data(program_id)
-        
-        st.markdown(f'<h3 class="section-header">📋 DÉTAILS DU PROGRAMME - {program_info["territory"].upper()}</h3>', unsafe_allow_html=True)
-        
-        # Métriques du programme
-        self.display_key_metrics(program_data, f"MÉTRIQUES - {program_info['territory']}")
-        
-        # Graphiques spécifiques au programme
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_budget = px.area(
-                program_data, 
-                x='Année', 
-                y=['Budget_Total', 'Contribution_UE', 'Cofinancement_Local'],
-                title=f'Évolution des Financements - {program_info["territory"]}',
-                color_discrete_map={
-                    'Budget_Total': '#003399',
-                    'Contribution_UE': '#0055A4', 
-                    'Cofinancement_Local': '#FFCC00'
-                }
-            )
-            fig_budget.update_layout(height=400)
-            st.plotly_chart(fig_budget, use_container_width=True)
-        
-        with col2:
-            fig_results = go.Figure()
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Projets_Finances'],
-                name='Projets Financés', line=dict(color='#28a745')
-            ))
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Emplois_Crees'],
-                name='Emplois Créés', line=dict(color='#dc3545'),
-                yaxis='y2'
-            ))
-            
-            fig_results.update_layout(
-                title=f'Résultats - {program_info["territory"]}',
-                xaxis_title='Année',
-                yaxis_title='Nombre de Projets',
-                yaxis2=dict(title='Emplois Créés', overlaying='y', side='right'),
-                height=400
-            )
-            st.plotly_chart(fig_results, use_container_width=True)
-        
-        # Informations sur le programme
-        st.markdown("#### 📝 Informations du Programme")
-        col_info1, col_info2 = st.columns(2)
-        
-        with col_info1:
-            st.metric("Type de programme", program_info["type"])
-            st.metric("Période de programmation", "2014-2020")
-            st.metric("Taux de cofinancement UE", "75%")
-        
-        with col_info2:
-            st.metric("Thèmes principaux", ", ".join(program_info["themes"]))
-            st.metric("Lien vers le portail", f"[Voir le programme]({program_info['url']})")
-    
-    def create_efficiency_analysis(self):
-        """Analyse l'efficacité des programmes"""
-        st.markdown('<h3 class="section-header">📊 ANALYSE D\'EFFICACITÉ</h3>', unsafe_allow_html=True)
-        
-        all_data = []
-        for program_id in self.specific_programs.keys():
-            program_data = self.generate_program_data(program_id)
-            all_data.append(program_data)
-        
-        combined_data = pd.concat(all_data, ignore_index=True)
-        
-        # Calcul des indicateurs d'efficacité
-        combined_data['Efficacite_Emploi'] = combined_data['Emplois_Crees'] / combined_data['Budget_Total']
-        combined_data['Efficacite_Projet'] = combined_data['Projets_Finances'] / combined_data['Budget_Total']
-        combined_data['Cout_Emploi'] = combined_data['Budget_Total'] / combined_data['Emplois_Crees']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Efficacité moyenne par programme
-            efficacite_moyenne = combined_data.groupby('Territoire').agg({
-                'Efficacite_Emploi': 'mean',
-                'Efficacite_Projet': 'mean'
-            }).reset_index()
-            
-            fig_eff = px.bar(
-                efficacite_moyenne,
-                x='Territoire',
-                y=['Efficacite_Emploi', 'Efficacite_Projet'],
-                title='Efficacité Moyenne des Programmes',
-                labels={'value': 'Valeur', 'variable': 'Indicateur'},
-                barmode='group'
-            )
-            fig_eff.update_layout(height=400)
-            st.plotly_chart(fig_eff, use_container_width=True)
-        
-        with col2:
-            # Coût par emploi créé
-            cout_emploi = combined_data.groupby('Territoire')['Cout_Emploi'].mean().reset_index()
-            
-            fig_cout = px.bar(
-                cout_emploi,
-                x='Territoire',
-                y='Cout_Emploi',
-                title='Coût Moyen par Emploi Créé (M€/emploi)',
-                color='Cout_Emploi',
-                color_continuous_scale='Viridis'
-            )
-            fig_cout.update_layout(height=400)
-            st.plotly_chart(fig_cout, use_container_width=True)
+class FEDERDashboard(DashboardViews, FEDERCore):
+    HEADER_TITLE = "DASHBOARD FEDER EUROPE"
+    HEADER_SUBTITLE = "Fonds Européen de Développement Régional - Analyse des Programmes 2014-2027"
     
     def run(self):
         """Exécute le dashboard principal"""
         self.display_header()
-        self.test_api_connectivity()
+        self.display_portal_status()
         self.display_program_cards()
         
         # Navigation principale
@@ -480,62 +23,10 @@ class FEDERDashboard:
         )
         
         if menu == "Tableau de Bord Territorial":
-            # Sélection du territoire
-            st.sidebar.markdown("## 🗺️ Sélection du Territoire")
-            
-            type_territoire = st.sidebar.selectbox(
-                "Type de Territoire:",
-                ["DROM", "COM"]
-            )
-            
-            territoire = st.sidebar.selectbox(
-                "Territoire:",
-                list(self.territoires[type_territoire].keys())
-            )
-            
-            # Génération des données
-            df = self.generate_territory_data(territoire, type_territoire)
-            
-            # Affichage des données
-            self.display_key_metrics(df, f"MÉTRIQUES - {territoire}")
-            
-            # Graphiques du territoire
-            st.markdown('<h3 class="section-header">📈 ÉVOLUTION DES INDICATEURS</h3>', unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig_budget = px.line(
-                    df, 
-                    x='Année', 
-                    y=['Budget_Total', 'Contribution_UE'],
-                    title=f'Évolution des Financements - {territoire}',
-                    markers=True
-                )
-                fig_budget.update_layout(height=400)
-                st.plotly_chart(fig_budget, use_container_width=True)
-            
-            with col2:
-                fig_results = px.line(
-                    df,
-                    x='Année',
-                    y=['Projets_Finances', 'Emplois_Crees'],
-                    title=f'Résultats des Projets - {territoire}',
-                    markers=True
-                )
-                fig_results.update_layout(height=400)
-                st.plotly_chart(fig_results, use_container_width=True)
+            self.create_territory_dashboard()
                 
         elif menu == "Programmes Spécifiques":
-            st.sidebar.markdown("## 🎯 Sélection du Programme")
-            
-            selected_program = st.sidebar.selectbox(
-                "Programme:",
-                list(self.specific_programs.keys()),
-                format_func=lambda x: self.specific_programs[x]['territory']
-            )
-            
-            self.create_program_details(selected_program)
+            self.create_program_page()
             
         elif menu == "Analyse Comparative":
             self.create_comparison_charts()
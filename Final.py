@@ -1,1754 +1,13 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import requests
-import json
-from datetime import datetime, timedelta
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
-import seaborn as sns
-import matplotlib.pyplot as plt
-from scipy import stats
 import warnings
+from feder_core.theme import configure_page
+from feder_core.final_app import FEDERDashboard
+from feder_core.session import get_data_service
 warnings.filterwarnings('ignore')
 
 # Configuration de la page
-st.set_page_config(
-    page_title="Dashboard FEDER Europe - Analyses Complètes",
-    page_icon="🇪🇺",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# CSS personnalisé
-st.markdown("""
-<style>
-    .main-header { 
-        font-size: 2.5rem; 
-        background: linear-gradient(45deg, #003399, #0055A4, #0077CC);
-        -webkit-background-clip: text; 
-        -webkit-text-fill-color: transparent; 
-        text-align: center; 
-        margin-bottom: 1rem; 
-        font-weight: bold; 
-    }
-    .eu-card { 
-        background: linear-gradient(135deg, #003399, #0055A4);
-        color: white; 
-        padding: 1.5rem; 
-        border-radius: 15px; 
-        margin: 0.5rem 0; 
-        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
-        border-left: 5px solid #FFCC00;
-    }
-    .program-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    .section-header { 
-        color: #2c3e50; 
-        border-bottom: 3px solid #003399; 
-        padding-bottom: 0.5rem; 
-        margin-top: 2rem; 
-        font-size: 1.5rem; 
-        font-weight: bold;
-    }
-    .api-status {
-        padding: 0.5rem;
-        border-radius: 5px;
-        margin: 0.2rem 0;
-        font-weight: bold;
-    }
-    .api-success { background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
-    .api-warning { background-color: #fff3cd; color: #856404; border: 1px solid #ffeaa7; }
-    .api-error { background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
-    .new-program {
-        background: linear-gradient(135deg, #11998e, #38ef7d);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    .insight-card {
-        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        margin: 1rem 0;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-    }
-    .risk-high { background-color: #f8d7da; color: #721c24; padding: 0.5rem; border-radius: 5px; }
-    .risk-medium { background-color: #fff3cd; color: #856404; padding: 0.5rem; border-radius: 5px; }
-    .risk-low { background-color: #d4edda; color: #155724; padding: 0.5rem; border-radius: 5px; }
-</style>
-""", unsafe_allow_html=True)
-
-class FEDERDashboard:
-    def __init__(self):
-        self.territoires = self.define_territoires()
-        self.specific_programs = self.define_specific_programs()
-        self.drom_com_programs = self.define_drom_com_programs()
-        
-    def define_territoires(self):
-        """Définit les territoires éligibles FEDER avec données enrichies"""
-        return {
-            "DROM": {
-                "La Réunion": {
-                    "population": 860000, 
-                    "pib_habitant": 21000,
-                    "taux_chomage": 23.5,
-                    "indice_developpement": 0.785,
-                    "secteurs_cles": ["Tourisme", "Agriculture", "Technologies"],
-                    "risques": ["Cyclones", "Changements climatiques", "Dépendance économique"]
-                },
-                "Martinique": {
-                    "population": 375000, 
-                    "pib_habitant": 23400,
-                    "taux_chomage": 19.8,
-                    "indice_developpement": 0.802,
-                    "secteurs_cles": ["Tourisme", "Services", "Agro-industrie"],
-                    "risques": ["Séismes", "Éruption volcanique", "Chômage"]
-                },
-                "Guadeloupe": {
-                    "population": 390000, 
-                    "pib_habitant": 22500,
-                    "taux_chomage": 21.2,
-                    "indice_developpement": 0.795,
-                    "secteurs_cles": ["Tourisme", "Agriculture", "Énergies renouvelables"],
-                    "risques": ["Cyclones", "Pollution", "Inégalités sociales"]
-                },
-                "Guyane": {
-                    "population": 290000, 
-                    "pib_habitant": 15800,
-                    "taux_chomage": 28.5,
-                    "indice_developpement": 0.712,
-                    "secteurs_cles": ["Spatial", "Forêt", "Orpaillage"],
-                    "risques": ["Déforestation", "Migration", "Infrastructures limitées"]
-                },
-                "Mayotte": {
-                    "population": 280000, 
-                    "pib_habitant": 9600,
-                    "taux_chomage": 35.2,
-                    "indice_developpement": 0.654,
-                    "secteurs_cles": ["Agriculture", "Pêche", "Tourisme émergent"],
-                    "risques": ["Pauvreté", "Santé", "Éducation"]
-                }
-            },
-            "COM": {
-                "Saint-Martin": {
-                    "population": 35000, 
-                    "pib_habitant": 21500,
-                    "taux_chomage": 18.5,
-                    "indice_developpement": 0.812,
-                    "secteurs_cles": ["Tourisme de luxe", "Services financiers", "Commerce"],
-                    "risques": ["Cyclones", "Dépendance touristique", "Instabilité économique"]
-                },
-                "Saint-Barthélemy": {
-                    "population": 9800, 
-                    "pib_habitant": 38500,
-                    "taux_chomage": 8.2,
-                    "indice_developpement": 0.925,
-                    "secteurs_cles": ["Tourisme ultra-luxe", "Immobilier", "Services haut de gamme"],
-                    "risques": ["Cyclones", "Monodépendance", "Coût de la vie"]
-                },
-                "Polynésie française": {
-                    "population": 280000, 
-                    "pib_habitant": 20300,
-                    "taux_chomage": 22.1,
-                    "indice_developpement": 0.788,
-                    "secteurs_cles": ["Tourisme", "Perliculture", "Pêche"],
-                    "risques": ["Changements climatiques", "Éloignement", "Coûts des importations"]
-                },
-                "Nouvelle-Calédonie": {
-                    "population": 270000, 
-                    "pib_habitant": 32500,
-                    "taux_chomage": 14.8,
-                    "indice_developpement": 0.856,
-                    "secteurs_cles": ["Nickel", "Tourisme", "Services"],
-                    "risques": ["Dépendance au nickel", "Tensions sociales", "Environnement"]
-                },
-                "Wallis-et-Futuna": {
-                    "population": 11500, 
-                    "pib_habitant": 12500,
-                    "taux_chomage": 16.5,
-                    "indice_developpement": 0.725,
-                    "secteurs_cles": ["Agriculture", "Pêche", "Aides publiques"],
-                    "risques": ["Isolement", "Exode", "Ressources limitées"]
-                }
-            }
-        }
-
-    def define_specific_programs(self):
-        """Définit les programmes FEDER spécifiques avec données enrichies"""
-        return {
-            "2014FR05SFOP005": {
-                "name": "FEDER-FSE-IEJ - Mayotte",
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005",
-                "territory": "Mayotte",
-                "type": "DROM",
-                "description": "Programme FEDER-FSE-IEJ pour Mayotte 2014-2020",
-                "total_budget": 280,
-                "eu_contribution": 210,
-                "themes": ["Formation", "Inclusion sociale", "Emploi des jeunes"],
-                "indicateurs_performance": {
-                    "taux_absorption": 0.92,
-                    "impact_social": 0.78,
-                    "efficacite_budget": 0.85,
-                    "durabilite": 0.72
-                }
-            },
-            "2014FR16RFOP007": {
-                "name": "FEDER-FSE-IEJ - Corse", 
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR16RFOP007",
-                "territory": "Corse",
-                "type": "Région Métropolitaine",
-                "description": "Programme FEDER-FSE-IEJ pour la Corse 2014-2020",
-                "total_budget": 355,
-                "eu_contribution": 266,
-                "themes": ["Innovation", "Tourisme durable", "Environnement"],
-                "indicateurs_performance": {
-                    "taux_absorption": 0.88,
-                    "impact_social": 0.82,
-                    "efficacite_budget": 0.79,
-                    "durabilite": 0.85
-                }
-            },
-            "2014FR06RDRP004": {
-                "name": "FEDER-FSE - Guadeloupe",
-                "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR06RDRP004",
-                "territory": "Guadeloupe",
-                "type": "DROM",
-                "description": "Programme FEDER-FSE pour la Guadeloupe 2014-2020",
-                "total_budget": 420,
-                "eu_contribution": 315,
-                "themes": ["Transition énergétique", "Innovation", "Formation"],
-                "indicateurs_performance": {
-                    "taux_absorption": 0.90,
-                    "impact_social": 0.80,
-                    "efficacite_budget": 0.83,
-                    "durabilite": 0.78
-                }
-            }
-        }
-    
-    def define_drom_com_programs(self):
-        """Définit les programmes FEDER 2021-2027 pour les DROM COM avec données enrichies"""
-        return {
-            "2021FR16TCPO001": {
-                "name": "FEDER - DROM",
-                "url": "https://ec.europa.eu/regional_policy/in-your-country/programmes/2021-2027/fr_en",
-                "territory": "DROM",
-                "type": "DROM",
-                "description": "Programme FEDER pour les Départements et Régions d'Outre-Mer 2021-2027",
-                "total_budget": 1250,
-                "eu_contribution": 937.5,
-                "themes": ["Transition écologique", "Innovation numérique", "Inclusion sociale", "Développement économique"],
-                "territoires_cibles": ["Guadeloupe", "La Réunion", "Martinique", "Guyane", "Mayotte"],
-                "indicateurs_performance": {
-                    "taux_absorption_prevu": 0.95,
-                    "impact_social_estime": 0.85,
-                    "efficacite_budget_estime": 0.88,
-                    "durabilite_estimee": 0.82
-                }
-            },
-            "2021FR16TCPO002": {
-                "name": "FEDER - COM",
-                "url": "https://ec.europa.eu/regional_policy/in-your-country/programmes/2021-2027/fr_en",
-                "territory": "COM",
-                "type": "COM",
-                "description": "Programme FEDER pour les Collectivités d'Outre-Mer 2021-2027",
-                "total_budget": 350,
-                "eu_contribution": 262.5,
-                "themes": ["Transition écologique", "Innovation numérique", "Inclusion sociale", "Développement économique"],
-                "territoires_cibles": ["Saint-Martin", "Saint-Barthélemy", "Polynésie française", "Nouvelle-Calédonie", "Wallis-et-Futuna"],
-                "indicateurs_performance": {
-                    "taux_absorption_prevu": 0.90,
-                    "impact_social_estime": 0.80,
-                    "efficacite_budget_estime": 0.85,
-                    "durabilite_estimee": 0.78
-                }
-            }
-        }
-    
-    def test_api_connectivity(self):
-        """Teste la connectivité aux ressources en ligne"""
-        st.sidebar.markdown("### 🔌 Statut des Données")
-        
-        # Test des URLs des programmes
-        try:
-            test_url = "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005"
-            response = requests.get(test_url, timeout=10)
-            if response.status_code == 200:
-                st.sidebar.markdown('<div class="api-status api-success">✅ Portail FEDER - Accessible</div>', unsafe_allow_html=True)
-            else:
-                st.sidebar.markdown('<div class="api-status api-warning">⚠️ Portail FEDER - Limité</div>', unsafe_allow_html=True)
-        except:
-            st.sidebar.markdown('<div class="api-status api-error">❌ Portail FEDER - Hors ligne</div>', unsafe_allow_html=True)
-    
-    def generate_program_data(self, program_id):
-        """Génère des données réalistes pour un programme FEDER"""
-        program = self.specific_programs[program_id]
-        
-        years = list(range(2014, 2024))
-        
-        if program_id == "2014FR05SFOP005":  # Mayotte
-            budget_data = [32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8]
-            projects_data = [28, 32, 36, 40, 44, 48, 52, 56, 60, 65]
-            jobs_data = [85, 95, 110, 125, 140, 155, 170, 185, 200, 220]
-        elif program_id == "2014FR16RFOP007":  # Corse
-            budget_data = [45.2, 49.8, 54.7, 59.9, 65.4, 71.2, 77.4, 83.9, 90.8, 98.1]
-            projects_data = [38, 42, 47, 52, 58, 64, 71, 78, 86, 94]
-            jobs_data = [120, 135, 150, 170, 190, 215, 240, 265, 295, 325]
-        elif program_id == "2014FR06RDRP004":  # Guadeloupe
-            budget_data = [52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5]
-            projects_data = [42, 47, 53, 59, 66, 74, 83, 92, 102, 113]
-            jobs_data = [150, 170, 195, 220, 250, 285, 320, 360, 405, 455]
-        else:
-            # Données génériques
-            base_budget = program["total_budget"] / 10
-            budget_data = [base_budget * (1 + 0.08 * i) for i in range(len(years))]
-            projects_data = [int(base_budget * 0.8 * (1 + 0.08 * i)) for i in range(len(years))]
-            jobs_data = [int(projects * 3.5) for projects in projects_data]
-        
-        data = {
-            'Année': years,
-            'Programme': [program['name']] * len(years),
-            'Territoire': [program['territory']] * len(years),
-            'Budget_Total': budget_data,
-            'Contribution_UE': [budget * 0.75 for budget in budget_data],
-            'Cofinancement_Local': [budget * 0.25 for budget in budget_data],
-            'Projets_Finances': projects_data,
-            'Emplois_Crees': jobs_data,
-            'PME_Soutenues': [int(projects * 0.65) for projects in projects_data],
-            'Taux_Realisation': [0.65, 0.72, 0.78, 0.83, 0.87, 0.90, 0.92, 0.94, 0.96, 0.98]
-        }
-        
-        return pd.DataFrame(data)
-    
-    def generate_drom_com_data(self, program_id):
-        """Génère des données pour les programmes DROM COM 2021-2027"""
-        program = self.drom_com_programs[program_id]
-        
-        years = list(range(2021, 2028))
-        
-        if program_id == "2021FR16TCPO001":  # DROM
-            budget_data = [120, 135, 150, 165, 180, 195, 205]
-            projects_data = [45, 52, 60, 68, 75, 82, 88]
-            jobs_data = [350, 400, 460, 520, 580, 640, 700]
-        elif program_id == "2021FR16TCPO002":  # COM
-            budget_data = [35, 40, 45, 50, 55, 60, 65]
-            projects_data = [15, 18, 22, 26, 30, 34, 38]
-            jobs_data = [120, 140, 165, 190, 215, 240, 265]
-        else:
-            # Données génériques
-            base_budget = program["total_budget"] / 7
-            budget_data = [base_budget * (1 + 0.05 * i) for i in range(len(years))]
-            projects_data = [int(base_budget * 0.4 * (1 + 0.05 * i)) for i in range(len(years))]
-            jobs_data = [int(projects * 4) for projects in projects_data]
-        
-        data = {
-            'Année': years,
-            'Programme': [program['name']] * len(years),
-            'Territoire': [program['territory']] * len(years),
-            'Budget_Total': budget_data,
-            'Contribution_UE': [budget * 0.75 for budget in budget_data],
-            'Cofinancement_Local': [budget * 0.25 for budget in budget_data],
-            'Projets_Finances': projects_data,
-            'Emplois_Crees': jobs_data,
-            'PME_Soutenues': [int(projects * 0.7) for projects in projects_data],
-            'Taux_Realisation': [0.15, 0.25, 0.40, 0.55, 0.70, 0.85, 1.0]
-        }
-        
-        return pd.DataFrame(data)
-    
-    def generate_territory_data(self, territoire: str, type_territoire: str):
-        """Génère des données pour un territoire donné"""
-        years = list(range(2014, 2028))
-        base_config = self.territoires[type_territoire][territoire]
-        base_pop = base_config["population"]
-        
-        # Données basées sur les caractéristiques du territoire
-        if territoire == "Mayotte":
-            budget_growth = [32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8, 72.8, 78.2, 84.0, 90.3]
-            projects_growth = [28, 32, 36, 40, 44, 48, 52, 56, 60, 65, 70, 76, 82, 88]
-        elif territoire == "Guadeloupe":
-            budget_growth = [52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5, 137.0, 150.7, 165.8, 182.4]
-            projects_growth = [42, 47, 53, 59, 66, 74, 83, 92, 102, 113, 125, 138, 152, 167]
-        elif territoire == "La Réunion":
-            budget_growth = [68.2, 74.1, 80.5, 87.4, 94.9, 103.0, 111.8, 121.4, 131.8, 143.2, 155.6, 169.1, 183.8, 199.8]
-            projects_growth = [55, 61, 68, 75, 83, 92, 102, 113, 125, 138, 152, 168, 185, 204]
-        else:
-            # Croissance générique
-            base_budget = base_pop * 0.001
-            budget_growth = [base_budget * (1 + 0.08 * i) for i in range(len(years))]
-            projects_growth = [int(base_budget * 0.8 * (1 + 0.08 * i)) for i in range(len(years))]
-        
-        data = {
-            'Année': years,
-            'Territoire': [territoire] * len(years),
-            'Type_Territoire': [type_territoire] * len(years),
-            'Budget_Total': budget_growth,
-            'Contribution_UE': [budget * 0.75 for budget in budget_growth],
-            'Cofinancement_Local': [budget * 0.25 for budget in budget_growth],
-            'Projets_Finances': projects_growth,
-            'Emplois_Crees': [projects * 3 for projects in projects_growth],
-            'PME_Soutenues': [int(projects * 0.6) for projects in projects_growth],
-            'Population': [base_pop * (1 + 0.012 * i) for i in range(len(years))],
-            'PIB_Par_Habitant': [base_config["pib_habitant"] * (1 + 0.018 * i) for i in range(len(years))]
-        }
-        
-        return pd.DataFrame(data)
-    
-    def generate_advanced_program_data(self, program_id):
-        """Génère des données avancées pour l'analyse"""
-        program = self.specific_programs.get(program_id) or self.drom_com_programs.get(program_id)
-        
-        if not program:
-            return None
-        
-        # Déterminer la période
-        if program_id.startswith("2014"):
-            years = list(range(2014, 2024))
-            base_year = 2014
-        else:
-            years = list(range(2021, 2028))
-            base_year = 2021
-        
-        # Génération de données avec plus de variables
-        np.random.seed(hash(program_id) % 1000)
-        
-        data = {
-            'Année': years,
-            'Programme': [program['name']] * len(years),
-            'Territoire': [program['territory']] * len(years),
-            'Budget_Total': np.linspace(program['total_budget'] * 0.05, program['total_budget'] * 0.95, len(years)),
-            'Contribution_UE': None,
-            'Cofinancement_Local': None,
-            'Projets_Finances': None,
-            'Emplois_Crees': None,
-            'PME_Soutenues': None,
-            'Beneficiaires_Directs': None,
-            'Indicateur_Performance': None,
-            'Taux_Realisation': None,
-            'Impact_Environnemental': None,
-            'Innovation_Index': None,
-            'Inclusion_Sociale': None,
-            'Developpement_Durable': None
-        }
-        
-        # Calcul des valeurs dérivées
-        data['Contribution_UE'] = [b * 0.75 for b in data['Budget_Total']]
-        data['Cofinancement_Local'] = [b * 0.25 for b in data['Budget_Total']]
-        
-        # Projets et emplois avec variations
-        base_projects = program['total_budget'] / 5
-        data['Projets_Finances'] = [int(base_projects * (0.3 + 0.07 * i)) for i in range(len(years))]
-        data['Emplois_Crees'] = [int(p * (3.5 + np.random.normal(0, 0.3))) for p in data['Projets_Finances']]
-        data['PME_Soutenues'] = [int(p * 0.65) for p in data['Projets_Finances']]
-        data['Beneficiaires_Directs'] = [int(e * 2.8) for e in data['Emplois_Crees']]
-        
-        # Indicateurs de performance
-        if 'indicateurs_performance' in program:
-            perf = program['indicateurs_performance']
-            if 'taux_absorption' in perf:
-                base_taux = perf['taux_absorption']
-            else:
-                base_taux = perf.get('taux_absorption_prevu', 0.85)
-        else:
-            base_taux = 0.85
-        
-        data['Taux_Realisation'] = np.linspace(base_taux * 0.3, base_taux, len(years))
-        data['Indicateur_Performance'] = np.linspace(0.4, 0.9, len(years))
-        
-        # Indicateurs thématiques
-        data['Impact_Environnemental'] = np.random.uniform(0.6, 0.9, len(years))
-        data['Innovation_Index'] = np.random.uniform(0.5, 0.85, len(years))
-        data['Inclusion_Sociale'] = np.random.uniform(0.7, 0.95, len(years))
-        data['Developpement_Durable'] = np.random.uniform(0.65, 0.9, len(years))
-        
-        return pd.DataFrame(data)
-    
-    def calculate_roi_analysis(self, df):
-        """Calcule l'analyse du retour sur investissement"""
-        if df is None or df.empty:
-            return None
-        
-        # Calcul du ROI sur différentes dimensions
-        roi_data = {
-            'Année': df['Année'],
-            'ROI_Emploi': (df['Emplois_Crees'] * 35000) / df['Budget_Total'],  # Valeur économique par emploi
-            'ROI_PME': (df['PME_Soutenues'] * 50000) / df['Budget_Total'],  # Valeur par PME
-            'ROI_Social': (df['Beneficiaires_Directs'] * 5000) / df['Budget_Total'],  # Valeur sociale
-            'ROI_Total': None
-        }
-        
-        # ROI total pondéré
-        roi_data['ROI_Total'] = (
-            roi_data['ROI_Emploi'] * 0.4 +
-            roi_data['ROI_PME'] * 0.3 +
-            roi_data['ROI_Social'] * 0.3
-        )
-        
-        return pd.DataFrame(roi_data)
-    
-    def perform_risk_analysis(self, program_id):
-        """Effectue une analyse de risques avancée"""
-        program = self.specific_programs.get(program_id) or self.drom_com_programs.get(program_id)
-        
-        if not program:
-            return None
-        
-        # Facteurs de risque
-        risk_factors = {
-            'Risque Budgétaire': np.random.uniform(0.2, 0.4),
-            'Risque Opérationnel': np.random.uniform(0.15, 0.35),
-            'Risque Environnemental': np.random.uniform(0.1, 0.3),
-            'Risque Social': np.random.uniform(0.2, 0.4),
-            'Risque Politique': np.random.uniform(0.1, 0.25),
-            'Risque Exécution': np.random.uniform(0.15, 0.3)
-        }
-        
-        # Calcul du score de risque global
-        risk_score = sum(risk_factors.values()) / len(risk_factors)
-        
-        # Catégorisation du risque
-        if risk_score < 0.2:
-            risk_level = "Faible"
-            risk_class = "risk-low"
-        elif risk_score < 0.3:
-            risk_level = "Moyen"
-            risk_class = "risk-medium"
-        else:
-            risk_level = "Élevé"
-            risk_class = "risk-high"
-        
-        # Mesures d'atténuation
-        mitigation_measures = {
-            'Risque Budgétaire': ["Contrôle régulier", "Réserve de contingence", "Suivi des dépenses"],
-            'Risque Opérationnel': ["Plan de continuité", "Formation équipes", "Procédures qualité"],
-            'Risque Environnemental': ["Études d'impact", "Mesures compensatoires", "Monitoring environnemental"],
-            'Risque Social': ["Dialogue social", "Inclusion parties prenantes", "Communication transparente"],
-            'Risque Politique': ["Lobbying", "Alliances stratégiques", "Veille réglementaire"],
-            'Risque Exécution': ["Milestones clairs", "KPIs précis", "Audits réguliers"]
-        }
-        
-        return {
-            'risk_factors': risk_factors,
-            'risk_score': risk_score,
-            'risk_level': risk_level,
-            'risk_class': risk_class,
-            'mitigation_measures': mitigation_measures
-        }
-    
-    def create_predictive_analysis(self, df):
-        """Crée une analyse prédictive avec régression linéaire"""
-        if df is None or df.empty or len(df) < 3:
-            return None, None
-        
-        # Préparation des données
-        X = df[['Année']].values.reshape(-1, 1)
-        y_budget = df['Budget_Total'].values
-        y_emplois = df['Emplois_Crees'].values
-        
-        # Modèles de prédiction
-        model_budget = LinearRegression()
-        model_emplois = LinearRegression()
-        
-        model_budget.fit(X, y_budget)
-        model_emplois.fit(X, y_emplois)
-        
-        # Prédictions pour les 3 prochaines années
-        future_years = np.array([[df['Année'].iloc[-1] + i] for i in range(1, 4)])
-        
-        pred_budget = model_budget.predict(future_years)
-        pred_emplois = model_emplois.predict(future_years)
-        
-        # Calcul des intervalles de confiance
-        budget_std = np.std(y_budget)
-        emplois_std = np.std(y_emplois)
-        
-        predictions = {
-            'Années': future_years.flatten(),
-            'Budget_Predit': pred_budget,
-            'Budget_Borne_Basse': pred_budget - 1.96 * budget_std,
-            'Budget_Borne_Haute': pred_budget + 1.96 * budget_std,
-            'Emplois_Predits': pred_emplois,
-            'Emplois_Borne_Basse': pred_emplois - 1.96 * emplois_std,
-            'Emplois_Borne_Haute': pred_emplois + 1.96 * emplois_std
-        }
-        
-        # Métriques du modèle
-        budget_r2 = model_budget.score(X, y_budget)
-        emplois_r2 = model_emplois.score(X, y_emplois)
-        
-        model_metrics = {
-            'budget_r2': budget_r2,
-            'emplois_r2': emplois_r2,
-            'budget_trend': 'Croissant' if model_budget.coef_[0] > 0 else 'Décroissant',
-            'emplois_trend': 'Croissant' if model_emplois.coef_[0] > 0 else 'Décroissant'
-        }
-        
-        return pd.DataFrame(predictions), model_metrics
-    
-    def create_cluster_analysis(self):
-        """Effectue une analyse de clustering des territoires"""
-        # Préparation des données pour clustering
-        territories_data = []
-        
-        for type_territoire, territoires in self.territoires.items():
-            for territoire, data in territoires.items():
-                territories_data.append({
-                    'Territoire': territoire,
-                    'Type': type_territoire,
-                    'Population': data['population'],
-                    'PIB_Habitant': data['pib_habitant'],
-                    'Taux_Chomage': data['taux_chomage'],
-                    'IDH': data['indice_developpement']
-                })
-        
-        df_territoires = pd.DataFrame(territories_data)
-        
-        # Normalisation des données
-        scaler = StandardScaler()
-        features = ['Population', 'PIB_Habitant', 'Taux_Chomage', 'IDH']
-        X_scaled = scaler.fit_transform(df_territoires[features])
-        
-        # Clustering K-means
-        kmeans = KMeans(n_clusters=3, random_state=42)
-        df_territoires['Cluster'] = kmeans.fit_predict(X_scaled)
-        
-        # Analyse des clusters
-        cluster_analysis = df_territoires.groupby('Cluster').agg({
-            'Population': 'mean',
-            'PIB_Habitant': 'mean',
-            'Taux_Chomage': 'mean',
-            'IDH': 'mean',
-            'Territoire': 'count'
-        }).rename(columns={'Territoire': 'Nombre_Territoires'})
-        
-        # Description des clusters
-        cluster_descriptions = {
-            0: "Territoires développés - Fort PIB, faible chômage",
-            1: "Territoires en transition - PIB moyen, chômage modéré",
-            2: "Territoires en développement - PIB faible, chômage élevé"
-        }
-        
-        return df_territoires, cluster_analysis, cluster_descriptions
-    
-    def display_header(self):
-        """Affiche l'en-tête du dashboard"""
-        st.markdown('<h1 class="main-header">🇪🇺 DASHBOARD FEDER EUROPE - ANALYSES COMPLÈTES</h1>', unsafe_allow_html=True)
-        st.markdown("""
-        <div style='text-align: center; background: linear-gradient(45deg, #003399, #0055A4); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 2rem;'>
-            <h3>Fonds Européen de Développement Régional - Analyses de Base et Avancées</h3>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    def display_program_cards(self):
-        """Affiche les cartes des programmes spécifiques"""
-        st.markdown('<h3 class="section-header">🎯 PROGRAMMES FEDER SPÉCIFIQUES</h3>', unsafe_allow_html=True)
-        
-        # Afficher les programmes 2014-2020
-        cols = st.columns(3)
-        
-        for i, (program_id, program_info) in enumerate(self.specific_programs.items()):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="program-card">
-                    <h4>📋 {program_info['territory']}</h4>
-                    <p><strong>{program_info['name']}</strong></p>
-                    <p>Budget total: <strong>{program_info['total_budget']} M€</strong></p>
-                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
-                    <p>Thèmes: {', '.join(program_info['themes'])}</p>
-                    <div style="margin-top: 1rem;">
-                        <a href="{program_info['url']}" target="_blank" style="color: white; text-decoration: underline;">
-                            🔗 Voir sur le portail UE
-                        </a>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Afficher les programmes 2021-2027 pour DROM COM
-        st.markdown('<h3 class="section-header">🆕 PROGRAMMES FEDER 2021-2027 - DROM COM</h3>', unsafe_allow_html=True)
-        
-        cols = st.columns(2)
-        
-        for i, (program_id, program_info) in enumerate(self.drom_com_programs.items()):
-            with cols[i]:
-                st.markdown(f"""
-                <div class="new-program">
-                    <h4>📋 {program_info['territory']}</h4>
-                    <p><strong>{program_info['name']}</strong></p>
-                    <p>Budget total: <strong>{program_info['total_budget']} M€</strong></p>
-                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
-                    <p>Thèmes: {', '.join(program_info['themes'])}</p>
-                    <p>Territoires: {', '.join(program_info['territoires_cibles'])}</p>
-                    <div style="margin-top: 1rem;">
-                        <a href="{program_info['url']}" target="_blank" style="color: white; text-decoration: underline;">
-                            🔗 Voir sur le portail UE
-                        </a>
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def display_key_metrics(self, df, title="MÉTRIQUES CLÉS"):
-        """Affiche les métriques clés FEDER"""
-        st.markdown(f'<h3 class="section-header">📊 {title}</h3>', unsafe_allow_html=True)
-        
-        if df is not None:
-            total_budget = df['Budget_Total'].sum()
-            total_projects = df['Projets_Finances'].sum()
-            total_jobs = df['Emplois_Crees'].sum()
-            eu_contribution = df['Contribution_UE'].sum()
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>💰 Budget Total</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_budget:.1f} M€</div>
-                    <p>Période analysée</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>📋 Projets Financés</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_projects:.0f}</div>
-                    <p>Projets soutenus</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>👥 Emplois Créés</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{total_jobs:.0f}</div>
-                    <p>Emplois directs et indirects</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown(f"""
-                <div class="eu-card">
-                    <h4>🇪🇺 Contribution UE</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">{eu_contribution:.1f} M€</div>
-                    <p>{(eu_contribution/total_budget*100):.1f}% du total</p>
-                </div>
-                """, unsafe_allow_html=True)
-    
-    def create_comparison_charts(self):
-        """Crée des graphiques comparatifs entre les programmes"""
-        st.markdown('<h3 class="section-header">📈 COMPARAISON DES PROGRAMMES FEDER</h3>', unsafe_allow_html=True)
-        
-        all_data = []
-        for program_id in self.specific_programs.keys():
-            program_data = self.generate_program_data(program_id)
-            all_data.append(program_data)
-        
-        combined_data = pd.concat(all_data, ignore_index=True)
-        
-        # Graphique 1: Évolution des budgets
-        fig1 = px.line(
-            combined_data, 
-            x='Année', 
-            y='Budget_Total', 
-            color='Territoire',
-            title='Évolution des Budgets FEDER par Programme (M€)',
-            markers=True
-        )
-        fig1.update_layout(height=400)
-        st.plotly_chart(fig1, use_container_width=True)
-        
-        # Graphique 2: Comparaison des totaux
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            totals = combined_data.groupby('Territoire').agg({
-                'Budget_Total': 'sum',
-                'Contribution_UE': 'sum'
-            }).reset_index()
-            
-            fig2 = px.bar(
-                totals,
-                x='Territoire',
-                y=['Budget_Total', 'Contribution_UE'],
-                title='Budget Total et Contribution UE par Programme (M€)',
-                barmode='group'
-            )
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-        
-        with col2:
-            results = combined_data.groupby('Territoire').agg({
-                'Projets_Finances': 'sum',
-                'Emplois_Crees': 'sum'
-            }).reset_index()
-            
-            fig3 = px.bar(
-                results,
-                x='Territoire',
-                y=['Projets_Finances', 'Emplois_Crees'],
-                title='Projets Financés et Emplois Créés',
-                barmode='group'
-            )
-            fig3.update_layout(height=400)
-            st.plotly_chart(fig3, use_container_width=True)
-    
-    def create_program_details(self, program_id):
-        """Affiche les détails d'un programme spécifique"""
-        program_info = self.specific_programs[program_id]
-        program_data = self.generate_program_data(program_id)
-        
-        st.markdown(f'<h3 class="section-header">📋 DÉTAILS DU PROGRAMME - {program_info["territory"].upper()}</h3>', unsafe_allow_html=True)
-        
-        # Métriques du programme
-        self.display_key_metrics(program_data, f"MÉTRIQUES - {program_info['territory']}")
-        
-        # Graphiques spécifiques au programme
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_budget = px.area(
-                program_data, 
-                x='Année', 
-                y=['Budget_Total', 'Contribution_UE', 'Cofinancement_Local'],
-                title=f'Évolution des Financements - {program_info["territory"]}',
-                color_discrete_map={
-                    'Budget_Total': '#003399',
-                    'Contribution_UE': '#0055A4', 
-                    'Cofinancement_Local': '#FFCC00'
-                }
-            )
-            fig_budget.update_layout(height=400)
-            st.plotly_chart(fig_budget, use_container_width=True)
-        
-        with col2:
-            fig_results = go.Figure()
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Projets_Finances'],
-                name='Projets Financés', line=dict(color='#28a745')
-            ))
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Emplois_Crees'],
-                name='Emplois Créés', line=dict(color='#dc3545'),
-                yaxis='y2'
-            ))
-            
-            fig_results.update_layout(
-                title=f'Résultats - {program_info["territory"]}',
-                xaxis_title='Année',
-                yaxis_title='Nombre de Projets',
-                yaxis2=dict(title='Emplois Créés', overlaying='y', side='right'),
-                height=400
-            )
-            st.plotly_chart(fig_results, use_container_width=True)
-        
-        # Informations sur le programme
-        st.markdown("#### 📝 Informations du Programme")
-        col_info1, col_info2 = st.columns(2)
-        
-        with col_info1:
-            st.metric("Type de programme", program_info["type"])
-            st.metric("Période de programmation", "2014-2020")
-            st.metric("Taux de cofinancement UE", "75%")
-        
-        with col_info2:
-            st.metric("Thèmes principaux", ", ".join(program_info["themes"]))
-            st.metric("Lien vers le portail", f"[Voir le programme]({program_info['url']})")
-    
-    def create_drom_com_details(self, program_id):
-        """Affiche les détails d'un programme DROM COM 2021-2027"""
-        program_info = self.drom_com_programs[program_id]
-        program_data = self.generate_drom_com_data(program_id)
-        
-        st.markdown(f'<h3 class="section-header">📋 DÉTAILS DU PROGRAMME - {program_info["territory"].upper()} 2021-2027</h3>', unsafe_allow_html=True)
-        
-        # Métriques du programme
-        self.display_key_metrics(program_data, f"MÉTRIQUES - {program_info['territory']} 2021-2027")
-        
-        # Graphiques spécifiques au programme
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig_budget = px.area(
-                program_data, 
-                x='Année', 
-                y=['Budget_Total', 'Contribution_UE', 'Cofinancement_Local'],
-                title=f'Évolution des Financements - {program_info["territory"]} 2021-2027',
-                color_discrete_map={
-                    'Budget_Total': '#11998e',
-                    'Contribution_UE': '#38ef7d', 
-                    'Cofinancement_Local': '#FFCC00'
-                }
-            )
-            fig_budget.update_layout(height=400)
-            st.plotly_chart(fig_budget, use_container_width=True)
-        
-        with col2:
-            fig_results = go.Figure()
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Projets_Finances'],
-                name='Projets Financés', line=dict(color='#28a745')
-            ))
-            fig_results.add_trace(go.Scatter(
-                x=program_data['Année'], y=program_data['Emplois_Crees'],
-                name='Emplois Créés', line=dict(color='#dc3545'),
-                yaxis='y2'
-            ))
-            
-            fig_results.update_layout(
-                title=f'Résultats - {program_info["territory"]} 2021-2027',
-                xaxis_title='Année',
-                yaxis_title='Nombre de Projets',
-                yaxis2=dict(title='Emplois Créés', overlaying='y', side='right'),
-                height=400
-            )
-            st.plotly_chart(fig_results, use_container_width=True)
-        
-        # Informations sur le programme
-        st.markdown("#### 📝 Informations du Programme")
-        col_info1, col_info2 = st.columns(2)
-        
-        with col_info1:
-            st.metric("Type de programme", program_info["type"])
-            st.metric("Période de programmation", "2021-2027")
-            st.metric("Taux de cofinancement UE", "75%")
-        
-        with col_info2:
-            st.metric("Thèmes principaux", ", ".join(program_info["themes"]))
-            st.metric("Territoires cibles", ", ".join(program_info["territoires_cibles"]))
-            st.metric("Lien vers le portail", f"[Voir le programme]({program_info['url']})")
-        
-        # Tableau des territoires cibles
-        st.markdown("#### 🗺️ Répartition par Territoire Cible")
-        
-        if program_info["type"] == "DROM":
-            territoires_data = {
-                'Territoire': program_info["territoires_cibles"],
-                'Budget_Alloué': [250, 300, 280, 220, 200],  # Millions d'euros
-                'Projets_Prevus': [90, 105, 98, 77, 70],
-                'Objectifs_Emplois': [700, 800, 750, 580, 530]
-            }
-        else:  # COM
-            territoires_data = {
-                'Territoire': program_info["territoires_cibles"],
-                'Budget_Alloué': [70, 50, 80, 75, 75],  # Millions d'euros
-                'Projets_Prevus': [26, 18, 30, 28, 28],
-                'Objectifs_Emplois': [200, 140, 240, 225, 225]
-            }
-        
-        df_territoires = pd.DataFrame(territoires_data)
-        st.dataframe(df_territoires, use_container_width=True)
-        
-        # Graphique de répartition
-        fig_repartition = px.bar(
-            df_territoires,
-            x='Territoire',
-            y='Budget_Alloué',
-            title=f'Répartition du Budget par Territoire - {program_info["territory"]} (M€)',
-            color='Budget_Alloué',
-            color_continuous_scale='Viridis'
-        )
-        fig_repartition.update_layout(height=400)
-        st.plotly_chart(fig_repartition, use_container_width=True)
-    
-    def create_efficiency_analysis(self):
-        """Analyse l'efficacité des programmes"""
-        st.markdown('<h3 class="section-header">📊 ANALYSE D\'EFFICACITÉ</h3>', unsafe_allow_html=True)
-        
-        all_data = []
-        for program_id in self.specific_programs.keys():
-            program_data = self.generate_program_data(program_id)
-            all_data.append(program_data)
-        
-        combined_data = pd.concat(all_data, ignore_index=True)
-        
-        # Calcul des indicateurs d'efficacité
-        combined_data['Efficacite_Emploi'] = combined_data['Emplois_Crees'] / combined_data['Budget_Total']
-        combined_data['Efficacite_Projet'] = combined_data['Projets_Finances'] / combined_data['Budget_Total']
-        combined_data['Cout_Emploi'] = combined_data['Budget_Total'] / combined_data['Emplois_Crees']
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Efficacité moyenne par programme
-            efficacite_moyenne = combined_data.groupby('Territoire').agg({
-                'Efficacite_Emploi': 'mean',
-                'Efficacite_Projet': 'mean'
-            }).reset_index()
-            
-            fig_eff = px.bar(
-                efficacite_moyenne,
-                x='Territoire',
-                y=['Efficacite_Emploi', 'Efficacite_Projet'],
-                title='Efficacité Moyenne des Programmes',
-                labels={'value': 'Valeur', 'variable': 'Indicateur'},
-                barmode='group'
-            )
-            fig_eff.update_layout(height=400)
-            st.plotly_chart(fig_eff, use_container_width=True)
-        
-        with col2:
-            # Coût par emploi créé
-            cout_emploi = combined_data.groupby('Territoire')['Cout_Emploi'].mean().reset_index()
-            
-            fig_cout = px.bar(
-                cout_emploi,
-                x='Territoire',
-                y='Cout_Emploi',
-                title='Coût Moyen par Emploi Créé (M€/emploi)',
-                color='Cout_Emploi',
-                color_continuous_scale='Viridis'
-            )
-            fig_cout.update_layout(height=400)
-            st.plotly_chart(fig_cout, use_container_width=True)
-    
-    def create_drom_com_comparison(self):
-        """Crée une comparaison entre les programmes DROM COM 2021-2027"""
-        st.markdown('<h3 class="section-header">📈 COMPARAISON DES PROGRAMMES DROM COM 2021-2027</h3>', unsafe_allow_html=True)
-        
-        all_data = []
-        for program_id in self.drom_com_programs.keys():
-            program_data = self.generate_drom_com_data(program_id)
-            all_data.append(program_data)
-        
-        combined_data = pd.concat(all_data, ignore_index=True)
-        
-        # Graphique 1: Évolution des budgets
-        fig1 = px.line(
-            combined_data, 
-            x='Année', 
-            y='Budget_Total', 
-            color='Territoire',
-            title='Évolution des Budgets FEDER par Programme DROM COM (M€)',
-            markers=True
-        )
-        fig1.update_layout(height=400)
-        st.plotly_chart(fig1, use_container_width=True)
-        
-        # Graphique 2: Comparaison des totaux
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            totals = combined_data.groupby('Territoire').agg({
-                'Budget_Total': 'sum',
-                'Contribution_UE': 'sum'
-            }).reset_index()
-            
-            fig2 = px.bar(
-                totals,
-                x='Territoire',
-                y=['Budget_Total', 'Contribution_UE'],
-                title='Budget Total et Contribution UE par Programme DROM COM (M€)',
-                barmode='group'
-            )
-            fig2.update_layout(height=400)
-            st.plotly_chart(fig2, use_container_width=True)
-        
-        with col2:
-            results = combined_data.groupby('Territoire').agg({
-                'Projets_Finances': 'sum',
-                'Emplois_Crees': 'sum'
-            }).reset_index()
-            
-            fig3 = px.bar(
-                results,
-                x='Territoire',
-                y=['Projets_Finances', 'Emplois_Crees'],
-                title='Projets Financés et Emplois Créés',
-                barmode='group'
-            )
-            fig3.update_layout(height=400)
-            st.plotly_chart(fig3, use_container_width=True)
-    
-    def create_risk_dashboard(self):
-        """Crée un dashboard de gestion des risques"""
-        st.markdown('<h3 class="section-header">⚠️ TABLEAU DE BORD DES RISQUES</h3>', unsafe_allow_html=True)
-        
-        # Sélection du programme pour l'analyse de risque
-        all_programs = {**self.specific_programs, **self.drom_com_programs}
-        selected_program = st.selectbox(
-            "Sélectionner un programme pour l'analyse des risques :",
-            list(all_programs.keys()),
-            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
-        )
-        
-        risk_analysis = self.perform_risk_analysis(selected_program)
-        
-        if risk_analysis:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Score de risque global
-                st.markdown(f"""
-                <div class="{risk_analysis['risk_class']}">
-                    <h4>Score de Risque Global</h4>
-                    <div style="font-size: 2rem; font-weight: bold;">
-                        {risk_analysis['risk_score']:.2f} - {risk_analysis['risk_level']}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Graphique des facteurs de risque
-                risk_df = pd.DataFrame(list(risk_analysis['risk_factors'].items()), 
-                                     columns=['Facteur', 'Score'])
-                
-                fig_risk = px.bar(
-                    risk_df,
-                    x='Facteur',
-                    y='Score',
-                    title='Facteurs de Risque par Catégorie',
-                    color='Score',
-                    color_continuous_scale='Reds'
-                )
-                fig_risk.update_layout(height=400)
-                st.plotly_chart(fig_risk, use_container_width=True)
-            
-            with col2:
-                # Mesures d'atténuation
-                st.markdown("#### 🛡️ Mesures d'Atténuation Recommandées")
-                
-                for factor, measures in risk_analysis['mitigation_measures'].items():
-                    with st.expander(f"📌 {factor}"):
-                        for measure in measures:
-                            st.markdown(f"- {measure}")
-    
-    def create_roi_dashboard(self):
-        """Crée un dashboard d'analyse du ROI"""
-        st.markdown('<h3 class="section-header">💰 ANALYSE DU RETOUR SUR INVESTISSEMENT</h3>', unsafe_allow_html=True)
-        
-        # Sélection du programme
-        all_programs = {**self.specific_programs, **self.drom_com_programs}
-        selected_program = st.selectbox(
-            "Sélectionner un programme pour l'analyse ROI :",
-            list(all_programs.keys()),
-            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
-        )
-        
-        df = self.generate_advanced_program_data(selected_program)
-        roi_data = self.calculate_roi_analysis(df)
-        
-        if roi_data is not None:
-            # Graphiques ROI
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig_roi = go.Figure()
-                
-                fig_roi.add_trace(go.Scatter(
-                    x=roi_data['Année'],
-                    y=roi_data['ROI_Emploi'],
-                    name='ROI Emploi',
-                    line=dict(color='blue')
-                ))
-                
-                fig_roi.add_trace(go.Scatter(
-                    x=roi_data['Année'],
-                    y=roi_data['ROI_PME'],
-                    name='ROI PME',
-                    line=dict(color='green')
-                ))
-                
-                fig_roi.add_trace(go.Scatter(
-                    x=roi_data['Année'],
-                    y=roi_data['ROI_Social'],
-                    name='ROI Social',
-                    line=dict(color='orange')
-                ))
-                
-                fig_roi.update_layout(
-                    title='Évolution des ROI par Dimension',
-                    xaxis_title='Année',
-                    yaxis_title='Ratio ROI',
-                    height=400
-                )
-                
-                st.plotly_chart(fig_roi, use_container_width=True)
-            
-            with col2:
-                fig_roi_total = px.area(
-                    roi_data,
-                    x='Année',
-                    y='ROI_Total',
-                    title='ROI Total Pondéré',
-                    color_discrete_sequence=['purple']
-                )
-                fig_roi_total.update_layout(height=400)
-                st.plotly_chart(fig_roi_total, use_container_width=True)
-            
-            # Tableau récapitulatif
-            st.markdown("#### 📊 Récapitulatif du ROI")
-            
-            roi_summary = {
-                'ROI Moyen Emploi': roi_data['ROI_Emploi'].mean(),
-                'ROI Moyen PME': roi_data['ROI_PME'].mean(),
-                'ROI Moyen Social': roi_data['ROI_Social'].mean(),
-                'ROI Total Moyen': roi_data['ROI_Total'].mean(),
-                'ROI Final': roi_data['ROI_Total'].iloc[-1]
-            }
-            
-            for metric, value in roi_summary.items():
-                st.metric(metric, f"{value:.2f}")
-    
-    def create_predictive_dashboard(self):
-        """Crée un dashboard de prédictions"""
-        st.markdown('<h3 class="section-header">🔮 ANALYSE PRÉDICTIVE</h3>', unsafe_allow_html=True)
-        
-        # Sélection du programme
-        all_programs = {**self.specific_programs, **self.drom_com_programs}
-        selected_program = st.selectbox(
-            "Sélectionner un programme pour l'analyse prédictive :",
-            list(all_programs.keys()),
-            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
-        )
-        
-        df = self.generate_advanced_program_data(selected_program)
-        predictions, metrics = self.create_predictive_analysis(df)
-        
-        if predictions is not None and metrics is not None:
-            # Métriques du modèle
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("R² Budget", f"{metrics['budget_r2']:.3f}")
-            with col2:
-                st.metric("R² Emplois", f"{metrics['emplois_r2']:.3f}")
-            with col3:
-                st.metric("Tendance Budget", metrics['budget_trend'])
-            with col4:
-                st.metric("Tendance Emplois", metrics['emplois_trend'])
-            
-            # Graphiques prédictifs
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig_pred_budget = go.Figure()
-                
-                # Données historiques
-                fig_pred_budget.add_trace(go.Scatter(
-                    x=df['Année'],
-                    y=df['Budget_Total'],
-                    name='Budget Historique',
-                    line=dict(color='blue')
-                ))
-                
-                # Prédictions
-                fig_pred_budget.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Budget_Predit'],
-                    name='Budget Prédit',
-                    line=dict(color='red', dash='dash')
-                ))
-                
-                # Intervalles de confiance
-                fig_pred_budget.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Budget_Borne_Haute'],
-                    fill=None,
-                    mode='lines',
-                    line_color='rgba(255,0,0,0.2)',
-                    showlegend=False
-                ))
-                
-                fig_pred_budget.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Budget_Borne_Basse'],
-                    fill='tonexty',
-                    mode='lines',
-                    line_color='rgba(255,0,0,0.2)',
-                    name='Intervalle de confiance 95%'
-                ))
-                
-                fig_pred_budget.update_layout(
-                    title='Prédictions du Budget (M€)',
-                    xaxis_title='Année',
-                    yaxis_title='Budget (M€)',
-                    height=400
-                )
-                
-                st.plotly_chart(fig_pred_budget, use_container_width=True)
-            
-            with col2:
-                fig_pred_emplois = go.Figure()
-                
-                # Données historiques
-                fig_pred_emplois.add_trace(go.Scatter(
-                    x=df['Année'],
-                    y=df['Emplois_Crees'],
-                    name='Emplois Historique',
-                    line=dict(color='green')
-                ))
-                
-                # Prédictions
-                fig_pred_emplois.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Emplois_Predits'],
-                    name='Emplois Prédits',
-                    line=dict(color='red', dash='dash')
-                ))
-                
-                # Intervalles de confiance
-                fig_pred_emplois.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Emplois_Borne_Haute'],
-                    fill=None,
-                    mode='lines',
-                    line_color='rgba(0,255,0,0.2)',
-                    showlegend=False
-                ))
-                
-                fig_pred_emplois.add_trace(go.Scatter(
-                    x=predictions['Années'],
-                    y=predictions['Emplois_Borne_Basse'],
-                    fill='tonexty',
-                    mode='lines',
-                    line_color='rgba(0,255,0,0.2)',
-                    name='Intervalle de confiance 95%'
-                ))
-                
-                fig_pred_emplois.update_layout(
-                    title='Prédictions des Emplois Créés',
-                    xaxis_title='Année',
-                    yaxis_title="Nombre d'Emplois",
-                    height=400
-                )
-                
-                st.plotly_chart(fig_pred_emplois, use_container_width=True)
-            
-            # Tableau des prédictions
-            st.markdown("#### 📋 Prédictions Détaillées")
-            
-            pred_table = pd.DataFrame({
-                'Année': predictions['Années'],
-                'Budget Prédit (M€)': predictions['Budget_Predit'].round(2),
-                'Budget Min (M€)': predictions['Budget_Borne_Basse'].round(2),
-                'Budget Max (M€)': predictions['Budget_Borne_Haute'].round(2),
-                'Emplois Prédits': predictions['Emplois_Predits'].round(0),
-                'Emplois Min': predictions['Emplois_Borne_Basse'].round(0),
-                'Emplois Max': predictions['Emplois_Borne_Haute'].round(0)
-            })
-            
-            st.dataframe(pred_table, use_container_width=True)
-    
-    def create_performance_dashboard(self):
-        """Crée un dashboard de performance avancé"""
-        st.markdown('<h3 class="section-header">🏆 TABLEAU DE BORD DE PERFORMANCE</h3>', unsafe_allow_html=True)
-        
-        # Sélection multiple des programmes pour comparaison
-        all_programs = {**self.specific_programs, **self.drom_com_programs}
-        selected_programs = st.multiselect(
-            "Sélectionner les programmes à comparer :",
-            list(all_programs.keys()),
-            default=list(all_programs.keys())[:3],
-            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
-        )
-        
-        if selected_programs:
-            # Collecte des données
-            all_data = []
-            for program_id in selected_programs:
-                df = self.generate_advanced_program_data(program_id)
-                if df is not None:
-                    all_data.append(df)
-            
-            if all_data:
-                combined_data = pd.concat(all_data, ignore_index=True)
-                
-                # Graphique radar de performance
-                fig_radar = go.Figure()
-                
-                for program_id in selected_programs:
-                    program_data = combined_data[combined_data['Programme'] == all_programs[program_id]['name']]
-                    if not program_data.empty:
-                        last_row = program_data.iloc[-1]
-                        
-                        fig_radar.add_trace(go.Scatterpolar(
-                            r=[
-                                last_row['Indicateur_Performance'],
-                                last_row['Impact_Environnemental'],
-                                last_row['Innovation_Index'],
-                                last_row['Inclusion_Sociale'],
-                                last_row['Developpement_Durable'],
-                                last_row['Taux_Realisation']
-                            ],
-                            theta=[
-                                'Performance Globale',
-                                'Impact Environnemental',
-                                'Innovation',
-                                'Inclusion Sociale',
-                                'Développement Durable',
-                                'Taux de Réalisation'
-                            ],
-                            fill='toself',
-                            name=all_programs[program_id]['territory']
-                        ))
-                
-                fig_radar.update_layout(
-                    polar=dict(
-                        radialaxis=dict(
-                            visible=True,
-                            range=[0, 1]
-                        )),
-                    title="Radar de Performance des Programmes",
-                    height=500
-                )
-                
-                st.plotly_chart(fig_radar, use_container_width=True)
-                
-                # Tableau de performance comparative
-                st.markdown("#### 📊 Performance Comparative")
-                
-                performance_data = []
-                for program_id in selected_programs:
-                    program_data = combined_data[combined_data['Programme'] == all_programs[program_id]['name']]
-                    if not program_data.empty:
-                        last_row = program_data.iloc[-1]
-                        performance_data.append({
-                            'Programme': all_programs[program_id]['territory'],
-                            'Performance Globale': last_row['Indicateur_Performance'],
-                            'Impact Environnemental': last_row['Impact_Environnemental'],
-                            'Innovation': last_row['Innovation_Index'],
-                            'Inclusion Sociale': last_row['Inclusion_Sociale'],
-                            'Développement Durable': last_row['Developpement_Durable'],
-                            'Taux de Réalisation': last_row['Taux_Realisation']
-                        })
-                
-                perf_df = pd.DataFrame(performance_data)
-                st.dataframe(perf_df.style.format({
-                    'Performance Globale': '{:.2%}',
-                    'Impact Environnemental': '{:.2%}',
-                    'Innovation': '{:.2%}',
-                    'Inclusion Sociale': '{:.2%}',
-                    'Développement Durable': '{:.2%}',
-                    'Taux de Réalisation': '{:.2%}'
-                }), use_container_width=True)
-    
-    def create_advanced_visualizations(self):
-        """Crée des visualisations avancées"""
-        st.markdown('<h3 class="section-header">📊 VISUALISATIONS AVANCÉES</h3>', unsafe_allow_html=True)
-        
-        # Analyse de clustering
-        st.markdown("#### 🎯 Segmentation des Territoires")
-        df_territoires, cluster_analysis, cluster_descriptions = self.create_cluster_analysis()
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Graphique des clusters
-            fig_cluster = px.scatter(
-                df_territoires,
-                x='PIB_Habitant',
-                y='Taux_Chomage',
-                color='Cluster',
-                size='Population',
-                hover_name='Territoire',
-                title='Segmentation des Territoires FEDER',
-                color_continuous_scale='Viridis'
-            )
-            fig_cluster.update_layout(height=400)
-            st.plotly_chart(fig_cluster, use_container_width=True)
-        
-        with col2:
-            # Tableau d'analyse des clusters
-            st.markdown("**Analyse des Clusters :**")
-            for cluster, desc in cluster_descriptions.items():
-                st.markdown(f"- **Cluster {cluster}**: {desc}")
-            
-            st.markdown("**Caractéristiques moyennes par cluster :**")
-            st.dataframe(cluster_analysis.style.format({
-                'Population': '{:.0f}',
-                'PIB_Habitant': '{:.0f} €',
-                'Taux_Chomage': '{:.1f}%',
-                'IDH': '{:.3f}'
-            }))
-    
-    def run(self):
-        """Exécute le dashboard principal"""
-        self.display_header()
-        self.test_api_connectivity()
-        self.display_program_cards()
-        
-        # Navigation principale
-        menu = st.sidebar.selectbox(
-            "Navigation",
-            [
-                "Vue d'Ensemble",
-                "Tableau de Bord Territorial",
-                "Programmes Spécifiques",
-                "Programmes DROM COM 2021-2027",
-                "Analyse Comparative",
-                "Efficacité des Programmes",
-                "Analyse de Performance",
-                "Analyse des Risques",
-                "Analyse du ROI",
-                "Analyse Prédictive",
-                "Visualisations Avancées",
-                "Benchmarking Territorial"
-            ]
-        )
-        
-        if menu == "Vue d'Ensemble":
-            st.markdown('<h3 class="section-header">📊 SYNTHÈSE DES PROGRAMMES FEDER</h3>', unsafe_allow_html=True)
-            
-            # Cartes des programmes
-            cols = st.columns(3)
-            for i, (program_id, program_info) in enumerate(list(self.specific_programs.items())[:3]):
-                with cols[i]:
-                    st.markdown(f"""
-                    <div class="program-card">
-                        <h4>📋 {program_info['territory']}</h4>
-                        <p><strong>{program_info['name']}</strong></p>
-                        <p>Budget: <strong>{program_info['total_budget']} M€</strong></p>
-                        <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
-                    </div>
-                    """, unsafe_allow_html=True)
-            
-            # Indicateurs clés
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown("""
-                <div class="eu-card">
-                    <h4>💰 Budget Total</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">2 050 M€</div>
-                    <p>Tous programmes confondus</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div class="eu-card">
-                    <h4>📋 Projets</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">1 250</div>
-                    <p>Projets financés</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                st.markdown("""
-                <div class="eu-card">
-                    <h4>👥 Emplois</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">4 500</div>
-                    <p>Emplois créés</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                st.markdown("""
-                <div class="eu-card">
-                    <h4>🇪🇺 UE</h4>
-                    <div style="font-size: 1.8rem; font-weight: bold;">75%</div>
-                    <p>Taux de cofinancement</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Insights clés
-            st.markdown('<h3 class="section-header">💡 INSIGHTS CLÉS</h3>', unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("""
-                <div class="insight-card">
-                    <h4>🎯 Performance Élevée</h4>
-                    <p>Les programmes FEDER affichent un taux de réalisation moyen de 85%, dépassant les objectifs initiaux.</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                st.markdown("""
-                <div class="insight-card">
-                    <h4>📈 Croissance Soutenue</h4>
-                    <p>Les investissements FEDER génèrent un retour économique estimé à 3.2x le montant investi.</p>
-                </div>
-                """, unsafe_allow_html=True)
-        
-        elif menu == "Tableau de Bord Territorial":
-            # Sélection du territoire
-            st.sidebar.markdown("## 🗺️ Sélection du Territoire")
-            
-            type_territoire = st.sidebar.selectbox(
-                "Type de Territoire:",
-                ["DROM", "COM"]
-            )
-            
-            territoire = st.sidebar.selectbox(
-                "Territoire:",
-                list(self.territoires[type_territoire].keys())
-            )
-            
-            # Génération des données
-            df = self.generate_territory_data(territoire, type_territoire)
-            
-            # Affichage des données
-            self.display_key_metrics(df, f"MÉTRIQUES - {territoire}")
-            
-            # Graphiques du territoire
-            st.markdown('<h3 class="section-header">📈 ÉVOLUTION DES INDICATEURS</h3>', unsafe_allow_html=True)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                fig_budget = px.line(
-                    df, 
-                    x='Année', 
-                    y=['Budget_Total', 'Contribution_UE'],
-                    title=f'Évolution des Financements - {territoire}',
-                    markers=True
-                )
-                fig_budget.update_layout(height=400)
-                st.plotly_chart(fig_budget, use_container_width=True)
-            
-            with col2:
-                fig_results = px.line(
-                    df,
-                    x='Année',
-                    y=['Projets_Finances', 'Emplois_Crees'],
-                    title=f'Résultats des Projets - {territoire}',
-                    markers=True
-                )
-                fig_results.update_layout(height=400)
-                st.plotly_chart(fig_results, use_container_width=True)
-                
-        elif menu == "Programmes Spécifiques":
-            st.sidebar.markdown("## 🎯 Sélection du Programme")
-            
-            selected_program = st.sidebar.selectbox(
-                "Programme:",
-                list(self.specific_programs.keys()),
-                format_func=lambda x: self.specific_programs[x]['territory']
-            )
-            
-            self.create_program_details(selected_program)
-            
-        elif menu == "Programmes DROM COM 2021-2027":
-            st.sidebar.markdown("## 🆕 Sélection du Programme DROM COM")
-            
-            selected_program = st.sidebar.selectbox(
-                "Programme:",
-                list(self.drom_com_programs.keys()),
-                format_func=lambda x: self.drom_com_programs[x]['territory']
-            )
-            
-            self.create_drom_com_details(selected_program)
-            
-            # Ajout d'une section de comparaison
-            st.markdown("---")
-            self.create_drom_com_comparison()
-            
-        elif menu == "Analyse Comparative":
-            self.create_comparison_charts()
-            
-        elif menu == "Efficacité des Programmes":
-            self.create_efficiency_analysis()
-            
-        elif menu == "Analyse de Performance":
-            self.create_performance_dashboard()
-            
-        elif menu == "Analyse des Risques":
-            self.create_risk_dashboard()
-            
-        elif menu == "Analyse du ROI":
-            self.create_roi_dashboard()
-            
-        elif menu == "Analyse Prédictive":
-            self.create_predictive_dashboard()
-            
-        elif menu == "Visualisations Avancées":
-            self.create_advanced_visualizations()
-            
-        elif menu == "Benchmarking Territorial":
-            st.markdown('<h3 class="section-header">🏆 BENCHMARKING TERRITORIAL</h3>', unsafe_allow_html=True)
-            
-            # Comparaison des territoires
-            df_territoires, cluster_analysis, cluster_descriptions = self.create_cluster_analysis()
-            
-            # Tableau comparatif
-            comparison_data = []
-            for type_territoire, territoires in self.territoires.items():
-                for territoire, data in territoires.items():
-                    comparison_data.append({
-                        'Territoire': territoire,
-                        'Type': type_territoire,
-                        'Population': f"{data['population']:,}",
-                        'PIB/Habitant': f"{data['pib_habitant']:,.0f} €",
-                        'Taux Chômage': f"{data['taux_chomage']:.1f}%",
-                        'IDH': f"{data['indice_developpement']:.3f}",
-                        'Secteurs Clés': ', '.join(data['secteurs_cles'][:2]),
-                        'Risque Principal': data['risques'][0]
-                    })
-            
-            df_comparison = pd.DataFrame(comparison_data)
-            st.dataframe(df_comparison, use_container_width=True)
-            
-            # Recommandations par territoire
-            st.markdown("#### 📋 Recommandations Stratégiques")
-            
-            selected_territoire = st.selectbox(
-                "Sélectionner un territoire pour les recommandations :",
-                list(self.territoires["DROM"].keys()) + list(self.territoires["COM"].keys())
-            )
-            
-            # Trouver les données du territoire
-            territoire_data = None
-            for type_territoire, territoires in self.territoires.items():
-                if selected_territoire in territoires:
-                    territoire_data = territoires[selected_territoire]
-                    break
-            
-            if territoire_data:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("**🎯 Opportunités :**")
-                    if territoire_data['taux_chomage'] > 20:
-                        st.markdown("- Fort potentiel de création d'emplois")
-                    if territoire_data['pib_habitant'] < 20000:
-                        st.markdown("- Besoin de développement économique")
-                    if territoire_data['indice_developpement'] < 0.8:
-                        st.markdown("- Marge de progression sociale")
-                
-                with col2:
-                    st.markdown("**⚠️ Défis :**")
-                    for risque in territoire_data['risques'][:3]:
-                        st.markdown(f"- {risque}")
-        
-        # Informations complémentaires
-        st.sidebar.markdown("---")
-        st.sidebar.markdown("""
-        **📊 À propos des données:**
-        - Période: 2014-2027
-        - Montants en millions d'euros
-        - Données basées sur les programmes réels
-        
-        **🔍 Programmes analysés:**
-        - Mayotte (FEDER-FSE-IEJ)
-        - Corse (FEDER-FSE-IEJ)
-        - Guadeloupe (FEDER-FSE)
-        - DROM (FEDER 2021-2027)
-        - COM (FEDER 2021-2027)
-        
-        **📈 Analyses avancées:**
-        - Analyse prédictive avec régression linéaire
-        - Clustering des territoires
-        - Analyse du ROI multi-dimensionnel
-        - Évaluation des risques
-        - Tableau de bord de performance
-        """)
+configure_page("Dashboard FEDER Europe - Analyses Complètes")
 
 # Lancement du dashboard
 if __name__ == "__main__":
-    dashboard = FEDERDashboard()
+    dashboard = get_data_service(FEDERDashboard)
     dashboard.run()
\ No newline at end of file
@@ -0,0 +1,225 @@
+"""Benchmark headless des trois dashboards (Streamlit AppTest, portail simulé en local)
+
+    python benchmarks/bench_dashboards.py --repeat 5 --output bench.json
+    python benchmarks/bench_dashboards.py --compare bench.json
+
+Chaque entrée est rejouée pour toutes ses pages (menu de navigation, ou scripts de
+page des entrées multipages) puis pour toutes les valeurs des autres listes
+déroulantes de la page. Les latences (ms) et le pic mémoire Python (tracemalloc)
+sont rapportés par page et par widget.
+"""
+import argparse
+import http.server
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APPS = ['Dashboard.py', 'Dash.py', 'Final.py']
+NAVIGATION_LABEL = "Navigation"
+# Entrées multipages (st.navigation) : répertoire de leurs scripts de page
+PAGE_DIRS = {'Final.py': 'final_pages'}
+
+
+class _StubPortalHandler(http.server.BaseHTTPRequestHandler):
+    """Répond 200 à toute requête, à la place de cohesiondata.ec.europa.eu"""
+
+    def do_GET(self):
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_portal():
+    """Démarre le portail simulé et y redirige la sonde de santé"""
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _StubPortalHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ['FEDER_PORTAL_URL'] = f"http://127.0.0.1:{server.server_port}/"
+    return server
+
+
+def timed_run(at, samples, peaks):
+    """Exécute un rerun en mesurant latence et pic mémoire"""
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    started = time.perf_counter()
+    at.run()
+    samples.append((time.perf_counter() - started) * 1000)
+    peaks.append(tracemalloc.get_traced_memory()[1])
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+
+def page_selectboxes(at):
+    """Libellés des listes déroulantes de la page, hors navigation"""
+    labels = [widget.label for widget in at.sidebar.selectbox if widget.label != NAVIGATION_LABEL]
+    labels += [widget.label for widget in at.main.selectbox]
+    return list(dict.fromkeys(labels))
+
+
+def find_selectbox(at, label):
+    for widget in list(at.sidebar.selectbox) + list(at.main.selectbox):
+        if widget.label == label:
+            return widget
+    return None
+
+
+def bench_app(app, repeat, timeout):
+    """Parcourt toutes les pages et listes déroulantes d'une entrée"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+
+    def measure(key, action):
+        samples, peaks = results.setdefault(key, ([], []))
+        action()
+        timed_run(at, samples, peaks)
+
+    at = AppTest.from_file(os.path.join(ROOT, app), default_timeout=timeout)
+    for _ in range(repeat):
+        measure((app, '(démarrage)', '', ''), lambda: None)
+
+    if app in PAGE_DIRS:
+        page_dir = os.path.join(ROOT, PAGE_DIRS[app])
+        pages = [f"{PAGE_DIRS[app]}/{name}" for name in sorted(os.listdir(page_dir)) if name.endswith('.py')]
+        select_page = lambda page_index: at.switch_page(pages[page_index])
+    else:
+        navigation = find_selectbox(at, NAVIGATION_LABEL)
+        pages = list(navigation.options) if navigation is not None else ['(page unique)']
+        select_page = None if navigation is None else (
+            lambda page_index: find_selectbox(at, NAVIGATION_LABEL).select_index(page_index)
+        )
+
+    for page_index, page in enumerate(pages):
+        for _ in range(repeat):
+            if select_page is not None:
+                measure((app, page, '', ''), lambda: select_page(page_index))
+            else:
+                measure((app, page, '', ''), lambda: None)
+
+        for label in page_selectboxes(at):
+            widget = find_selectbox(at, label)
+            for option_index, option in enumerate(widget.options):
+                for _ in range(repeat):
+                    measure(
+                        (app, page, label, option),
+                        lambda: find_selectbox(at, label).select_index(option_index)
+                    )
+
+    return results
+
+
+def summarize(results):
+    rows = []
+    for (app, page, widget, option), (samples, peaks) in results.items():
+        samples = np.asarray(samples)
+        rows.append({
+            'app': app,
+            'page': page,
+            'widget': widget,
+            'option': option,
+            'runs': int(len(samples)),
+            'p50_ms': float(np.percentile(samples, 50)),
+            'p90_ms': float(np.percentile(samples, 90)),
+            'p99_ms': float(np.percentile(samples, 99)),
+            'max_ms': float(samples.max()),
+            'peak_kib': float(max(peaks) / 1024)
+        })
+    return rows
+
+
+def current_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def page_rows(rows):
+    """Agrégat par page (latences des changements de page uniquement)"""
+    return {(row['app'], row['page']): row for row in rows if not row['widget']}
+
+
+def print_report(rows):
+    print(f"{'app':<14}{'page':<34}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'pic KiB':>10}")
+    for (app, page), row in page_rows(rows).items():
+        print(f"{app:<14}{page[:33]:<34}{row['p50_ms']:>9.1f}{row['p90_ms']:>9.1f}"
+              f"{row['p99_ms']:>9.1f}{row['peak_kib']:>10.0f}")
+
+
+def print_comparison(rows, baseline, threshold, memory_traced):
+    """Compare les p50 par page avec un rapport précédent et signale les régressions"""
+    previous = page_rows(baseline['results'])
+    print(f"\nComparaison avec {baseline.get('commit') or 'référence'} (seuil {threshold:.0%})")
+    if baseline.get('memory_traced', True) != memory_traced:
+        print("Attention : tracemalloc n'était pas dans le même état, les latences ne sont pas comparables")
+    regressions = 0
+    for key, row in page_rows(rows).items():
+        if key not in previous:
+            continue
+        before = previous[key]['p50_ms']
+        change = (row['p50_ms'] - before) / before if before else 0.0
+        flag = "  RÉGRESSION" if change > threshold else ""
+        regressions += bool(flag)
+        print(f"{key[0]:<14}{key[1][:33]:<34}{before:>9.1f} -> {row['p50_ms']:>9.1f} ms ({change:+.0%}){flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('apps', nargs='*', default=APPS, help="entrées à mesurer (défaut : les trois)")
+    parser.add_argument('--repeat', type=int, default=3, help="reruns mesurés par page et par option")
+    parser.add_argument('--timeout', type=float, default=120, help="délai maximal d'un rerun (s)")
+    parser.add_argument('--no-memory', action='store_true', help="désactive tracemalloc (latences moins bruitées)")
+    parser.add_argument('--output', help="fichier JSON où écrire les résultats")
+    parser.add_argument('--compare', help="rapport JSON précédent à comparer")
+    parser.add_argument('--threshold', type=float, default=0.2, help="hausse de p50 signalée comme régression")
+    args = parser.parse_args()
+
+    sys.path.insert(0, ROOT)
+    start_stub_portal()
+    if not args.no_memory:
+        tracemalloc.start()
+
+    results = {}
+    for app in args.apps:
+        results.update(bench_app(app, args.repeat, args.timeout))
+    rows = summarize(results)
+
+    report = {
+        'commit': current_commit(),
+        'python': platform.python_version(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'repeat': args.repeat,
+        'memory_traced': not args.no_memory,
+        'results': rows
+    }
+    print_report(rows)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as handle:
+            json.dump(report, handle, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as handle:
+            regressions = print_comparison(rows, json.load(handle), args.threshold, not args.no_memory)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Noyau partagé des dashboards FEDER (cache, services de données, analyses)"""
@@ -0,0 +1,33 @@
+"""Assemblage en une passe de plusieurs programmes dans un tableau long"""
+import numpy as np
+import pandas as pd
+
+from feder_core.schema import LABEL_COLUMNS, column_dtype
+
+
+def combine_long(column_sets, label_columns=LABEL_COLUMNS):
+    """Combine des dictionnaires de colonnes en un seul DataFrame pré-alloué"""
+    if not column_sets:
+        return pd.DataFrame()
+
+    lengths = np.array([len(columns['Année']) for columns in column_sets])
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    total = int(offsets[-1])
+
+    combined = {}
+    for name in column_sets[0]:
+        if name in label_columns:
+            # Un libellé scalaire par programme : codes répétés sur ses lignes
+            labels = [columns[name] for columns in column_sets]
+            categories = list(dict.fromkeys(labels))
+            codes = np.repeat([categories.index(label) for label in labels], lengths)
+            combined[name] = pd.Categorical.from_codes(codes, categories)
+        else:
+            # Type du schéma dès l'allocation : pas de passage par int64/float64
+            arrays = [np.asarray(columns[name]) for columns in column_sets]
+            values = np.empty(total, dtype=column_dtype(name) or np.result_type(*arrays))
+            for array, start, stop in zip(arrays, offsets[:-1], offsets[1:]):
+                values[start:stop] = array
+            combined[name] = values
+
+    return pd.DataFrame(combined)
@@ -0,0 +1,101 @@
+"""Cache mémoire des DataFrames générés, partagé entre les sessions Streamlit"""
+import threading
+
+
+class DataCache:
+    """Cache clé -> valeur avec compteurs de hits/misses et invalidation explicite"""
+
+    def __init__(self):
+        self._store = {}
+        self._versions = {}
+        self._sources = {}
+        self._builds = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, method, key, builder, source_version=None):
+        """Retourne la valeur mise en cache pour (method, key) ou la construit
+
+        source_version identifie l'état des données lues par builder (fichier réécrit, par
+        exemple) : une entrée construite sous une autre version est reconstruite.
+        """
+        cache_key = (method, key)
+        with self._lock:
+            if cache_key in self._store and self._sources[cache_key] == source_version:
+                self.hits += 1
+                return self._copy(self._store[cache_key])
+
+        # Construction hors verrou : les générateurs sont déterministes
+        value = builder()
+
+        with self._lock:
+            self.misses += 1
+            if cache_key not in self._store or self._sources[cache_key] != source_version:
+                self._builds += 1
+                self._store[cache_key] = value
+                self._versions[cache_key] = self._builds
+                self._sources[cache_key] = source_version
+        return self._copy(value)
+
+    def version(self, method, key):
+        """Numéro de construction de l'entrée (method, key), nouveau à chaque reconstruction ; None si absente"""
+        with self._lock:
+            return self._versions.get((method, key))
+
+    def invalidate(self, method=None, key=None):
+        """Invalide les entrées correspondant à method et/ou key (tout si aucun filtre)"""
+        with self._lock:
+            if method is None and key is None:
+                removed = len(self._store)
+                self._store.clear()
+                self._versions.clear()
+                self._sources.clear()
+                return removed
+
+            stale = [
+                cache_key for cache_key in self._store
+                if (method is None or cache_key[0] == method)
+                and (key is None or cache_key[1] == key)
+            ]
+            for cache_key in stale:
+                del self._store[cache_key]
+                del self._versions[cache_key]
+                del self._sources[cache_key]
+            return len(stale)
+
+    def entries(self):
+        """Instantané (méthode, clé, valeur) des entrées, sans copie des valeurs"""
+        with self._lock:
+            return [(method, key, value) for (method, key), value in self._store.items()]
+
+    def reset_stats(self):
+        """Remet les compteurs à zéro"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._store),
+                'hit_ratio': self.hits / total if total else 0.0
+            }
+
+    @staticmethod
+    def _copy(value):
+        # Les appelants ajoutent parfois des colonnes : on ne partage pas l'objet en cache
+        return value.copy() if hasattr(value, 'copy') else value
+
+
+# Les modules importés survivent aux reruns : ce singleton est commun à toutes les sessions
+_data_cache = DataCache()
+
+
+def get_data_cache():
+    """Retourne le cache de données du processus"""
+    return _data_cache
@@ -0,0 +1,417 @@
+"""Modèle de données, générateurs et analyses communs aux trois dashboards
+
+Aucune dépendance à Streamlit : les pages (Dashboard.py, Dash.py, Final.py) héritent
+de FEDERCore et n'ajoutent que leurs vues. Les dictionnaires de référence et les caches
+sont des objets de module, partagés par toutes les sessions du processus.
+"""
+import numpy as np
+import pandas as pd
+
+from feder_core.cache import get_data_cache
+from feder_core.correlation import get_correlation_engine
+from feder_core.figures import get_figure_cache
+from feder_core.forecasting import DEFAULT_HORIZON, get_batch_forecaster
+from feder_core.models import get_model_cache
+from feder_core.reference import TERRITOIRES, SPECIFIC_PROGRAMS, DROM_COM_PROGRAMS, PREDICTIVE_COLUMNS
+from feder_core.risk import classify_risk, get_risk_engine
+from feder_core.roi import DEFAULT_SWEEP_LEVELS, DEFAULT_SWEEP_SPAN, get_roi_engine, roi_analysis, roi_frame, sensitivity_sweep
+from feder_core.segmentation import load_or_fit_segmentation, territory_frame
+from feder_core.store import GeneratorSource, open_data_source, order_by_keys
+from feder_core.synthetic import advanced_program_columns
+from feder_core.timeseries import get_forecast_selector
+
+
+class FEDERCore:
+    """Données et analyses FEDER, sans affichage"""
+
+    def __init__(self):
+        # Références partagées, jamais recopiées par instance
+        self.territoires = TERRITOIRES
+        self.specific_programs = SPECIFIC_PROGRAMS
+        self.drom_com_programs = DROM_COM_PROGRAMS
+        self.data_cache = get_data_cache()
+        self.figure_cache = get_figure_cache()
+        self.generator_source = GeneratorSource(
+            {
+                'programmes': self._program_columns,
+                'drom_com': self._drom_com_columns,
+                'territoires': lambda key: self._territory_columns(*key),
+                'programmes_avances': self._advanced_program_columns
+            },
+            {
+                'programmes': lambda: self.specific_programs,
+                'drom_com': lambda: self.drom_com_programs,
+                'territoires': lambda: [(territoire, type_territoire)
+                                        for type_territoire, territoires in self.territoires.items()
+                                        for territoire in territoires],
+                'programmes_avances': lambda: [*self.specific_programs, *self.drom_com_programs]
+            }
+        )
+        self.data_source = open_data_source(self.generator_source)
+        self.warm_start_predictive_models()
+    
+    def generate_program_data(self, program_id):
+        """Retourne les données d'un programme FEDER (mises en cache)"""
+        return self.data_cache.get_or_build(
+            'generate_program_data', program_id,
+            lambda: self._read_single('programmes', program_id),
+            self.data_source.version('programmes')
+        )
+    
+    def _read_single(self, dataset, key):
+        """Lit les lignes d'une seule clé depuis la source de données"""
+        df = self.data_source.read(dataset, [key])
+        return None if df.empty else df
+    
+    def _program_columns(self, program_id):
+        """Génère des données réalistes pour un programme FEDER"""
+        program = self.specific_programs[program_id]
+        
+        years = np.arange(2014, 2024)
+        
+        if program_id == "2014FR05SFOP005":  # Mayotte
+            budget_data = np.array([32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8])
+            projects_data = np.array([28, 32, 36, 40, 44, 48, 52, 56, 60, 65])
+            jobs_data = np.array([85, 95, 110, 125, 140, 155, 170, 185, 200, 220])
+        elif program_id == "2014FR16RFOP007":  # Corse
+            budget_data = np.array([45.2, 49.8, 54.7, 59.9, 65.4, 71.2, 77.4, 83.9, 90.8, 98.1])
+            projects_data = np.array([38, 42, 47, 52, 58, 64, 71, 78, 86, 94])
+            jobs_data = np.array([120, 135, 150, 170, 190, 215, 240, 265, 295, 325])
+        elif program_id == "2014FR06RDRP004":  # Guadeloupe
+            budget_data = np.array([52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5])
+            projects_data = np.array([42, 47, 53, 59, 66, 74, 83, 92, 102, 113])
+            jobs_data = np.array([150, 170, 195, 220, 250, 285, 320, 360, 405, 455])
+        else:
+            # Données génériques
+            base_budget = program["total_budget"] / 10
+            growth = 1 + 0.08 * np.arange(len(years))
+            budget_data = base_budget * growth
+            projects_data = (base_budget * 0.8 * growth).astype(int)
+            jobs_data = (projects_data * 3.5).astype(int)
+        
+        # Colonnes dérivées calculées sur les tableaux, libellés diffusés par pandas
+        data = {
+            'Année': years,
+            'Programme': program['name'],
+            'Territoire': program['territory'],
+            'Budget_Total': budget_data,
+            'Contribution_UE': budget_data * 0.75,
+            'Cofinancement_Local': budget_data * 0.25,
+            'Projets_Finances': projects_data,
+            'Emplois_Crees': jobs_data,
+            'PME_Soutenues': (projects_data * 0.65).astype(int),
+            'Taux_Realisation': np.array([0.65, 0.72, 0.78, 0.83, 0.87, 0.90, 0.92, 0.94, 0.96, 0.98])
+        }
+        
+        return data
+    
+    def generate_drom_com_data(self, program_id):
+        """Retourne les données d'un programme DROM COM (mises en cache)"""
+        return self.data_cache.get_or_build(
+            'generate_drom_com_data', program_id,
+            lambda: self._read_single('drom_com', program_id),
+            self.data_source.version('drom_com')
+        )
+    
+    def _drom_com_columns(self, program_id):
+        """Génère des données pour les programmes DROM COM 2021-2027"""
+        program = self.drom_com_programs[program_id]
+        
+        years = np.arange(2021, 2028)
+        
+        if program_id == "2021FR16TCPO001":  # DROM
+            budget_data = np.array([120, 135, 150, 165, 180, 195, 205])
+            projects_data = np.array([45, 52, 60, 68, 75, 82, 88])
+            jobs_data = np.array([350, 400, 460, 520, 580, 640, 700])
+        elif program_id == "2021FR16TCPO002":  # COM
+            budget_data = np.array([35, 40, 45, 50, 55, 60, 65])
+            projects_data = np.array([15, 18, 22, 26, 30, 34, 38])
+            jobs_data = np.array([120, 140, 165, 190, 215, 240, 265])
+        else:
+            # Données génériques
+            base_budget = program["total_budget"] / 7
+            growth = 1 + 0.05 * np.arange(len(years))
+            budget_data = base_budget * growth
+            projects_data = (base_budget * 0.4 * growth).astype(int)
+            jobs_data = projects_data * 4
+        
+        data = {
+            'Année': years,
+            'Programme': program['name'],
+            'Territoire': program['territory'],
+            'Budget_Total': budget_data,
+            'Contribution_UE': budget_data * 0.75,
+            'Cofinancement_Local': budget_data * 0.25,
+            'Projets_Finances': projects_data,
+            'Emplois_Crees': jobs_data,
+            'PME_Soutenues': (projects_data * 0.7).astype(int),
+            'Taux_Realisation': np.array([0.15, 0.25, 0.40, 0.55, 0.70, 0.85, 1.0])
+        }
+        
+        return data
+    
+    def generate_territory_data(self, territoire: str, type_territoire: str):
+        """Retourne les données d'un territoire (mises en cache)"""
+        return self.data_cache.get_or_build(
+            'generate_territory_data', (territoire, type_territoire),
+            lambda: self._read_single('territoires', (territoire, type_territoire)),
+            self.data_source.version('territoires')
+        )
+    
+    def _territory_columns(self, territoire: str, type_territoire: str):
+        """Génère des données pour un territoire donné"""
+        years = np.arange(2014, 2028)
+        steps = np.arange(len(years))
+        base_config = self.territoires[type_territoire][territoire]
+        base_pop = base_config["population"]
+        
+        # Données basées sur les caractéristiques du territoire
+        if territoire == "Mayotte":
+            budget_growth = np.array([32.5, 35.8, 39.2, 42.7, 46.3, 50.1, 54.2, 58.5, 63.1, 67.8, 72.8, 78.2, 84.0, 90.3])
+            projects_growth = np.array([28, 32, 36, 40, 44, 48, 52, 56, 60, 65, 70, 76, 82, 88])
+        elif territoire == "Guadeloupe":
+            budget_growth = np.array([52.8, 58.1, 63.9, 70.3, 77.3, 85.0, 93.5, 102.9, 113.2, 124.5, 137.0, 150.7, 165.8, 182.4])
+            projects_growth = np.array([42, 47, 53, 59, 66, 74, 83, 92, 102, 113, 125, 138, 152, 167])
+        elif territoire == "La Réunion":
+            budget_growth = np.array([68.2, 74.1, 80.5, 87.4, 94.9, 103.0, 111.8, 121.4, 131.8, 143.2, 155.6, 169.1, 183.8, 199.8])
+            projects_growth = np.array([55, 61, 68, 75, 83, 92, 102, 113, 125, 138, 152, 168, 185, 204])
+        else:
+            # Croissance générique
+            base_budget = base_pop * 0.001
+            budget_growth = base_budget * (1 + 0.08 * steps)
+            projects_growth = (base_budget * 0.8 * (1 + 0.08 * steps)).astype(int)
+        
+        data = {
+            'Année': years,
+            'Territoire': territoire,
+            'Type_Territoire': type_territoire,
+            'Budget_Total': budget_growth,
+            'Contribution_UE': budget_growth * 0.75,
+            'Cofinancement_Local': budget_growth * 0.25,
+            'Projets_Finances': projects_growth,
+            'Emplois_Crees': projects_growth * 3,
+            'PME_Soutenues': (projects_growth * 0.6).astype(int),
+            'Population': base_pop * (1 + 0.012 * steps),
+            'PIB_Par_Habitant': base_config["pib_habitant"] * (1 + 0.018 * steps)
+        }
+        
+        return data
+    
+    def generate_advanced_program_data(self, program_id):
+        """Retourne les données avancées d'un programme (mises en cache)"""
+        return self.data_cache.get_or_build(
+            'generate_advanced_program_data', program_id,
+            lambda: self._read_single('programmes_avances', program_id),
+            self.data_source.version('programmes_avances')
+        )
+    
+    def _advanced_program_columns(self, program_id):
+        """Génère des données avancées pour l'analyse"""
+        program = self.specific_programs.get(program_id) or self.drom_com_programs.get(program_id)
+        
+        if not program:
+            return None
+        
+        return advanced_program_columns(program_id, program)
+    
+    def generate_programs_batch(self, program_ids, dataset='programmes', columns=None, use_cache=True):
+        """Retourne un tableau long unique pour plusieurs programmes (Programme/Territoire catégoriels)"""
+        program_ids = tuple(program_ids)
+        if not use_cache:
+            return self.data_source.read(dataset, program_ids, columns)
+        
+        # Clé triée : un seul calcul quel que soit l'ordre demandé, restitué ensuite
+        key = (dataset, tuple(sorted(program_ids)), None if columns is None else tuple(columns))
+        frame = self.data_cache.get_or_build(
+            'generate_programs_batch', key,
+            lambda: self.data_source.read(dataset, key[1], columns, with_keys=True),
+            self.data_source.version(dataset)
+        )
+        return order_by_keys(frame, program_ids)
+    
+    def calculate_roi_analysis(self, df, weights=None, unit_values=None):
+        """Calcule l'analyse du retour sur investissement d'un DataFrame quelconque"""
+        if df is None or df.empty:
+            return None
+        
+        return roi_analysis(df, weights, unit_values)
+    
+    def calculate_program_roi(self, program_id, weights=None, unit_values=None):
+        """ROI d'un programme à partir de ses données avancées, ratios conservés par le moteur ROI"""
+        ratios = self.program_roi_ratios(program_id)
+        if ratios is None:
+            return None
+        return roi_frame(*ratios, weights, unit_values)
+    
+    def program_roi_ratios(self, program_id):
+        """(années, ratios) des données avancées du programme, recalculés quand ces données sont reconstruites"""
+        df = self.generate_advanced_program_data(program_id)
+        if df is None or df.empty:
+            return None
+        version = self.data_cache.version('generate_advanced_program_data', program_id)
+        return get_roi_engine().ratios(program_id, version, df)
+    
+    def calculate_roi_sensitivity(self, levels=DEFAULT_SWEEP_LEVELS, span=DEFAULT_SWEEP_SPAN):
+        """Balaye pondérations et valeurs unitaires du ROI sur tous les programmes"""
+        program_ratios = {}
+        for program_id in {**self.specific_programs, **self.drom_com_programs}:
+            ratios = self.program_roi_ratios(program_id)
+            if ratios is not None:
+                program_ratios[program_id] = ratios[1]
+        return sensitivity_sweep(program_ratios, levels, span)
+    
+    def perform_risk_analysis(self, program_id):
+        """Effectue une analyse de risques avancée"""
+        program = self.specific_programs.get(program_id) or self.drom_com_programs.get(program_id)
+        
+        if not program:
+            return None
+        
+        # Distribution du score sur des scénarios corrélés, simulée une fois par programme
+        summary = get_risk_engine().summary(program_id)
+        risk_score = summary.quantiles[0.5]
+        risk_level, risk_class = classify_risk(risk_score)
+        
+        # Mesures d'atténuation
+        mitigation_measures = {
+            'Risque Budgétaire': ["Contrôle régulier", "Réserve de contingence", "Suivi des dépenses"],
+            'Risque Opérationnel': ["Plan de continuité", "Formation équipes", "Procédures qualité"],
+            'Risque Environnemental': ["Études d'impact", "Mesures compensatoires", "Monitoring environnemental"],
+            'Risque Social': ["Dialogue social", "Inclusion parties prenantes", "Communication transparente"],
+            'Risque Politique': ["Lobbying", "Alliances stratégiques", "Veille réglementaire"],
+            'Risque Exécution': ["Milestones clairs", "KPIs précis", "Audits réguliers"]
+        }
+        
+        return {
+            'risk_factors': summary.factor_means,
+            'risk_score': risk_score,
+            'risk_level': risk_level,
+            'risk_class': risk_class,
+            'mitigation_measures': mitigation_measures,
+            'score_mean': summary.score_mean,
+            'score_quantiles': summary.quantiles,
+            'factor_contributions': summary.contributions,
+            'level_probabilities': summary.level_probabilities,
+            'scenarios': summary.scenarios
+        }
+    
+    def warm_start_predictive_models(self):
+        """Pré-ajuste les modèles prédictifs de tous les programmes (une fois par processus)"""
+        model_cache = get_model_cache()
+        if model_cache.warmed:
+            return
+        
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        model_cache.warm_start(
+            ((program_id, self.generate_advanced_program_data(program_id)) for program_id in all_programs),
+            PREDICTIVE_COLUMNS
+        )
+    
+    def create_predictive_analysis(self, df, program_id=None):
+        """Crée une analyse prédictive avec régression linéaire"""
+        if df is None or df.empty or len(df) < 3:
+            return None, None
+        
+        # Préparation des données
+        program_id = program_id or df['Programme'].iloc[0]
+        years = df['Année'].values
+        y_budget = df['Budget_Total'].values
+        y_emplois = df['Emplois_Crees'].values
+        
+        # Prédictions pour les 3 prochaines années
+        future_years = df['Année'].iloc[-1] + np.arange(1, 4)
+        
+        # Modèles et intervalles de prédiction en forme close, servis ensemble depuis le cache
+        model_cache = get_model_cache()
+        model_budget, pred_budget, budget_low, budget_high = model_cache.get_or_forecast(
+            program_id, 'Budget_Total', years, y_budget, future_years
+        )
+        model_emplois, pred_emplois, emplois_low, emplois_high = model_cache.get_or_forecast(
+            program_id, 'Emplois_Crees', years, y_emplois, future_years
+        )
+        
+        predictions = {
+            'Années': future_years,
+            'Budget_Predit': pred_budget,
+            'Budget_Borne_Basse': budget_low,
+            'Budget_Borne_Haute': budget_high,
+            'Emplois_Predits': pred_emplois,
+            'Emplois_Borne_Basse': emplois_low,
+            'Emplois_Borne_Haute': emplois_high
+        }
+        
+        # Modèle retenu par backtest (sélection groupée de tous les programmes, en cache)
+        selections = self.select_forecast_models()
+        selection_budget = selections.get((program_id, 'Budget_Total'))
+        selection_emplois = selections.get((program_id, 'Emplois_Crees'))
+        if selection_budget is not None and selection_emplois is not None:
+            predictions['Budget_Modele_Retenu'] = selection_budget.prediction
+            predictions['Emplois_Modele_Retenu'] = selection_emplois.prediction
+        
+        # Métriques du modèle
+        model_metrics = {
+            'budget_r2': model_budget.r2,
+            'emplois_r2': model_emplois.r2,
+            'budget_trend': 'Croissant' if model_budget.slope > 0 else 'Décroissant',
+            'emplois_trend': 'Croissant' if model_emplois.slope > 0 else 'Décroissant'
+        }
+        if selection_budget is not None and selection_emplois is not None:
+            model_metrics.update({
+                'budget_model': selection_budget.model,
+                'budget_mape': selection_budget.errors[selection_budget.model],
+                'emplois_model': selection_emplois.model,
+                'emplois_mape': selection_emplois.errors[selection_emplois.model]
+            })
+        
+        return pd.DataFrame(predictions), model_metrics
+    
+    def select_forecast_models(self, horizon=DEFAULT_HORIZON):
+        """Choisit par backtest le modèle de chaque programme et indicateur prédictif"""
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        series = {}
+        for program_id in all_programs:
+            df = self.generate_advanced_program_data(program_id)
+            if df is None or len(df) < 3:
+                continue
+            for column in PREDICTIVE_COLUMNS:
+                series[(program_id, column)] = (df['Année'].values, df[column].values)
+        return get_forecast_selector().select_many(series, horizon)
+    
+    def create_batch_forecast(self, horizon=DEFAULT_HORIZON, columns=None):
+        """Prévisions groupées de tous les programmes et de tous les indicateurs numériques"""
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        frames = {program_id: self.generate_advanced_program_data(program_id) for program_id in all_programs}
+        return get_batch_forecaster().forecast(frames, columns, horizon)
+    
+    def create_cluster_analysis(self):
+        """Effectue une analyse de clustering des territoires"""
+        # Préparation des données pour clustering
+        df_territoires = territory_frame(self.territoires)
+        
+        # Scaler et K-means relus depuis l'artefact versionné (ajustés au premier besoin)
+        segmentation = load_or_fit_segmentation(self.territoires)
+        df_territoires['Cluster'] = segmentation.labels_for(df_territoires['Territoire'])
+        
+        # Analyse des clusters
+        cluster_analysis = df_territoires.groupby('Cluster').agg({
+            'Population': 'mean',
+            'PIB_Habitant': 'mean',
+            'Taux_Chomage': 'mean',
+            'IDH': 'mean',
+            'Territoire': 'count'
+        }).rename(columns={'Territoire': 'Nombre_Territoires'})
+        
+        # Description des clusters
+        cluster_descriptions = {
+            0: "Territoires développés - Fort PIB, faible chômage",
+            1: "Territoires en transition - PIB moyen, chômage modéré",
+            2: "Territoires en développement - PIB faible, chômage élevé"
+        }
+        
+        return df_territoires, cluster_analysis, cluster_descriptions
+    
+    def create_correlation_analysis(self):
+        """Corrélations (Pearson, Spearman, intervalles bootstrap) de chaque programme et de leur ensemble"""
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        frames = {program_id: self.generate_advanced_program_data(program_id) for program_id in all_programs}
+        return get_correlation_engine().analyze(frames)
@@ -0,0 +1,225 @@
+"""Matrices de corrélation de tous les programmes, avec intervalles bootstrap
+
+Les séries des programmes et leur ensemble (toutes les lignes réunies) sont empilées sur
+une grille commune avec un masque : les matrices de Pearson et de Spearman (rangs moyens
+en cas d'égalité) sont obtenues pour toutes en un seul calcul vectorisé. Comme avec
+DataFrame.corr, chaque paire d'indicateurs n'utilise que les lignes où les deux sont
+renseignés (valeurs manquantes en NaN). Les intervalles
+de confiance à 95 % sont estimés par bootstrap des lignes, une série par tâche dans un
+pool de processus quand le volume le justifie, avec une graine dérivée de la série. Le
+résultat est conservé par version des données.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from feder_core.models import data_version
+from feder_core.pool import default_workers, pool_map
+from feder_core.seeding import stable_seed
+
+POOLED_KEY = 'Ensemble'
+METHODS = ('pearson', 'spearman')
+DEFAULT_RESAMPLES = 500
+
+
+def stack_rows(frames, columns):
+    """Lignes des programmes puis de l'ensemble : valeurs (K, T, C) et masque (K, T)"""
+    blocks = [df[columns].to_numpy(dtype=np.float64) for df in frames.values()]
+    blocks.append(np.concatenate(blocks))
+    length = max(len(block) for block in blocks)
+
+    values = np.zeros((len(blocks), length, len(columns)))
+    mask = np.zeros((len(blocks), length), dtype=bool)
+    for i, block in enumerate(blocks):
+        values[i, :len(block)] = block
+        mask[i, :len(block)] = True
+    return values, mask
+
+
+def masked_pearson(values, valid):
+    """Corrélations de Pearson de chaque série sur les lignes complètes de chaque paire : (K, C, C)"""
+    weights = valid.astype(np.float64)
+    # Décalage par la première valeur renseignée de chaque colonne : limite les erreurs
+    # d'arrondi et laisse exactement nulle une colonne constante
+    first = np.take_along_axis(values, valid.argmax(axis=1)[:, None, :], axis=1)
+    shifted = np.where(valid, values - first, 0.0)
+
+    # Sommes par paire (i, j) sur les lignes où i et j sont renseignés : produits matriciels par série
+    weights_t = weights.transpose(0, 2, 1)
+    n = weights_t @ weights
+    sums = shifted.transpose(0, 2, 1) @ weights
+    squares = (shifted ** 2).transpose(0, 2, 1) @ weights
+    products = shifted.transpose(0, 2, 1) @ shifted
+    with np.errstate(divide='ignore', invalid='ignore'):
+        covariance = products - sums * sums.transpose(0, 2, 1) / n
+        variance = squares - sums ** 2 / n
+        # Variance résiduelle d'arrondi : paire dégénérée, comme une colonne constante
+        variance = np.where(variance > 1e-12 * squares, variance, np.nan)
+        correlation = covariance / np.sqrt(variance * variance.transpose(0, 2, 1))
+        # Bornage des dépassements d'arrondi (séries parfaitement liées)
+        return np.clip(correlation, -1.0, 1.0)
+
+
+def average_ranks(values, valid):
+    """Rangs moyens (égalités partagées) le long de l'axe 1 ; rang quelconque aux positions invalides"""
+    filled = np.moveaxis(np.where(valid, values, np.inf), 1, -1)
+    order = np.argsort(filled, axis=-1)
+    ordered = np.take_along_axis(filled, order, axis=-1)
+
+    # Bornes de chaque groupe d'égalités dans l'ordre trié : rang moyen = milieu du groupe
+    length = ordered.shape[-1]
+    positions = np.broadcast_to(np.arange(length), ordered.shape)
+    starts = np.ones(ordered.shape, dtype=bool)
+    starts[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    ends = np.ones(ordered.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    first = np.maximum.accumulate(np.where(starts, positions, 0), axis=-1)
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, positions, length - 1), -1), axis=-1), -1)
+
+    ranks = np.empty(ordered.shape)
+    np.put_along_axis(ranks, order, (first + last) / 2.0 + 1.0, axis=-1)
+    return np.moveaxis(ranks, -1, 1)
+
+
+def masked_spearman(values, valid):
+    """Corrélations de Spearman de chaque série sur les lignes complètes de chaque paire : (K, C, C)"""
+    # Lignes entièrement renseignées ou entièrement absentes : un seul classement par colonne
+    if np.all(valid.all(axis=2) | ~valid.any(axis=2)):
+        return masked_pearson(average_ranks(values, valid), valid)
+
+    # Valeurs manquantes dispersées : classement propre aux lignes communes de chaque paire
+    n_columns = values.shape[2]
+    result = np.empty(values.shape[:1] + (n_columns, n_columns))
+    for i in range(n_columns):
+        pair_valid = valid & valid[:, :, i:i + 1]
+        ranks = average_ranks(values, pair_valid)
+        ranks_i = average_ranks(np.broadcast_to(values[:, :, i:i + 1], values.shape), pair_valid)
+        result[:, i, :] = paired_pearson(ranks_i, ranks, pair_valid)
+    return result
+
+
+def paired_pearson(a, b, valid):
+    """Corrélation de a[..., j] avec b[..., j] le long de l'axe 1, sur les positions valides"""
+    weights = valid.astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        n = weights.sum(axis=1)
+        a = (a - (a * weights).sum(axis=1)[:, None] / n[:, None]) * weights
+        b = (b - (b * weights).sum(axis=1)[:, None] / n[:, None]) * weights
+        variance = (a ** 2).sum(axis=1) * (b ** 2).sum(axis=1)
+        correlation = (a * b).sum(axis=1) / np.sqrt(np.where(variance > 0, variance, np.nan))
+        return np.clip(correlation, -1.0, 1.0)
+
+
+def correlations(values, mask):
+    """Matrices de Pearson et de Spearman de toutes les séries (NaN : valeur manquante)"""
+    valid = mask[..., None] & ~np.isnan(values)
+    return {
+        'pearson': masked_pearson(values, valid),
+        'spearman': masked_spearman(values, valid)
+    }
+
+
+def bootstrap_intervals(rows, resamples, seed):
+    """Bornes à 95 % des corrélations d'une série par rééchantillonnage des lignes"""
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(rows), (resamples, len(rows)))
+    samples = rows[indices]
+    mask = np.ones(indices.shape, dtype=bool)
+
+    intervals = {}
+    with np.errstate(invalid='ignore'):
+        for method, matrices in correlations(samples, mask).items():
+            # Rééchantillons dégénérés (colonne constante) ignorés
+            intervals[method] = tuple(np.nanpercentile(matrices, [2.5, 97.5], axis=0))
+    return intervals
+
+
+class CorrelationResult:
+    """Matrices et intervalles de chaque programme et de l'ensemble"""
+
+    def __init__(self, keys, columns, matrices, intervals):
+        self.keys = list(keys)
+        self.columns = list(columns)
+        self.matrices = matrices
+        self.intervals = intervals
+
+    def matrix(self, key, method='pearson'):
+        """Matrice de corrélation d'un programme (ou de l'ensemble)"""
+        i = self.keys.index(key)
+        return pd.DataFrame(self.matrices[method][i], index=self.columns, columns=self.columns)
+
+    def pairs(self, key, method='pearson'):
+        """Paires d'indicateurs distinctes avec coefficient et intervalle, triées par force"""
+        i = self.keys.index(key)
+        lower, upper = self.intervals[key][method]
+        rows, cols = np.triu_indices(len(self.columns), k=1)
+        frame = pd.DataFrame({
+            'Indicateur_1': np.array(self.columns)[rows],
+            'Indicateur_2': np.array(self.columns)[cols],
+            'Correlation': self.matrices[method][i][rows, cols],
+            'IC_Bas': lower[rows, cols],
+            'IC_Haut': upper[rows, cols]
+        })
+        order = frame['Correlation'].abs().sort_values(ascending=False, na_position='last').index
+        return frame.loc[order].reset_index(drop=True)
+
+
+class CorrelationEngine:
+    """Corrélations par version des données et nombre de rééchantillons, calculées une fois"""
+
+    def __init__(self, resamples=DEFAULT_RESAMPLES, workers=None):
+        self.resamples = resamples
+        self.workers = workers or default_workers('FEDER_BOOTSTRAP_WORKERS')
+        self._results = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def analyze(self, frames, columns=None, resamples=None):
+        """Retourne les corrélations des programmes fournis (programme -> DataFrame) et de leur ensemble"""
+        frames = {program_id: df for program_id, df in frames.items() if df is not None and len(df) >= 3}
+        if not frames:
+            return None
+        columns = columns or list(next(iter(frames.values())).select_dtypes(include='number').columns)
+        resamples = resamples or self.resamples
+        values, mask = stack_rows(frames, columns)
+        keys = [*frames, POOLED_KEY]
+        cache_key = (tuple(keys), tuple(columns), resamples, data_version(values, mask))
+
+        with self._lock:
+            result = self._results.get(cache_key)
+            if result is not None:
+                self.hits += 1
+                return result
+
+        matrices = correlations(values, mask)
+        bootstrap = pool_map(
+            bootstrap_intervals,
+            ((values[i, mask[i]], resamples, stable_seed(f"bootstrap:{key}")) for i, key in enumerate(keys)),
+            self.workers,
+            work=resamples * int(mask.sum()) * len(columns) ** 2
+        )
+        result = CorrelationResult(keys, columns, matrices, dict(zip(keys, bootstrap)))
+        with self._lock:
+            self.misses += 1
+            self._results[cache_key] = result
+        return result
+
+    def invalidate(self):
+        """Supprime tous les résultats"""
+        with self._lock:
+            self._results.clear()
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._results)}
+
+
+_correlation_engine = CorrelationEngine()
+
+
+def get_correlation_engine():
+    """Retourne le moteur de corrélations du processus"""
+    return _correlation_engine
@@ -0,0 +1,111 @@
+"""Export en flux des tableaux du dashboard (CSV, Parquet, XLSX)
+
+Les lignes sont lues par tranches directement sur le DataFrame source : aucune copie
+complète ni mise en forme en mémoire. Le fichier produit est un fichier temporaire
+qui bascule sur disque au-delà de SPOOL_BYTES ; st.download_button n'acceptant pas ce
+type de fichier, son contenu est relu en octets au moment du téléchargement.
+"""
+import importlib.util
+import tempfile
+
+from feder_core.imports import lazy_import
+
+DEFAULT_CHUNK_ROWS = 50000
+SPOOL_BYTES = 8 * 1024 * 1024
+
+# Format -> (extension, type MIME)
+EXPORT_FORMATS = {
+    'csv': ('csv', 'text/csv'),
+    'parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'xlsx': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+}
+
+# Modules requis par format, importés uniquement à l'export
+_FORMAT_MODULES = {
+    'csv': None,
+    'parquet': 'pyarrow',
+    'xlsx': 'openpyxl'
+}
+
+
+def available_formats():
+    """Formats dont la dépendance est installée"""
+    return [
+        fmt for fmt, module_name in _FORMAT_MODULES.items()
+        if module_name is None or importlib.util.find_spec(module_name) is not None
+    ]
+
+
+def iter_chunks(frame, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Tranches successives du DataFrame (vues par position, sans copie intégrale)"""
+    for start in range(0, len(frame), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def write_csv(frame, handle, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """CSV UTF-8 avec BOM (lisible directement par Excel), écrit tranche par tranche"""
+    handle.write('\ufeff'.encode('utf-8'))
+    header = True
+    for chunk in iter_chunks(frame, chunk_rows):
+        handle.write(chunk.to_csv(index=False, header=header).encode('utf-8'))
+        header = False
+    if header:
+        handle.write(frame.iloc[:0].to_csv(index=False).encode('utf-8'))
+
+
+def write_parquet(frame, handle, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Parquet écrit par groupes de lignes, une tranche par groupe"""
+    pa = lazy_import('pyarrow')
+    pq = lazy_import('pyarrow.parquet')
+    schema = pa.Schema.from_pandas(frame, preserve_index=False)
+    with pq.ParquetWriter(handle, schema) as writer:
+        for chunk in iter_chunks(frame, chunk_rows):
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+
+def write_xlsx(frame, handle, chunk_rows=DEFAULT_CHUNK_ROWS, sheet_name='Export'):
+    """XLSX en mode écriture seule d'openpyxl (lignes écrites au fil de l'eau)"""
+    openpyxl = lazy_import('openpyxl')
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    sheet.append([str(column) for column in frame.columns])
+    for chunk in iter_chunks(frame, chunk_rows):
+        for row in chunk.itertuples(index=False, name=None):
+            sheet.append([_xlsx_value(value) for value in row])
+    workbook.save(handle)
+
+
+def _xlsx_value(value):
+    # openpyxl n'accepte ni les scalaires NumPy ni NaN
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+_WRITERS = {
+    'csv': write_csv,
+    'parquet': write_parquet,
+    'xlsx': write_xlsx
+}
+
+
+def export_frame(frame, fmt, handle=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Écrit le DataFrame au format demandé ; renvoie le fichier rembobiné"""
+    if fmt not in _WRITERS:
+        raise ValueError(f"Format d'export inconnu : {fmt}")
+    handle = handle or tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    _WRITERS[fmt](frame, handle, chunk_rows)
+    handle.seek(0)
+    return handle
+
+
+def export_bytes(frame, fmt, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Contenu du fichier exporté, tel qu'attendu par st.download_button"""
+    with export_frame(frame, fmt, chunk_rows=chunk_rows) as handle:
+        return handle.read()
+
+
+def export_file_name(name, fmt):
+    return f"{name}.{EXPORT_FORMATS[fmt][0]}"
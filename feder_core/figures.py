@@ -0,0 +1,87 @@
+"""Cache des figures Plotly construites sur des données de référence statiques"""
+import hashlib
+import threading
+import time
+
+import pandas as pd
+import plotly.io as pio
+
+
+def frame_version(df):
+    """Empreinte du contenu d'un DataFrame (valeurs, index et noms de colonnes)"""
+    digest = hashlib.sha1()
+    digest.update(repr(list(df.columns)).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Figures sérialisées en JSON par (identifiant de graphique, version des données)"""
+
+    def __init__(self):
+        self._figures = {}
+        self._timings = {}
+        self._lock = threading.Lock()
+
+    def get_or_build(self, chart_id, data_version, builder):
+        """Rejoue la figure en cache ou la construit et enregistre son temps de construction"""
+        key = (chart_id, data_version)
+        with self._lock:
+            figure_json = self._figures.get(key)
+
+        if figure_json is not None:
+            started = time.perf_counter()
+            figure = pio.from_json(figure_json)
+            self._record(chart_id, 'replay', time.perf_counter() - started)
+            return figure
+
+        started = time.perf_counter()
+        figure = builder()
+        self._record(chart_id, 'build', time.perf_counter() - started)
+
+        with self._lock:
+            self._figures[key] = figure.to_json()
+        return figure
+
+    def _record(self, chart_id, kind, seconds):
+        with self._lock:
+            timing = self._timings.setdefault(chart_id, {
+                'builds': 0, 'build_seconds': 0.0, 'replays': 0, 'replay_seconds': 0.0
+            })
+            timing[f'{kind}s'] += 1
+            timing[f'{kind}_seconds'] += seconds
+
+    def timings(self):
+        """Temps de construction et de rejeu par graphique, avec le temps économisé estimé"""
+        with self._lock:
+            rows = [(chart_id, dict(timing)) for chart_id, timing in self._timings.items()]
+
+        report = []
+        for chart_id, timing in rows:
+            mean_build = timing['build_seconds'] / timing['builds'] if timing['builds'] else 0.0
+            mean_replay = timing['replay_seconds'] / timing['replays'] if timing['replays'] else 0.0
+            report.append({
+                'chart_id': chart_id,
+                **timing,
+                'mean_build_seconds': mean_build,
+                'mean_replay_seconds': mean_replay,
+                'saved_seconds': timing['replays'] * (mean_build - mean_replay)
+            })
+        return sorted(report, key=lambda row: row['saved_seconds'], reverse=True)
+
+    def invalidate(self, chart_id=None):
+        """Supprime les figures d'un graphique (ou toutes)"""
+        with self._lock:
+            if chart_id is None:
+                self._figures.clear()
+            else:
+                for key in [k for k in self._figures if k[0] == chart_id]:
+                    del self._figures[key]
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache():
+    """Retourne le cache de figures du processus"""
+    return _figure_cache
@@ -0,0 +1,128 @@
+"""Application multipage de Final.py : navigation, en-tête commun et panneau de profilage
+
+La classe vit dans un module importé, et non dans le script ré-exécuté à chaque rerun :
+elle reste la même d'un rerun à l'autre et le service conservé en session est réutilisé.
+"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from feder_core.core import FEDERCore
+from feder_core.imports import import_report
+from feder_core.profiling import RenderProfiler, cache_stats_captions, instrument_methods
+from feder_core.schema import memory_summary
+from feder_core.views import DashboardViews
+
+# Une page par analyse : titre, script dans final_pages/, icône
+PAGES = [
+    ("Vue d'Ensemble", "final_pages/vue_ensemble.py", "📊"),
+    ("Tableau de Bord Territorial", "final_pages/territorial.py", "🗺️"),
+    ("Programmes Spécifiques", "final_pages/programmes.py", "🎯"),
+    ("Programmes DROM COM 2021-2027", "final_pages/drom_com.py", "🆕"),
+    ("Analyse Comparative", "final_pages/comparaison.py", "📈"),
+    ("Efficacité des Programmes", "final_pages/efficacite.py", "⚙️"),
+    ("Analyse de Performance", "final_pages/performance.py", "🏁"),
+    ("Analyse des Risques", "final_pages/risques.py", "⚠️"),
+    ("Analyse du ROI", "final_pages/roi.py", "💶"),
+    ("Analyse Prédictive", "final_pages/predictive.py", "🔮"),
+    ("Prévisions Tous Programmes", "final_pages/previsions.py", "📡"),
+    ("Visualisations Avancées", "final_pages/visualisations.py", "🔬"),
+    ("Benchmarking Territorial", "final_pages/benchmarking.py", "🏆")
+]
+
+
+@instrument_methods
+class FEDERDashboard(DashboardViews, FEDERCore):
+    HEADER_TITLE = "DASHBOARD FEDER EUROPE - ANALYSES COMPLÈTES"
+    HEADER_SUBTITLE = "Fonds Européen de Développement Régional - Analyses de Base et Avancées"
+    
+    def __init__(self):
+        self.profiler = RenderProfiler()
+        super().__init__()
+    
+    def run(self):
+        """Exécute le dashboard principal"""
+        # Le service vit dans la session : un profil neuf par rerun
+        self.profiler = RenderProfiler()
+        with self.profiler.section('run'):
+            self.render_page()
+        
+        self.render_profiling_panel()
+    
+    def render_profiling_panel(self):
+        """Panneau caché des temps de rendu (?profile=1 ou FEDER_PROFILE=1) et export JSON lines"""
+        log_path = os.environ.get('FEDER_PROFILE_LOG')
+        if log_path:
+            self.profiler.export_jsonl(log_path, app='Final.py')
+        
+        if st.query_params.get('profile') != '1' and os.environ.get('FEDER_PROFILE') != '1':
+            return
+        
+        with st.sidebar.expander("⏱️ Profilage du rendu"):
+            st.dataframe(self.profiler.summary().style.format({
+                'total_seconds': '{:.4f}',
+                'max_seconds': '{:.4f}'
+            }), use_container_width=True)
+            
+            cache_stats = self.data_cache.stats()
+            st.caption(
+                f"Cache de données : {cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                f"{cache_stats['entries']} entrées"
+            )
+            
+            # Moteurs déclarés par les pages visitées (final_pages/)
+            for caption in cache_stats_captions():
+                st.caption(caption)
+            
+            # Imports différés (sklearn, pyarrow...) réellement chargés par ce processus
+            lazy_imports = import_report()
+            if lazy_imports:
+                st.dataframe(pd.DataFrame(lazy_imports).style.format({'seconds': '{:.4f}'}), use_container_width=True)
+            
+            figure_timings = self.figure_cache.timings()
+            if figure_timings:
+                st.dataframe(pd.DataFrame(figure_timings), use_container_width=True)
+            
+            # Empreinte mémoire des séries en cache, typées et en types par défaut
+            frame_memory = [
+                {'method': method, 'key': str(key), **memory_summary(value)}
+                for method, key, value in self.data_cache.entries()
+                if isinstance(value, pd.DataFrame)
+            ]
+            if frame_memory:
+                st.dataframe(pd.DataFrame(frame_memory).style.format({'reduction': '{:.1f}x'}), use_container_width=True)
+    
+    def render_page(self):
+        """Affiche l'en-tête commun puis uniquement la page active"""
+        navigation = st.navigation([
+            st.Page(path, title=title, icon=icon, default=index == 0)
+            for index, (title, path, icon) in enumerate(PAGES)
+        ])
+        
+        self.display_header()
+        self.display_portal_status()
+        navigation.run()
+        
+        # Informations complémentaires
+        st.sidebar.markdown("---")
+        st.sidebar.markdown("""
+        **📊 À propos des données:**
+        - Période: 2014-2027
+        - Montants en millions d'euros
+        - Données basées sur les programmes réels
+        
+        **🔍 Programmes analysés:**
+        - Mayotte (FEDER-FSE-IEJ)
+        - Corse (FEDER-FSE-IEJ)
+        - Guadeloupe (FEDER-FSE)
+        - DROM (FEDER 2021-2027)
+        - COM (FEDER 2021-2027)
+        
+        **📈 Analyses avancées:**
+        - Analyse prédictive avec régression linéaire
+        - Clustering des territoires
+        - Analyse du ROI multi-dimensionnel
+        - Évaluation des risques
+        - Tableau de bord de performance
+        """)
@@ -0,0 +1,170 @@
+"""Prévisions linéaires groupées : tous les programmes et tous les indicateurs en un calcul
+
+Chaque série (programme, indicateur) est une régression y = a + b · (année - année moyenne).
+Les séries de longueurs différentes sont alignées sur une grille commune avec un masque ;
+les équations normales de toutes les séries sont empilées en un tableau (programmes,
+indicateurs, 2, 2) résolu par un seul appel à np.linalg.solve. Le résultat est conservé
+par version des données : les prévisions d'un programme deviennent une simple lecture.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from feder_core.models import data_version, t_quantile_975
+
+DEFAULT_HORIZON = 3
+
+# Colonnes non prévues : axe temporel
+EXCLUDED_COLUMNS = ('Année',)
+
+
+def forecast_columns(df):
+    """Indicateurs numériques d'un DataFrame de programme"""
+    return [column for column in df.select_dtypes(include='number').columns if column not in EXCLUDED_COLUMNS]
+
+
+def stack_series(frames, columns):
+    """Aligne les séries : années (P, T), valeurs (P, C, T) et masque (P, T)"""
+    length = max(len(df) for df in frames.values())
+    x = np.zeros((len(frames), length))
+    y = np.zeros((len(frames), len(columns), length))
+    mask = np.zeros((len(frames), length), dtype=bool)
+
+    for i, df in enumerate(frames.values()):
+        n = len(df)
+        x[i, :n] = df['Année'].to_numpy(dtype=np.float64)
+        y[i, :, :n] = df[columns].to_numpy(dtype=np.float64).T
+        mask[i, :n] = True
+    return x, y, mask
+
+
+class BatchForecast:
+    """Coefficients, qualité d'ajustement et prévisions de toutes les séries"""
+
+    def __init__(self, programs, columns, x, y, mask, horizon=DEFAULT_HORIZON):
+        self.programs = list(programs)
+        self.columns = list(columns)
+        self.horizon = horizon
+
+        weights = mask.astype(np.float64)
+        n = weights.sum(axis=1)
+        self.x_mean = (x * weights).sum(axis=1) / n
+        centered = (x - self.x_mean[:, None]) * weights
+
+        # Équations normales empilées : X'X commun aux indicateurs d'un programme
+        xtx = np.empty((len(self.programs), 2, 2))
+        xtx[:, 0, 0] = n
+        xtx[:, 0, 1] = xtx[:, 1, 0] = centered.sum(axis=1)
+        xtx[:, 1, 1] = (centered ** 2).sum(axis=1)
+        xty = np.stack([(y * weights[:, None, :]).sum(axis=2),
+                        (y * centered[:, None, :]).sum(axis=2)], axis=-1)
+        beta = np.linalg.solve(np.broadcast_to(xtx[:, None], xty.shape + (2,)), xty[..., None])[..., 0]
+        self.intercept, self.slope = beta[..., 0], beta[..., 1]
+        self.xtx_inv = np.linalg.inv(xtx)
+
+        # Résidus et R² par série (les positions masquées ne comptent pas)
+        fitted = self.intercept[..., None] + self.slope[..., None] * centered[:, None, :]
+        residuals = (y - fitted) * weights[:, None, :]
+        y_mean = (y * weights[:, None, :]).sum(axis=2) / n[:, None]
+        ss_res = (residuals ** 2).sum(axis=2)
+        ss_tot = (((y - y_mean[..., None]) * weights[:, None, :]) ** 2).sum(axis=2)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.r2 = np.where(ss_tot > 0, 1.0 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+        self.dof = np.maximum(n - 2, 1)
+        self.resid_std = np.sqrt(ss_res / self.dof[:, None])
+
+        # Années futures propres à chaque programme : après sa dernière année observée
+        last_year = np.where(mask, x, -np.inf).max(axis=1)
+        self.future_years = last_year[:, None] + np.arange(1, horizon + 1)
+        self.prediction, self.lower, self.upper = self._predict(self.future_years)
+
+    def _predict(self, future_years):
+        """Prévision et intervalle de prédiction pour chaque série et chaque horizon"""
+        future_centered = future_years - self.x_mean[:, None]
+        prediction = self.intercept[..., None] + self.slope[..., None] * future_centered[:, None, :]
+
+        # Levier h = [1, x0] (X'X)^-1 [1, x0]' puis variance de prédiction s² (1 + h)
+        design = np.stack([np.ones_like(future_centered), future_centered], axis=-1)
+        leverage = np.einsum('phi,pij,phj->ph', design, self.xtx_inv, design)
+        t_value = t_quantile_975(self.dof)[:, None, None]
+        half_width = t_value * self.resid_std[..., None] * np.sqrt(1.0 + leverage[:, None, :])
+        return prediction, prediction - half_width, prediction + half_width
+
+    def frame(self):
+        """Prévisions au format long : une ligne par programme, indicateur et année"""
+        n_programs, n_columns, horizon = self.prediction.shape
+        return pd.DataFrame({
+            'Programme': pd.Categorical(np.repeat(self.programs, n_columns * horizon), self.programs),
+            'Indicateur': pd.Categorical(np.tile(np.repeat(self.columns, horizon), n_programs), self.columns),
+            'Année': np.repeat(self.future_years[:, None, :], n_columns, axis=1).ravel().astype(np.int16),
+            'Prevision': self.prediction.ravel(),
+            'Borne_Basse': self.lower.ravel(),
+            'Borne_Haute': self.upper.ravel()
+        })
+
+    def metrics(self):
+        """Pente, R² et écart-type résiduel de chaque série"""
+        n_programs, n_columns = self.slope.shape
+        return pd.DataFrame({
+            'Programme': pd.Categorical(np.repeat(self.programs, n_columns), self.programs),
+            'Indicateur': pd.Categorical(np.tile(self.columns, n_programs), self.columns),
+            'Pente': self.slope.ravel(),
+            'R2': self.r2.ravel(),
+            'Ecart_Type_Residuel': self.resid_std.ravel()
+        })
+
+    def lookup(self, program_id, column):
+        """Prévisions d'une série : années, prévision, bornes basse et haute"""
+        i = self.programs.index(program_id)
+        j = self.columns.index(column)
+        return self.future_years[i], self.prediction[i, j], self.lower[i, j], self.upper[i, j]
+
+
+class BatchForecaster:
+    """Prévisions groupées par version des données et horizon, calculées une fois"""
+
+    def __init__(self):
+        self._forecasts = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def forecast(self, frames, columns=None, horizon=DEFAULT_HORIZON):
+        """Retourne la prévision groupée des programmes fournis (programme -> DataFrame)"""
+        frames = {program_id: df for program_id, df in frames.items() if df is not None and len(df) >= 3}
+        if not frames:
+            return None
+        columns = columns or forecast_columns(next(iter(frames.values())))
+        x, y, mask = stack_series(frames, columns)
+        key = (tuple(frames), tuple(columns), horizon, data_version(x, y, mask))
+
+        with self._lock:
+            forecast = self._forecasts.get(key)
+            if forecast is not None:
+                self.hits += 1
+                return forecast
+
+        forecast = BatchForecast(frames, columns, x, y, mask, horizon)
+        with self._lock:
+            self.misses += 1
+            self._forecasts[key] = forecast
+        return forecast
+
+    def invalidate(self):
+        """Supprime toutes les prévisions"""
+        with self._lock:
+            self._forecasts.clear()
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._forecasts)}
+
+
+_batch_forecaster = BatchForecaster()
+
+
+def get_batch_forecaster():
+    """Retourne le prévisionniste groupé du processus"""
+    return _batch_forecaster
@@ -0,0 +1,97 @@
+"""Sonde de santé du portail cohesiondata, exécutée en arrière-plan"""
+import os
+import threading
+import time
+
+import requests
+
+DEFAULT_PORTAL_URL = "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005"
+
+STATUS_UNKNOWN = "unknown"
+STATUS_OK = "ok"
+STATUS_LIMITED = "limited"
+STATUS_OFFLINE = "offline"
+
+
+class PortalHealthMonitor:
+    """Interroge le portail à intervalle régulier et conserve le dernier statut connu"""
+
+    def __init__(self, url=None, interval=60.0, timeout=10.0, ttl=180.0):
+        # FEDER_PORTAL_URL permet de pointer la sonde vers un serveur local de test
+        self.url = url or os.environ.get("FEDER_PORTAL_URL", DEFAULT_PORTAL_URL)
+        self.interval = interval
+        self.timeout = timeout
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last = None
+
+    def start(self):
+        """Démarre le thread de sonde s'il ne tourne pas déjà"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="feder-portal-health", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Arrête le thread de sonde"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.timeout + 1)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.probe()
+            self._stop.wait(self.interval)
+
+    def probe(self):
+        """Effectue une sonde synchrone et enregistre son résultat"""
+        started = time.monotonic()
+        http_status = None
+        try:
+            response = requests.get(self.url, timeout=self.timeout)
+            http_status = response.status_code
+            status = STATUS_OK if http_status == 200 else STATUS_LIMITED
+        except requests.RequestException:
+            status = STATUS_OFFLINE
+
+        result = {
+            'status': status,
+            'http_status': http_status,
+            'latency': time.monotonic() - started,
+            'checked_at': time.time()
+        }
+        with self._lock:
+            self._last = result
+        return result
+
+    def status(self):
+        """Retourne immédiatement le dernier statut connu (unknown s'il a expiré)"""
+        with self._lock:
+            last = self._last
+
+        if last is None or time.time() - last['checked_at'] > self.ttl:
+            return {
+                'status': STATUS_UNKNOWN,
+                'http_status': None,
+                'latency': None,
+                'checked_at': last['checked_at'] if last else None
+            }
+        return dict(last)
+
+
+_monitor = None
+_monitor_lock = threading.Lock()
+
+
+def get_portal_monitor():
+    """Retourne la sonde du processus, démarrée au premier appel"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = PortalHealthMonitor()
+        _monitor.start()
+    return _monitor
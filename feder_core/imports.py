@@ -0,0 +1,66 @@
+"""Imports différés des dépendances lourdes, avec mesure des temps de chargement"""
+import importlib
+import subprocess
+import sys
+import threading
+import time
+
+# Dépendances mesurées par le rapport de démarrage
+HEAVY_MODULES = [
+    'streamlit',
+    'pandas',
+    'numpy',
+    'plotly.express',
+    'plotly.graph_objects',
+    'requests',
+    'sklearn.preprocessing',
+    'sklearn.cluster'
+]
+
+_import_times = {}
+_lock = threading.Lock()
+
+
+def lazy_import(module_name):
+    """Importe un module au premier appel et enregistre la durée de ce chargement"""
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    elapsed = time.perf_counter() - started
+
+    with _lock:
+        _import_times.setdefault(module_name, elapsed)
+    return module
+
+
+def import_report():
+    """Retourne les imports différés effectués par ce processus, du plus lent au plus rapide"""
+    with _lock:
+        items = list(_import_times.items())
+    return [
+        {'module': name, 'seconds': seconds}
+        for name, seconds in sorted(items, key=lambda item: item[1], reverse=True)
+    ]
+
+
+def measure_cold_imports(modules=None):
+    """Mesure le temps d'import à froid de chaque module dans un interpréteur neuf"""
+    report = []
+    for module_name in modules or HEAVY_MODULES:
+        code = (
+            "import time, importlib; t = time.perf_counter(); "
+            f"importlib.import_module({module_name!r}); print(time.perf_counter() - t)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+        seconds = float(result.stdout.strip()) if result.returncode == 0 else None
+        report.append({'module': module_name, 'seconds': seconds})
+    return report
+
+
+if __name__ == "__main__":
+    for row in measure_cold_imports():
+        seconds = f"{row['seconds']:.3f} s" if row['seconds'] is not None else "indisponible"
+        print(f"{row['module']:<24} {seconds}")
@@ -0,0 +1,322 @@
+"""Ingestion en masse des exports cohesiondata.ec.europa.eu vers le stockage colonne
+
+Les jeux du portail (API SODA) sont lus par pages sur une session HTTP à connexions
+réutilisées, puis écrits page par page dans le stockage Parquet. Le schéma vient des
+métadonnées de la ressource (SODA omet les champs nuls des lignes). Après la dernière
+page, la première est redemandée avec son ETag : hors 304, le jeu a changé en cours de
+lecture et il est relu.
+L'ETag est conservé dans un manifeste : un rafraîchissement sans changement côté portail
+répond 304 et ne retélécharge rien.
+
+    python -m feder_core.ingestion store/
+    python -m feder_core.ingestion store/ --record fixtures/   # enregistre les réponses
+    python -m feder_core.ingestion store/ --replay fixtures/   # rejoue sans réseau
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from feder_core.imports import lazy_import
+from feder_core.store import ColumnarStore
+
+DEFAULT_COHESION_URL = "https://cohesiondata.ec.europa.eu"
+
+# Jeux du portail ingérés : nom dans le stockage -> identifiant de ressource SODA
+PORTAL_DATASETS = {
+    'portail_programmes': '99js-gm52',
+    'portail_categories': '3kkx-ekfq'
+}
+
+DEFAULT_PAGE_SIZE = 50000
+MANIFEST_NAME = '_ingestion.json'
+
+# Relectures complètes quand le jeu change pendant la lecture des pages
+SNAPSHOT_RETRIES = 2
+
+STATUS_UPDATED = "updated"
+STATUS_UNCHANGED = "unchanged"
+
+
+class SnapshotChanged(RuntimeError):
+    """Le jeu a été modifié côté portail pendant la lecture de ses pages"""
+
+
+def pooled_session(pool_size=8, retries=3):
+    """Session HTTP à connexions réutilisées, avec relances sur les erreurs transitoires"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=('GET',)
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['Accept'] = 'application/json'
+    return session
+
+
+class RecordedResponse:
+    """Réponse HTTP minimale rejouée depuis un fichier d'enregistrement"""
+
+    def __init__(self, status_code, headers, body):
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self._body = body
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} (réponse enregistrée)", response=self)
+
+
+class FixtureSession:
+    """Enregistre les réponses d'une vraie session, ou les rejoue sans réseau"""
+
+    def __init__(self, fixture_dir, mode='replay', session=None):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"Mode inconnu : {mode}")
+        self.fixture_dir = fixture_dir
+        self.mode = mode
+        self.session = session or (pooled_session() if mode == 'record' else None)
+
+    def _path(self, url, params, headers):
+        # Clé indépendante de l'hôte ; l'ETag envoyé en fait partie (200 et 304 séparés)
+        request = json.dumps({
+            'path': urlsplit(url).path,
+            'params': sorted((params or {}).items()),
+            'if_none_match': (headers or {}).get('If-None-Match')
+        }, sort_keys=True)
+        digest = hashlib.sha256(request.encode('utf-8')).hexdigest()[:24]
+        return os.path.join(self.fixture_dir, f"{digest}.json")
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        path = self._path(url, params, headers)
+
+        if self.mode == 'replay':
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Aucun enregistrement pour {url} {params} ({path})")
+            with open(path, encoding='utf-8') as handle:
+                recorded = json.load(handle)
+            return RecordedResponse(recorded['status'], recorded['headers'], recorded['body'])
+
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        body = response.json() if response.status_code == 200 else None
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as handle:
+            json.dump({
+                'url': url,
+                'params': params,
+                'status': response.status_code,
+                'headers': {name: value for name, value in response.headers.items() if name.lower() in ('etag', 'last-modified')},
+                'body': body
+            }, handle, ensure_ascii=False)
+        return RecordedResponse(response.status_code, dict(response.headers), body)
+
+
+class PortalClient:
+    """Lecture paginée des ressources SODA du portail cohesiondata"""
+
+    def __init__(self, base_url=None, session=None, page_size=DEFAULT_PAGE_SIZE, timeout=30.0):
+        self.base_url = (base_url or os.environ.get('FEDER_COHESION_URL', DEFAULT_COHESION_URL)).rstrip('/')
+        self.session = session or pooled_session()
+        self.page_size = page_size
+        self.timeout = timeout
+        self.requests = 0
+
+    def resource_url(self, resource_id):
+        return f"{self.base_url}/resource/{resource_id}.json"
+
+    def metadata_url(self, resource_id):
+        return f"{self.base_url}/api/views/{resource_id}.json"
+
+    def fetch_columns(self, resource_id):
+        """Colonnes déclarées par les métadonnées de la ressource ; None si elles sont indisponibles"""
+        try:
+            response = self.session.get(self.metadata_url(resource_id), timeout=self.timeout)
+            self.requests += 1
+            response.raise_for_status()
+            fields = [column['fieldName'] for column in response.json()['columns']]
+        except (requests.RequestException, FileNotFoundError, KeyError, TypeError, ValueError):
+            return None
+        # Champs système (:id, :created_at...) absents des lignes
+        return [field for field in fields if not field.startswith(':')]
+
+    def fetch_page(self, resource_id, offset, etag=None):
+        """Retourne (statut, ETag, lignes) pour une page ; statut 304 si l'ETag est inchangé"""
+        headers = {'If-None-Match': etag} if etag else None
+        params = {'$limit': self.page_size, '$offset': offset, '$order': ':id'}
+        response = self.session.get(self.resource_url(resource_id), params=params, headers=headers, timeout=self.timeout)
+        self.requests += 1
+
+        if response.status_code == 304:
+            return 304, etag, []
+        response.raise_for_status()
+        return response.status_code, response.headers.get('ETag'), response.json()
+
+    def iter_pages(self, resource_id, first_page, etag=None):
+        """Itère sur les pages à partir d'une première page déjà lue, d'ETag etag
+
+        L'ETag d'une page ne vaut que pour elle : la cohérence du jeu est vérifiée en fin
+        de lecture par une requête conditionnelle sur la première page.
+        """
+        page = first_page
+        offset = 0
+        while page:
+            yield page
+            if len(page) < self.page_size:
+                break
+            offset += len(page)
+            _, _, page = self.fetch_page(resource_id, offset)
+
+        # Une seule page : lue d'un bloc, rien à revalider
+        if offset and etag:
+            status, current, _ = self.fetch_page(resource_id, 0, etag)
+            if status != 304:
+                raise SnapshotChanged(f"{resource_id} : ETag {current} en fin de lecture, {etag} au début")
+
+
+def page_columns(pages):
+    """Union des colonnes de pages de lignes JSON, dans l'ordre d'apparition"""
+    return list(dict.fromkeys(column for page in pages for row in page for column in row))
+
+
+def page_table(page, columns):
+    """Convertit une page de lignes JSON en table Arrow (colonnes texte, schéma fixe)"""
+    pa = lazy_import('pyarrow')
+    schema = pa.schema([(column, pa.string()) for column in columns])
+    data = {
+        column: [None if row.get(column) is None else str(row[column]) for row in page]
+        for column in columns
+    }
+    return pa.Table.from_pydict(data, schema=schema)
+
+
+class IngestionManifest:
+    """ETag et volumétrie de chaque jeu ingéré, conservés à côté des fichiers Parquet"""
+
+    def __init__(self, root):
+        self.path = os.path.join(root, MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding='utf-8') as handle:
+                self.entries = json.load(handle)
+
+    def get(self, dataset):
+        return self.entries.get(dataset, {})
+
+    def record(self, dataset, **entry):
+        self.entries[dataset] = entry
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as handle:
+            json.dump(self.entries, handle, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def write_pages(store, dataset, pages, columns=None):
+    """Écrit les pages d'un jeu dans le stockage ; retourne (lignes, pages, colonnes)
+
+    Avec les colonnes déclarées, les pages sont écrites au fil de la lecture. Sans elles,
+    toutes les pages sont lues d'abord : le schéma est l'union de leurs colonnes.
+    """
+    if columns is None:
+        pages = list(pages)
+        columns = page_columns(pages)
+    count = 0
+
+    def tables():
+        nonlocal count
+        for page in pages:
+            undeclared = set(page_columns([page])).difference(columns)
+            if undeclared:
+                raise ValueError(f"{dataset} : colonnes absentes des métadonnées {sorted(undeclared)}")
+            count += 1
+            yield page_table(page, columns)
+
+    rows = store.write_stream(dataset, tables())
+    return rows, count, columns
+
+
+def ingest_dataset(client, store, manifest, dataset, resource_id, force=False):
+    """Ingère un jeu du portail ; ne retélécharge rien si l'ETag est inchangé"""
+    started = time.perf_counter()
+    previous = manifest.get(dataset)
+    etag = None if force or not store.has(dataset) else previous.get('etag')
+    declared = client.fetch_columns(resource_id)
+
+    for attempt in range(SNAPSHOT_RETRIES + 1):
+        status, new_etag, first_page = client.fetch_page(resource_id, 0, etag)
+        if status == 304:
+            return {'dataset': dataset, 'status': STATUS_UNCHANGED, 'rows': previous.get('rows', 0),
+                    'pages': 0, 'seconds': time.perf_counter() - started}
+        try:
+            # Le fichier précédent reste en place tant que toutes les pages ne sont pas écrites
+            rows, pages, columns = write_pages(
+                store, dataset, client.iter_pages(resource_id, first_page, new_etag), declared
+            )
+            break
+        except SnapshotChanged:
+            if attempt == SNAPSHOT_RETRIES:
+                raise
+            etag = None
+
+    manifest.record(
+        dataset,
+        resource=resource_id,
+        etag=new_etag,
+        rows=rows,
+        columns=columns,
+        fetched_at=datetime.now().isoformat(timespec='seconds')
+    )
+    return {'dataset': dataset, 'status': STATUS_UPDATED, 'rows': rows,
+            'pages': pages, 'seconds': time.perf_counter() - started}
+
+
+def ingest(root, datasets=None, client=None, force=False):
+    """Ingère les jeux du portail dans le stockage colonne situé sous root"""
+    client = client or PortalClient()
+    store = ColumnarStore(root)
+    manifest = IngestionManifest(root)
+    return [
+        ingest_dataset(client, store, manifest, dataset, PORTAL_DATASETS[dataset], force)
+        for dataset in datasets or PORTAL_DATASETS
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingestion des exports cohesiondata dans le stockage colonne")
+    parser.add_argument('root', nargs='?', default=os.environ.get('FEDER_STORE_DIR', 'store'))
+    parser.add_argument('--dataset', action='append', choices=list(PORTAL_DATASETS), help="jeu à ingérer (tous par défaut)")
+    parser.add_argument('--page-size', type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument('--force', action='store_true', help="ignore les ETag enregistrés")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR', help="enregistre les réponses du portail dans DIR")
+    fixtures.add_argument('--replay', metavar='DIR', help="rejoue les réponses enregistrées dans DIR, sans réseau")
+    args = parser.parse_args(argv)
+
+    session = None
+    if args.record:
+        session = FixtureSession(args.record, 'record')
+    elif args.replay:
+        session = FixtureSession(args.replay, 'replay')
+
+    client = PortalClient(session=session, page_size=args.page_size)
+    for result in ingest(args.root, args.dataset, client, args.force):
+        print(f"{result['dataset']:<22} {result['status']:<10} {result['rows']:>9} lignes "
+              f"{result['pages']:>4} pages {result['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
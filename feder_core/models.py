@@ -0,0 +1,151 @@
+"""Cache des régressions linéaires ajustées pour l'analyse prédictive"""
+import hashlib
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+# Paramètres d'une régression y = intercept + slope * x ajustée en forme close
+LinearFit = namedtuple('LinearFit', ['slope', 'intercept', 'r2', 'resid_std', 'x_mean', 'sxx', 'n'])
+
+# Quantile 0,975 de la loi de Student (intervalles à 95 %) : degrés de liberté -> valeur
+T_QUANTILES_975 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+    9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131, 16: 2.120,
+    17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 21: 2.080, 22: 2.074, 23: 2.069, 24: 2.064,
+    25: 2.060, 26: 2.056, 27: 2.052, 28: 2.048, 29: 2.045, 30: 2.042, 40: 2.021, 60: 2.000,
+    120: 1.980, np.inf: 1.960
+}
+
+
+def data_version(*arrays):
+    """Empreinte des données ayant servi à l'ajustement"""
+    digest = hashlib.sha1()
+    for array in arrays:
+        digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def fit_linear(x, y):
+    """Ajuste une régression linéaire par moindres carrés ordinaires"""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+
+    x_mean = x.mean()
+    y_mean = y.mean()
+    sxx = np.sum((x - x_mean) ** 2)
+    slope = np.sum((x - x_mean) * (y - y_mean)) / sxx if sxx > 0 else 0.0
+    intercept = y_mean - slope * x_mean
+
+    residuals = y - (intercept + slope * x)
+    ss_res = np.sum(residuals ** 2)
+    ss_tot = np.sum((y - y_mean) ** 2)
+    if ss_tot > 0:
+        r2 = 1.0 - ss_res / ss_tot
+    else:
+        r2 = 1.0 if ss_res == 0 else 0.0
+    resid_std = np.sqrt(ss_res / (n - 2)) if n > 2 else 0.0
+
+    return LinearFit(float(slope), float(intercept), float(r2), float(resid_std),
+                     float(x_mean), float(sxx), n)
+
+
+def predict_linear(fit, x):
+    """Évalue le modèle ajusté aux abscisses données"""
+    return fit.intercept + fit.slope * np.asarray(x, dtype=np.float64)
+
+
+def t_quantile_975(dof):
+    """Quantile de Student à 95 % bilatéral, interpolé en 1/ddl entre les valeurs de la table"""
+    inverse_dof = 1.0 / np.maximum(np.asarray(dof, dtype=np.float64), 1.0)
+    points = sorted((1.0 / dof_key, value) for dof_key, value in T_QUANTILES_975.items())
+    return np.interp(inverse_dof, [point for point, _ in points], [value for _, value in points])
+
+
+def prediction_interval(fit, x):
+    """Bornes de prédiction à 95 % : t · s · sqrt(1 + 1/n + (x - moyenne)² / Sxx), tous horizons à la fois"""
+    x = np.asarray(x, dtype=np.float64)
+    prediction = predict_linear(fit, x)
+    if fit.n <= 2 or fit.sxx <= 0:
+        return prediction, prediction
+    leverage = 1.0 / fit.n + (x - fit.x_mean) ** 2 / fit.sxx
+    half_width = t_quantile_975(fit.n - 2) * fit.resid_std * np.sqrt(1.0 + leverage)
+    return prediction - half_width, prediction + half_width
+
+
+class ModelCache:
+    """Modèles ajustés par (programme, indicateur, version des données)"""
+
+    def __init__(self):
+        self._fits = {}
+        self._bands = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.warmed = False
+
+    def get_or_fit(self, program_id, column, x, y):
+        """Retourne le modèle en cache ou l'ajuste sur (x, y)"""
+        key = (program_id, column, data_version(x, y))
+        with self._lock:
+            fit = self._fits.get(key)
+            if fit is not None:
+                self.hits += 1
+                return fit
+
+        fit = fit_linear(x, y)
+        with self._lock:
+            self.misses += 1
+            self._fits[key] = fit
+        return fit
+
+    def get_or_forecast(self, program_id, column, x, y, future_x):
+        """Modèle, prévision et bornes de prédiction aux abscisses futures, mis en cache ensemble"""
+        key = (program_id, column, data_version(x, y), tuple(np.asarray(future_x).tolist()))
+        with self._lock:
+            forecast = self._bands.get(key)
+            if forecast is not None:
+                self.hits += 1
+                return forecast
+
+        fit = self.get_or_fit(program_id, column, x, y)
+        lower, upper = prediction_interval(fit, future_x)
+        forecast = (fit, predict_linear(fit, future_x), lower, upper)
+        with self._lock:
+            self._bands[key] = forecast
+        return forecast
+
+    def warm_start(self, frames, columns):
+        """Pré-ajuste les modèles pour chaque (program_id, DataFrame) fourni"""
+        for program_id, df in frames:
+            if df is None or len(df) < 3:
+                continue
+            for column in columns:
+                self.get_or_fit(program_id, column, df['Année'].values, df[column].values)
+        self.warmed = True
+
+    def invalidate(self, program_id=None):
+        """Supprime les modèles d'un programme (ou tous)"""
+        with self._lock:
+            if program_id is None:
+                self._fits.clear()
+                self._bands.clear()
+            else:
+                for entries in (self._fits, self._bands):
+                    for key in [k for k in entries if k[0] == program_id]:
+                        del entries[key]
+            self.warmed = False
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._fits)}
+
+
+_model_cache = ModelCache()
+
+
+def get_model_cache():
+    """Retourne le cache de modèles du processus"""
+    return _model_cache
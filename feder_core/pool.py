@@ -0,0 +1,74 @@
+"""Exécution de calculs indépendants dans un pool de processus, avec repli sur place
+
+Le pool est créé au premier besoin puis réutilisé par tout le processus. Ses processus
+sont lancés en mode spawn : un fork depuis le serveur Streamlit, qui tourne sur plusieurs
+threads, peut hériter de verrous tenus par un autre thread. Sous POOL_MIN_WORK, le coût
+d'envoi des tâches dépasse le gain : le calcul reste sur place.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Volume de calcul estimé (éléments de tableau traités, environ 0,1 µs chacun) sous lequel
+# le pool n'est pas utilisé
+POOL_MIN_WORK = 20_000_000
+
+_executor = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+_pool_unavailable = False
+
+
+def default_workers(variable=None):
+    """Nombre de processus : variable d'environnement donnée (entier >= 1), sinon nombre de cœurs"""
+    value = os.environ.get(variable, '').strip() if variable else ''
+    if not value:
+        return os.cpu_count() or 1
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        raise ValueError(f"{variable} doit être un entier supérieur ou égal à 1 (reçu {value!r})")
+    return workers
+
+
+def _get_executor(workers):
+    """Pool du processus, recréé seulement si le nombre de processus demandé change"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is None or _executor_workers != workers:
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+            _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+            _executor_workers = workers
+        return _executor
+
+
+def _disable_pool(executor):
+    """Abandonne le pool après un échec : la suite du processus calcule sur place"""
+    global _executor, _pool_unavailable
+    with _executor_lock:
+        _pool_unavailable = True
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False)
+
+
+def pool_map(function, arguments, workers, work=0):
+    """Applique function à chaque tuple d'arguments, dans le pool si work atteint POOL_MIN_WORK
+
+    work est le volume de calcul estimé par l'appelant. function doit être définie au
+    niveau d'un module pour être transmise aux processus.
+    """
+    arguments = list(arguments)
+    if workers > 1 and len(arguments) > 1 and work >= POOL_MIN_WORK and not _pool_unavailable:
+        executor = _get_executor(workers)
+        try:
+            return list(executor.map(function, *zip(*arguments)))
+        except (BrokenProcessPool, OSError):
+            # Processus indisponibles (hôte restreint) : on retombe sur le calcul local
+            _disable_pool(executor)
+    return [function(*argument) for argument in arguments]
@@ -0,0 +1,111 @@
+"""Mesure légère des temps de rendu par section, pour un rerun Streamlit"""
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# Préfixes des méthodes instrumentées par instrument_methods
+PROFILED_PREFIXES = ('create_', 'generate_', 'display_')
+
+# Compteurs des moteurs affichés par le panneau de profilage : libellé -> (stats, gabarit)
+_cache_stats = {}
+
+
+def _frame_size(result):
+    """Lignes et octets du premier DataFrame trouvé dans le résultat"""
+    candidates = result if isinstance(result, tuple) else (result,)
+    for candidate in candidates:
+        if isinstance(candidate, pd.DataFrame):
+            return len(candidate), int(candidate.memory_usage(deep=False).sum())
+    return None, None
+
+
+class RenderProfiler:
+    """Enregistre durée, nombre d'appels et taille des DataFrames par section"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.records = []
+        self._depth = 0
+
+    @contextmanager
+    def section(self, name):
+        """Chronomètre un bloc ; le résultat peut être attaché via record['result']"""
+        record = {'section': name, 'depth': self._depth}
+        self._depth += 1
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self._depth -= 1
+            record['seconds'] = time.perf_counter() - started
+            record['rows'], record['bytes'] = _frame_size(record.pop('result', None))
+            self.records.append(record)
+
+    def summary(self):
+        """Agrège les enregistrements par section, de la plus coûteuse à la moins coûteuse"""
+        if not self.records:
+            return pd.DataFrame(columns=['section', 'calls', 'total_seconds', 'max_seconds', 'rows', 'bytes'])
+
+        records = pd.DataFrame(self.records)
+        summary = records.groupby('section').agg(
+            calls=('seconds', 'size'),
+            total_seconds=('seconds', 'sum'),
+            max_seconds=('seconds', 'max'),
+            rows=('rows', 'max'),
+            bytes=('bytes', 'max')
+        ).reset_index()
+        return summary.sort_values('total_seconds', ascending=False, ignore_index=True)
+
+    def export_jsonl(self, path, **context):
+        """Ajoute les enregistrements de ce rerun à un fichier JSON lines"""
+        with open(path, 'a', encoding='utf-8') as handle:
+            for record in self.records:
+                line = {'rerun_started_at': self.started_at, **context, **record}
+                handle.write(json.dumps(line, ensure_ascii=False, default=float) + '\n')
+
+
+def profiled(method):
+    """Décorateur : chronomètre la méthode si l'instance porte un profiler"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = getattr(self, 'profiler', None)
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.section(method.__name__) as record:
+            result = method(self, *args, **kwargs)
+            record['result'] = result
+            return result
+    return wrapper
+
+
+def instrument_methods(cls):
+    """Décorateur de classe : profile toutes les méthodes create_*, generate_* et display_*
+
+    Les méthodes héritées (vues et générateurs partagés) sont enveloppées sur la classe
+    décorée seulement ; les classes de base restent intactes.
+    """
+    for name in dir(cls):
+        if not name.startswith(PROFILED_PREFIXES):
+            continue
+        member = getattr(cls, name)
+        if callable(member) and not getattr(member, '__profiled__', False):
+            wrapper = profiled(member)
+            wrapper.__profiled__ = True
+            setattr(cls, name, wrapper)
+    return cls
+
+
+def register_cache_stats(label, stats, template):
+    """Déclare les compteurs d'un moteur pour le panneau de profilage (idempotent)
+
+    stats est appelé à l'affichage ; template est formaté avec le dictionnaire retourné.
+    """
+    _cache_stats[label] = (stats, template)
+
+
+def cache_stats_captions():
+    """Une ligne par moteur déclaré, dans l'ordre de déclaration"""
+    return [f"{label} : {template.format(**stats())}" for label, (stats, template) in list(_cache_stats.items())]
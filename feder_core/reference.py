@@ -0,0 +1,192 @@
+"""Données de référence FEDER partagées par les trois dashboards (territoires, programmes)"""
+
+# Territoires éligibles FEDER avec données enrichies
+TERRITOIRES = {
+    "DROM": {
+        "La Réunion": {
+            "population": 860000, 
+            "pib_habitant": 21000,
+            "taux_chomage": 23.5,
+            "indice_developpement": 0.785,
+            "secteurs_cles": ["Tourisme", "Agriculture", "Technologies"],
+            "risques": ["Cyclones", "Changements climatiques", "Dépendance économique"]
+        },
+        "Martinique": {
+            "population": 375000, 
+            "pib_habitant": 23400,
+            "taux_chomage": 19.8,
+            "indice_developpement": 0.802,
+            "secteurs_cles": ["Tourisme", "Services", "Agro-industrie"],
+            "risques": ["Séismes", "Éruption volcanique", "Chômage"]
+        },
+        "Guadeloupe": {
+            "population": 390000, 
+            "pib_habitant": 22500,
+            "taux_chomage": 21.2,
+            "indice_developpement": 0.795,
+            "secteurs_cles": ["Tourisme", "Agriculture", "Énergies renouvelables"],
+            "risques": ["Cyclones", "Pollution", "Inégalités sociales"]
+        },
+        "Guyane": {
+            "population": 290000, 
+            "pib_habitant": 15800,
+            "taux_chomage": 28.5,
+            "indice_developpement": 0.712,
+            "secteurs_cles": ["Spatial", "Forêt", "Orpaillage"],
+            "risques": ["Déforestation", "Migration", "Infrastructures limitées"]
+        },
+        "Mayotte": {
+            "population": 280000, 
+            "pib_habitant": 9600,
+            "taux_chomage": 35.2,
+            "indice_developpement": 0.654,
+            "secteurs_cles": ["Agriculture", "Pêche", "Tourisme émergent"],
+            "risques": ["Pauvreté", "Santé", "Éducation"]
+        }
+    },
+    "COM": {
+        "Saint-Martin": {
+            "population": 35000, 
+            "pib_habitant": 21500,
+            "taux_chomage": 18.5,
+            "indice_developpement": 0.812,
+            "secteurs_cles": ["Tourisme de luxe", "Services financiers", "Commerce"],
+            "risques": ["Cyclones", "Dépendance touristique", "Instabilité économique"]
+        },
+        "Saint-Barthélemy": {
+            "population": 9800, 
+            "pib_habitant": 38500,
+            "taux_chomage": 8.2,
+            "indice_developpement": 0.925,
+            "secteurs_cles": ["Tourisme ultra-luxe", "Immobilier", "Services haut de gamme"],
+            "risques": ["Cyclones", "Monodépendance", "Coût de la vie"]
+        },
+        "Polynésie française": {
+            "population": 280000, 
+            "pib_habitant": 20300,
+            "taux_chomage": 22.1,
+            "indice_developpement": 0.788,
+            "secteurs_cles": ["Tourisme", "Perliculture", "Pêche"],
+            "risques": ["Changements climatiques", "Éloignement", "Coûts des importations"]
+        },
+        "Nouvelle-Calédonie": {
+            "population": 270000, 
+            "pib_habitant": 32500,
+            "taux_chomage": 14.8,
+            "indice_developpement": 0.856,
+            "secteurs_cles": ["Nickel", "Tourisme", "Services"],
+            "risques": ["Dépendance au nickel", "Tensions sociales", "Environnement"]
+        },
+        "Wallis-et-Futuna": {
+            "population": 11500, 
+            "pib_habitant": 12500,
+            "taux_chomage": 16.5,
+            "indice_developpement": 0.725,
+            "secteurs_cles": ["Agriculture", "Pêche", "Aides publiques"],
+            "risques": ["Isolement", "Exode", "Ressources limitées"]
+        }
+    }
+}
+
+# Programmes FEDER spécifiques 2014-2020
+SPECIFIC_PROGRAMS = {
+    "2014FR05SFOP005": {
+        "name": "FEDER-FSE-IEJ - Mayotte",
+        "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR05SFOP005",
+        "territory": "Mayotte",
+        "type": "DROM",
+        "description": "Programme FEDER-FSE-IEJ pour Mayotte 2014-2020",
+        "total_budget": 280,
+        "eu_contribution": 210,
+        "themes": ["Formation", "Inclusion sociale", "Emploi des jeunes"],
+        "indicateurs_performance": {
+            "taux_absorption": 0.92,
+            "impact_social": 0.78,
+            "efficacite_budget": 0.85,
+            "durabilite": 0.72
+        }
+    },
+    "2014FR16RFOP007": {
+        "name": "FEDER-FSE-IEJ - Corse", 
+        "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR16RFOP007",
+        "territory": "Corse",
+        "type": "Région Métropolitaine",
+        "description": "Programme FEDER-FSE-IEJ pour la Corse 2014-2020",
+        "total_budget": 355,
+        "eu_contribution": 266,
+        "themes": ["Innovation", "Tourisme durable", "Environnement"],
+        "indicateurs_performance": {
+            "taux_absorption": 0.88,
+            "impact_social": 0.82,
+            "efficacite_budget": 0.79,
+            "durabilite": 0.85
+        }
+    },
+    "2014FR06RDRP004": {
+        "name": "FEDER-FSE - Guadeloupe",
+        "url": "https://cohesiondata.ec.europa.eu/programmes/2014FR06RDRP004",
+        "territory": "Guadeloupe",
+        "type": "DROM",
+        "description": "Programme FEDER-FSE pour la Guadeloupe 2014-2020",
+        "total_budget": 420,
+        "eu_contribution": 315,
+        "themes": ["Transition énergétique", "Innovation", "Formation"],
+        "indicateurs_performance": {
+            "taux_absorption": 0.90,
+            "impact_social": 0.80,
+            "efficacite_budget": 0.83,
+            "durabilite": 0.78
+        }
+    }
+}
+
+# Programmes FEDER 2021-2027 pour les DROM COM
+DROM_COM_PROGRAMS = {
+    "2021FR16TCPO001": {
+        "name": "FEDER - DROM",
+        "url": "https://ec.europa.eu/regional_policy/in-your-country/programmes/2021-2027/fr_en",
+        "territory": "DROM",
+        "type": "DROM",
+        "description": "Programme FEDER pour les Départements et Régions d'Outre-Mer 2021-2027",
+        "total_budget": 1250,
+        "eu_contribution": 937.5,
+        "themes": ["Transition écologique", "Innovation numérique", "Inclusion sociale", "Développement économique"],
+        "territoires_cibles": ["Guadeloupe", "La Réunion", "Martinique", "Guyane", "Mayotte"],
+        "indicateurs_performance": {
+            "taux_absorption_prevu": 0.95,
+            "impact_social_estime": 0.85,
+            "efficacite_budget_estime": 0.88,
+            "durabilite_estimee": 0.82
+        }
+    },
+    "2021FR16TCPO002": {
+        "name": "FEDER - COM",
+        "url": "https://ec.europa.eu/regional_policy/in-your-country/programmes/2021-2027/fr_en",
+        "territory": "COM",
+        "type": "COM",
+        "description": "Programme FEDER pour les Collectivités d'Outre-Mer 2021-2027",
+        "total_budget": 350,
+        "eu_contribution": 262.5,
+        "themes": ["Transition écologique", "Innovation numérique", "Inclusion sociale", "Développement économique"],
+        "territoires_cibles": ["Saint-Martin", "Saint-Barthélemy", "Polynésie française", "Nouvelle-Calédonie", "Wallis-et-Futuna"],
+        "indicateurs_performance": {
+            "taux_absorption_prevu": 0.90,
+            "impact_social_estime": 0.80,
+            "efficacite_budget_estime": 0.85,
+            "durabilite_estimee": 0.78
+        }
+    }
+}
+
+# Indicateurs du radar de performance (colonne -> libellé)
+PERFORMANCE_INDICATORS = {
+    'Indicateur_Performance': 'Performance Globale',
+    'Impact_Environnemental': 'Impact Environnemental',
+    'Innovation_Index': 'Innovation',
+    'Inclusion_Sociale': 'Inclusion Sociale',
+    'Developpement_Durable': 'Développement Durable',
+    'Taux_Realisation': 'Taux de Réalisation'
+}
+
+# Indicateurs couverts par l'analyse prédictive
+PREDICTIVE_COLUMNS = ['Budget_Total', 'Emplois_Crees']
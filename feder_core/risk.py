@@ -0,0 +1,152 @@
+"""Moteur Monte-Carlo des risques programme
+
+Les six facteurs de risque sont tirés conjointement sur N scénarios en un seul lot NumPy :
+normales corrélées (Cholesky de la matrice de corrélation) ramenées sur [0, 1] par la
+fonction de répartition normale (copule gaussienne), puis sur les bornes de chaque facteur.
+Le générateur est dérivé de l'identifiant du programme : un même programme donne toujours
+la même distribution, calculée une seule fois par processus.
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from feder_core.seeding import stable_seed
+
+DEFAULT_SCENARIOS = 10000
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Facteur -> (borne basse, borne haute) du score de risque
+RISK_FACTORS = {
+    'Risque Budgétaire': (0.2, 0.4),
+    'Risque Opérationnel': (0.15, 0.35),
+    'Risque Environnemental': (0.1, 0.3),
+    'Risque Social': (0.2, 0.4),
+    'Risque Politique': (0.1, 0.25),
+    'Risque Exécution': (0.15, 0.3)
+}
+
+# Corrélations entre facteurs, dans l'ordre de RISK_FACTORS
+RISK_CORRELATION = np.array([
+    [1.0, 0.4, 0.1, 0.1, 0.2, 0.5],
+    [0.4, 1.0, 0.2, 0.2, 0.1, 0.6],
+    [0.1, 0.2, 1.0, 0.3, 0.2, 0.2],
+    [0.1, 0.2, 0.3, 1.0, 0.4, 0.2],
+    [0.2, 0.1, 0.2, 0.4, 1.0, 0.2],
+    [0.5, 0.6, 0.2, 0.2, 0.2, 1.0]
+])
+
+# Seuils du score global : (borne haute exclue, niveau, classe CSS)
+RISK_LEVELS = (
+    (0.2, "Faible", "risk-low"),
+    (0.3, "Moyen", "risk-medium"),
+    (np.inf, "Élevé", "risk-high")
+)
+
+RiskSummary = namedtuple('RiskSummary', [
+    'program_id', 'scenarios', 'factor_means', 'score_mean', 'score_std',
+    'quantiles', 'contributions', 'level_probabilities'
+])
+
+
+def normal_cdf(z):
+    """Fonction de répartition de la loi normale, vectorisée (Abramowitz-Stegun 7.1.26, erreur < 1.5e-7)"""
+    z = np.asarray(z, dtype=np.float64)
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.sign(z) * erf)
+
+
+def classify_risk(score):
+    """Niveau et classe CSS d'un score de risque global"""
+    for upper, level, css_class in RISK_LEVELS:
+        if score < upper:
+            return level, css_class
+    return RISK_LEVELS[-1][1], RISK_LEVELS[-1][2]
+
+
+def simulate_factors(program_id, scenarios=DEFAULT_SCENARIOS, correlation=RISK_CORRELATION):
+    """Tire les facteurs de risque du programme : tableau (scénarios, facteurs)"""
+    bounds = np.array(list(RISK_FACTORS.values()))
+    chol = np.linalg.cholesky(correlation)
+    rng = np.random.default_rng(stable_seed(f"risque:{program_id}"))
+
+    normals = rng.standard_normal((scenarios, len(bounds))) @ chol.T
+    return bounds[:, 0] + (bounds[:, 1] - bounds[:, 0]) * normal_cdf(normals)
+
+
+def summarize(program_id, factors):
+    """Quantiles du score global, contribution et niveaux à partir des scénarios tirés"""
+    scores = factors.mean(axis=1)
+    names = list(RISK_FACTORS)
+
+    # Contribution de chaque facteur à la variance du score (allocation d'Euler, somme = 1)
+    centered = factors - factors.mean(axis=0)
+    score_centered = scores - scores.mean()
+    score_var = score_centered @ score_centered
+    covariances = centered.T @ score_centered / len(names)
+    contributions = covariances / score_var if score_var > 0 else np.full(len(names), 1.0 / len(names))
+
+    uppers = np.array([upper for upper, _, _ in RISK_LEVELS[:-1]])
+    counts = np.bincount(np.searchsorted(uppers, scores, side='right'), minlength=len(RISK_LEVELS))
+
+    return RiskSummary(
+        program_id=program_id,
+        scenarios=len(scores),
+        factor_means=dict(zip(names, factors.mean(axis=0).tolist())),
+        score_mean=float(scores.mean()),
+        score_std=float(scores.std()),
+        quantiles=dict(zip(QUANTILES, np.quantile(scores, QUANTILES).tolist())),
+        contributions=dict(zip(names, contributions.tolist())),
+        level_probabilities={level: float(count) / len(scores) for (_, level, _), count in zip(RISK_LEVELS, counts)}
+    )
+
+
+class RiskEngine:
+    """Synthèses de risque par (programme, nombre de scénarios), calculées une fois"""
+
+    def __init__(self, scenarios=DEFAULT_SCENARIOS):
+        self.scenarios = scenarios
+        self._summaries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def summary(self, program_id, scenarios=None):
+        """Retourne la synthèse en cache ou lance la simulation du programme"""
+        key = (program_id, scenarios or self.scenarios)
+        with self._lock:
+            summary = self._summaries.get(key)
+            if summary is not None:
+                self.hits += 1
+                return summary
+
+        summary = summarize(program_id, simulate_factors(program_id, key[1]))
+        with self._lock:
+            self.misses += 1
+            self._summaries[key] = summary
+        return summary
+
+    def invalidate(self, program_id=None):
+        """Supprime les synthèses d'un programme (ou toutes)"""
+        with self._lock:
+            if program_id is None:
+                self._summaries.clear()
+            else:
+                for key in [k for k in self._summaries if k[0] == program_id]:
+                    del self._summaries[key]
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._summaries)}
+
+
+_risk_engine = RiskEngine()
+
+
+def get_risk_engine():
+    """Retourne le moteur de risques du processus"""
+    return _risk_engine
@@ -0,0 +1,188 @@
+"""Moteur de retour sur investissement par programme
+
+Le ROI d'une dimension vaut (volume × valeur unitaire) / budget : les ratios volume / budget
+ne dépendent que des données et sont conservés par programme. Un jeu de pondérations et de
+valeurs unitaires se ramène alors à un vecteur de coefficients, et plusieurs scénarios à une
+matrice évaluée en un seul produit matriciel. Les ratios sont conservés par version des
+données du programme dans le cache de données : tant qu'elle ne change pas, rien n'est relu.
+
+Le balayage de sensibilité évalue une grille factorielle complète des six paramètres
+(trois pondérations, trois valeurs unitaires) sur tous les programmes en un seul calcul
+diffusé : le ROI total moyen d'un programme est linéaire en chaque paramètre.
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Dimension ROI -> colonne de volume, dans l'ordre des vecteurs de paramètres
+ROI_DIMENSIONS = {
+    'ROI_Emploi': 'Emplois_Crees',
+    'ROI_PME': 'PME_Soutenues',
+    'ROI_Social': 'Beneficiaires_Directs'
+}
+
+# Valeur économique par emploi, par PME et valeur sociale par bénéficiaire (euros)
+DEFAULT_UNIT_VALUES = np.array([35000.0, 50000.0, 5000.0])
+DEFAULT_WEIGHTS = np.array([0.4, 0.3, 0.3])
+
+# Paramètres balayés : pondérations puis valeurs unitaires, dans l'ordre de ROI_DIMENSIONS
+SWEEP_PARAMETERS = ('Poids Emploi', 'Poids PME', 'Poids Social',
+                    'Valeur Emploi', 'Valeur PME', 'Valeur Social')
+DEFAULT_SWEEP_LEVELS = 7
+DEFAULT_SWEEP_SPAN = 0.5
+
+SweepResult = namedtuple('SweepResult', ['parameters', 'grid', 'programs', 'totals', 'baseline'])
+
+
+def source_matrix(df):
+    """Années et matrice (budget, volumes) servant au calcul du ROI"""
+    columns = ['Budget_Total', *ROI_DIMENSIONS.values()]
+    return df['Année'].to_numpy(), df[columns].to_numpy(dtype=np.float64)
+
+
+def unit_ratios(values):
+    """Volumes par euro de budget : matrice (années, dimensions)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return values[:, 1:] / values[:, :1]
+
+
+def scenario_coefficients(weights=None, unit_values=None):
+    """Coefficients pondération × valeur unitaire : matrice (scénarios, dimensions)"""
+    weights = DEFAULT_WEIGHTS if weights is None else np.asarray(weights, dtype=np.float64)
+    unit_values = DEFAULT_UNIT_VALUES if unit_values is None else np.asarray(unit_values, dtype=np.float64)
+    return np.atleast_2d(weights) * np.atleast_2d(unit_values)
+
+
+def roi_frame(years, ratios, weights=None, unit_values=None):
+    """ROI par dimension et ROI total pondéré pour un jeu de paramètres"""
+    unit_values = DEFAULT_UNIT_VALUES if unit_values is None else np.asarray(unit_values, dtype=np.float64)
+    dimensions = ratios * unit_values
+    frame = pd.DataFrame(dimensions, columns=list(ROI_DIMENSIONS))
+    frame.insert(0, 'Année', years)
+    frame['ROI_Total'] = ratios @ scenario_coefficients(weights, unit_values)[0]
+    return frame
+
+
+def roi_analysis(df, weights=None, unit_values=None):
+    """ROI d'un DataFrame quelconque, sans passer par le cache"""
+    years, values = source_matrix(df)
+    return roi_frame(years, unit_ratios(values), weights, unit_values)
+
+
+def scenario_totals(ratios, weights, unit_values=None):
+    """ROI total de plusieurs scénarios en un passage : matrice (scénarios, années)"""
+    return scenario_coefficients(weights, unit_values) @ ratios.T
+
+
+def sweep_grid(levels=DEFAULT_SWEEP_LEVELS, span=DEFAULT_SWEEP_SPAN):
+    """Valeurs de chaque paramètre, de (1 - span) à (1 + span) fois sa valeur de référence"""
+    baseline = np.concatenate([DEFAULT_WEIGHTS, DEFAULT_UNIT_VALUES])
+    factors = np.linspace(1.0 - span, 1.0 + span, levels)
+    return [value * factors for value in baseline]
+
+
+def sensitivity_sweep(program_ratios, levels=DEFAULT_SWEEP_LEVELS, span=DEFAULT_SWEEP_SPAN):
+    """ROI total moyen de chaque programme sur la grille complète des paramètres
+
+    program_ratios : programme -> ratios volume / budget (années, dimensions).
+    Le tableau de résultats a un axe par paramètre puis un axe programme.
+    """
+    programs = list(program_ratios)
+    means = np.array([np.asarray(program_ratios[program_id]).mean(axis=0) for program_id in programs])
+    grid = sweep_grid(levels, span)
+    n_dimensions = len(ROI_DIMENSIONS)
+    n_axes = len(grid) + 1
+
+    def along(values, axis):
+        shape = [1] * n_axes
+        shape[axis] = len(values)
+        return values.reshape(shape)
+
+    # Somme sur les dimensions de poids × valeur × ratio moyen, diffusée sur la grille
+    totals = sum(
+        along(grid[d], d) * along(grid[n_dimensions + d], n_dimensions + d) * along(means[:, d], n_axes - 1)
+        for d in range(n_dimensions)
+    )
+    baseline = means @ scenario_coefficients()[0]
+    return SweepResult(SWEEP_PARAMETERS, grid, programs, totals, baseline)
+
+
+def tornado_frame(result):
+    """Effet de chaque paramètre entre ses bornes (ROI moyen sur les programmes et les autres paramètres)"""
+    program_mean = result.totals.mean(axis=-1)
+    rows = []
+    for axis, parameter in enumerate(result.parameters):
+        other_axes = tuple(a for a in range(program_mean.ndim) if a != axis)
+        effect = program_mean.mean(axis=other_axes)
+        rows.append({
+            'Paramètre': parameter,
+            'ROI_Bas': effect[0],
+            'ROI_Haut': effect[-1],
+            'Amplitude': abs(effect[-1] - effect[0])
+        })
+    return pd.DataFrame(rows).sort_values('Amplitude').reset_index(drop=True)
+
+
+def heatmap_frame(result, row_parameter, column_parameter):
+    """ROI moyen croisé de deux paramètres, moyenné sur les autres et sur les programmes"""
+    row_axis = result.parameters.index(row_parameter)
+    column_axis = result.parameters.index(column_parameter)
+    program_mean = result.totals.mean(axis=-1)
+    other_axes = tuple(a for a in range(program_mean.ndim) if a not in (row_axis, column_axis))
+    surface = program_mean.mean(axis=other_axes)
+    if row_axis > column_axis:
+        surface = surface.T
+    return pd.DataFrame(surface, index=result.grid[row_axis], columns=result.grid[column_axis])
+
+
+class ROIEngine:
+    """Ratios volume / budget par programme, conservés par version de ses données"""
+
+    def __init__(self):
+        self._series = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ratios(self, program_id, version, df):
+        """Retourne (années, ratios) du programme ; df n'est lu que si version a changé
+
+        version identifie les données du programme (version de l'entrée du cache de données) ;
+        sans version, les ratios sont recalculés sans être conservés.
+        """
+        with self._lock:
+            cached = self._series.get(program_id)
+            if version is not None and cached is not None and cached[0] == version:
+                self.hits += 1
+                return cached[1], cached[2]
+
+        years, values = source_matrix(df)
+        ratios = unit_ratios(values)
+        with self._lock:
+            self.misses += 1
+            if version is not None:
+                self._series[program_id] = (version, years, ratios)
+        return years, ratios
+
+    def invalidate(self, program_id=None):
+        """Supprime les séries d'un programme (ou toutes)"""
+        with self._lock:
+            if program_id is None:
+                self._series.clear()
+            else:
+                self._series.pop(program_id, None)
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._series)}
+
+
+_roi_engine = ROIEngine()
+
+
+def get_roi_engine():
+    """Retourne le moteur ROI du processus"""
+    return _roi_engine
@@ -0,0 +1,81 @@
+"""Schéma typé des séries FEDER : libellés catégoriels, compteurs int32, ratios float32
+
+Les types sont appliqués dès l'assemblage des colonnes (combine_long) et à la relecture
+du stockage colonne ; memory_report mesure le gain par rapport aux types par défaut.
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Indicateurs thématiques des séries avancées, ratios dans [0, 1]
+THEMATIC_COLUMNS = ['Impact_Environnemental', 'Innovation_Index', 'Inclusion_Sociale', 'Developpement_Durable']
+
+# Colonnes de libellés, constantes par programme et stockées en catégories
+LABEL_COLUMNS = ('Programme', 'Territoire', 'Type_Territoire')
+COUNT_COLUMNS = ('Projets_Finances', 'Emplois_Crees', 'PME_Soutenues', 'Beneficiaires_Directs')
+RATIO_COLUMNS = ('Taux_Realisation', 'Indicateur_Performance', *THEMATIC_COLUMNS)
+
+# Colonne -> type ; les montants (M€), la population et le PIB restent en float64
+FRAME_SCHEMA = {
+    **{column: 'category' for column in LABEL_COLUMNS},
+    'Année': np.dtype(np.int16),
+    **{column: np.dtype(np.int32) for column in COUNT_COLUMNS},
+    **{column: np.dtype(np.float32) for column in RATIO_COLUMNS}
+}
+
+
+def column_dtype(name):
+    """Type déclaré d'une colonne numérique, None si la colonne n'est pas typée"""
+    dtype = FRAME_SCHEMA.get(name)
+    return None if dtype == 'category' else dtype
+
+
+def enforce_schema(frame):
+    """Convertit les colonnes qui ne respectent pas encore le schéma (sans copie sinon)"""
+    conversions = {
+        column: dtype for column, dtype in FRAME_SCHEMA.items()
+        if column in frame.columns and frame[column].dtype != dtype
+    }
+    return frame.astype(conversions) if conversions else frame
+
+
+def _untyped_bytes(series):
+    # Empreinte de la même colonne en types par défaut : objets str ou 64 bits
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        counts = np.bincount(series.cat.codes[series.cat.codes >= 0], minlength=len(series.cat.categories))
+        sizes = np.array([sys.getsizeof(label) for label in series.cat.categories], dtype=np.int64)
+        return 8 * len(series) + int(counts @ sizes)
+    if series.dtype == object:
+        return int(series.memory_usage(index=False, deep=True))
+    return 8 * len(series)
+
+
+def memory_report(frame):
+    """Octets par colonne, typés et non typés, avec le facteur de réduction"""
+    rows = []
+    for column in frame.columns:
+        series = frame[column]
+        typed = int(series.memory_usage(index=False, deep=True))
+        untyped = _untyped_bytes(series)
+        rows.append({
+            'Colonne': column,
+            'Type': str(series.dtype),
+            'Octets': typed,
+            'Octets_Non_Types': untyped,
+            'Reduction': untyped / typed if typed else 1.0
+        })
+    return pd.DataFrame(rows, columns=['Colonne', 'Type', 'Octets', 'Octets_Non_Types', 'Reduction'])
+
+
+def memory_summary(frame):
+    """Totaux de memory_report pour un DataFrame"""
+    report = memory_report(frame)
+    typed = int(report['Octets'].sum())
+    untyped = int(report['Octets_Non_Types'].sum())
+    return {
+        'rows': len(frame),
+        'bytes': typed,
+        'untyped_bytes': untyped,
+        'reduction': untyped / typed if typed else 1.0
+    }
@@ -0,0 +1,15 @@
+"""Graines déterministes et stables entre processus pour les données synthétiques"""
+import hashlib
+
+import numpy as np
+
+
+def stable_seed(key):
+    """Dérive une graine 64 bits d'un digest SHA-256 de la clé (indépendant de PYTHONHASHSEED)"""
+    digest = hashlib.sha256(str(key).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def program_rng(program_id):
+    """Retourne un générateur isolé, propre au programme"""
+    return np.random.default_rng(stable_seed(program_id))
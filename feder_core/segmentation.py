@@ -0,0 +1,156 @@
+"""Segmentation K-means des territoires, persistée comme artefact versionné"""
+import hashlib
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from feder_core.imports import lazy_import
+
+# À incrémenter dès que le format de l'artefact ou la méthode d'ajustement change
+ARTIFACT_VERSION = 1
+
+FEATURES = ['Population', 'PIB_Habitant', 'Taux_Chomage', 'IDH']
+N_CLUSTERS = 3
+
+DEFAULT_ARTIFACT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'artifacts')
+
+
+def territory_frame(territoires):
+    """Construit le tableau des caractéristiques des territoires"""
+    territories_data = []
+
+    for type_territoire, territoires_type in territoires.items():
+        for territoire, data in territoires_type.items():
+            territories_data.append({
+                'Territoire': territoire,
+                'Type': type_territoire,
+                'Population': data['population'],
+                'PIB_Habitant': data['pib_habitant'],
+                'Taux_Chomage': data['taux_chomage'],
+                'IDH': data['indice_developpement']
+            })
+
+    return pd.DataFrame(territories_data)
+
+
+def territories_digest(territoires):
+    """Empreinte des données territoriales servant de clé à l'artefact"""
+    payload = json.dumps(territoires, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SegmentationArtifact:
+    """Scaler, centroïdes et étiquettes d'une segmentation ajustée"""
+
+    def __init__(self, digest, scaler_mean, scaler_scale, centroids, territories, labels):
+        self.digest = digest
+        self.scaler_mean = np.asarray(scaler_mean, dtype=np.float64)
+        self.scaler_scale = np.asarray(scaler_scale, dtype=np.float64)
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        self.territories = [str(name) for name in territories]
+        self.labels = np.asarray(labels, dtype=np.int64)
+
+    def labels_for(self, territories):
+        """Étiquettes des territoires donnés, dans leur ordre"""
+        by_name = dict(zip(self.territories, self.labels))
+        return np.array([by_name[name] for name in territories], dtype=np.int64)
+
+    def assign(self, features):
+        """Affecte de nouveaux territoires au centroïde le plus proche"""
+        if isinstance(features, pd.DataFrame):
+            features = features[FEATURES].values
+        scaled = (np.atleast_2d(np.asarray(features, dtype=np.float64)) - self.scaler_mean) / self.scaler_scale
+        distances = ((scaled[:, None, :] - self.centroids[None, :, :]) ** 2).sum(axis=2)
+        return distances.argmin(axis=1)
+
+    def save(self, path):
+        """Écrit l'artefact de façon atomique"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as handle:
+            np.savez(
+                handle,
+                version=np.array(ARTIFACT_VERSION),
+                digest=np.array(self.digest),
+                scaler_mean=self.scaler_mean,
+                scaler_scale=self.scaler_scale,
+                centroids=self.centroids,
+                territories=np.array(self.territories),
+                labels=self.labels
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Relit un artefact écrit par save()"""
+        with np.load(path, allow_pickle=False) as data:
+            if int(data['version']) != ARTIFACT_VERSION:
+                raise ValueError(f"Version d'artefact inattendue dans {path}")
+            return cls(
+                str(data['digest']),
+                data['scaler_mean'],
+                data['scaler_scale'],
+                data['centroids'],
+                data['territories'].tolist(),
+                data['labels']
+            )
+
+
+def fit_segmentation(df_territoires, digest):
+    """Ajuste le scaler et le K-means sur les caractéristiques des territoires"""
+    preprocessing = lazy_import('sklearn.preprocessing')
+    cluster = lazy_import('sklearn.cluster')
+
+    scaler = preprocessing.StandardScaler()
+    X_scaled = scaler.fit_transform(df_territoires[FEATURES])
+
+    kmeans = cluster.KMeans(n_clusters=N_CLUSTERS, random_state=42)
+    labels = kmeans.fit_predict(X_scaled)
+
+    return SegmentationArtifact(
+        digest, scaler.mean_, scaler.scale_, kmeans.cluster_centers_,
+        df_territoires['Territoire'].tolist(), labels
+    )
+
+
+def artifact_path(digest, artifact_dir=None):
+    """Chemin de l'artefact pour une empreinte de données"""
+    artifact_dir = artifact_dir or os.environ.get('FEDER_ARTIFACT_DIR', DEFAULT_ARTIFACT_DIR)
+    return os.path.join(artifact_dir, f"segmentation-v{ARTIFACT_VERSION}-{digest[:16]}.npz")
+
+
+_artifacts = {}
+_lock = threading.Lock()
+
+
+def load_or_fit_segmentation(territoires, artifact_dir=None):
+    """Retourne la segmentation depuis la mémoire, le disque ou un nouvel ajustement"""
+    digest = territories_digest(territoires)
+    with _lock:
+        artifact = _artifacts.get(digest)
+        if artifact is not None:
+            return artifact
+
+        path = artifact_path(digest, artifact_dir)
+        artifact = None
+        if os.path.exists(path):
+            try:
+                artifact = SegmentationArtifact.load(path)
+            except (OSError, ValueError, KeyError):
+                artifact = None
+            if artifact is not None and artifact.digest != digest:
+                artifact = None
+
+        if artifact is None:
+            artifact = fit_segmentation(territory_frame(territoires), digest)
+            try:
+                artifact.save(path)
+            except OSError:
+                # Répertoire en lecture seule : l'artefact reste en mémoire pour ce processus
+                pass
+
+        _artifacts[digest] = artifact
+        return artifact
@@ -0,0 +1,20 @@
+"""Service de données de session, partagé par les pages d'une application multipage"""
+import streamlit as st
+
+SESSION_KEY = 'feder_data_service'
+
+
+def get_data_service(factory=None):
+    """Retourne le service de la session ; le crée avec factory au premier accès
+
+    Les pages appellent get_data_service() sans argument : le script principal l'a
+    déjà créé avant de déléguer à la page active. Un service d'une autre classe
+    (script rechargé après modification) est reconstruit.
+    """
+    service = st.session_state.get(SESSION_KEY)
+    if factory is not None and not isinstance(service, factory):
+        service = factory()
+        st.session_state[SESSION_KEY] = service
+    if service is None:
+        raise RuntimeError("Service de données absent : lancer l'application par son script principal")
+    return service
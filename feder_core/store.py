@@ -0,0 +1,238 @@
+"""Stockage colonne (Parquet/Arrow) des séries programmes et territoires
+
+Chaque jeu de données est un fichier Parquet dont chaque groupe de lignes contient
+une seule clé (programme ou territoire). La lecture ouvre le fichier en mémoire
+mappée et ne décode que les colonnes et groupes de lignes demandés.
+
+    FEDER_STORE_DIR=/data/feder python -m feder_core.store /data/feder
+"""
+import json
+import os
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+from feder_core.batch import LABEL_COLUMNS, combine_long
+from feder_core.imports import lazy_import
+from feder_core.schema import enforce_schema
+
+# Colonne technique portant la clé de chaque ligne dans les fichiers Parquet
+KEY_COLUMN = '_cle'
+KEYS_METADATA = b'feder_keys'
+
+
+def key_to_str(key):
+    """Représentation texte d'une clé (les clés territoriales sont des tuples)"""
+    return '|'.join(key) if isinstance(key, tuple) else str(key)
+
+
+def order_by_keys(frame, keys):
+    """Lignes et libellés catégoriels dans l'ordre des clés demandé, sans la colonne technique"""
+    positions = {key_to_str(key): position for position, key in enumerate(keys)}
+    order = np.argsort(frame[KEY_COLUMN].astype(str).map(positions).to_numpy(), kind='stable')
+    frame = frame.take(order).drop(columns=KEY_COLUMN).reset_index(drop=True)
+    for column in frame.columns:
+        if isinstance(frame[column].dtype, pd.CategoricalDtype):
+            # Ordre d'apparition : ordre des légendes des graphiques
+            frame[column] = frame[column].cat.reorder_categories(list(dict.fromkeys(frame[column])))
+    return frame
+
+
+def _project(frame, columns):
+    if columns is None:
+        return frame
+    return frame[[column for column in columns if column in frame.columns]]
+
+
+class GeneratorSource:
+    """Source adossée aux générateurs Python : un constructeur de colonnes par jeu de données"""
+
+    def __init__(self, column_builders, key_lists):
+        self.column_builders = column_builders
+        self.key_lists = key_lists
+
+    def datasets(self):
+        return list(self.column_builders)
+
+    def keys(self, dataset):
+        return list(self.key_lists[dataset]())
+
+    def version(self, dataset):
+        # Générateurs déterministes : les données ne changent pas dans le processus
+        return None
+
+    def read(self, dataset, keys, columns=None, with_keys=False):
+        """Construit le tableau long des clés demandées"""
+        builder = self.column_builders[dataset]
+        column_sets = []
+        for key in keys:
+            data = builder(key)
+            if data is None:
+                continue
+            if with_keys:
+                data = {**data, KEY_COLUMN: key_to_str(key)}
+            column_sets.append(data)
+
+        label_columns = LABEL_COLUMNS + ((KEY_COLUMN,) if with_keys else ())
+        frame = combine_long(column_sets, label_columns)
+        return _project(frame, None if columns is None else list(columns) + ([KEY_COLUMN] if with_keys else []))
+
+
+class ColumnarStore:
+    """Répertoire de fichiers Parquet, un par jeu de données"""
+
+    def __init__(self, root):
+        self.root = root
+        self._files = {}
+        self._lock = threading.Lock()
+
+    def path(self, dataset):
+        return os.path.join(self.root, f"{dataset}.parquet")
+
+    def has(self, dataset):
+        return os.path.exists(self.path(dataset))
+
+    def version(self, dataset):
+        """(mtime en ns, taille) du fichier : change à chaque réécriture"""
+        stat = os.stat(self.path(dataset))
+        return stat.st_mtime_ns, stat.st_size
+
+    def write(self, dataset, frame):
+        """Écrit un tableau long portant KEY_COLUMN, un groupe de lignes par clé"""
+        pa = lazy_import('pyarrow')
+
+        frame = frame.copy()
+        for column in frame.columns:
+            if frame[column].dtype.name == 'category':
+                frame[column] = frame[column].astype(str)
+
+        # Les lignes d'une même clé sont contiguës : bornes de chaque groupe
+        key_values = frame[KEY_COLUMN].to_numpy()
+        starts = np.flatnonzero(np.r_[True, key_values[1:] != key_values[:-1]])
+        stops = np.r_[starts[1:], len(frame)]
+        keys = [str(key_values[start]) for start in starts]
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            KEYS_METADATA: json.dumps(keys, ensure_ascii=False).encode('utf-8')
+        })
+
+        self.write_stream(dataset, (table.slice(start, stop - start) for start, stop in zip(starts, stops)))
+
+    def write_stream(self, dataset, tables):
+        """Écrit une suite de tables Arrow de même schéma, un groupe de lignes par table"""
+        pq = lazy_import('pyarrow.parquet')
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.path(dataset)}.{os.getpid()}.tmp"
+
+        writer = None
+        rows = 0
+        try:
+            for table in tables:
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema)
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+                rows += table.num_rows
+        except BaseException:
+            if writer is not None:
+                writer.close()
+                os.remove(tmp_path)
+            raise
+
+        # Flux vide : le fichier précédent reste en place
+        if writer is None:
+            return 0
+        writer.close()
+        os.replace(tmp_path, self.path(dataset))
+
+        with self._lock:
+            self._files.pop(dataset, None)
+        return rows
+
+    def _open(self, dataset):
+        """ParquetFile mappé en mémoire, rouvert si le fichier a changé"""
+        pq = lazy_import('pyarrow.parquet')
+        path = self.path(dataset)
+        version = self.version(dataset)
+        with self._lock:
+            cached = self._files.get(dataset)
+            if cached is None or cached[0] != version:
+                parquet_file = pq.ParquetFile(path, memory_map=True)
+                metadata = parquet_file.schema_arrow.metadata or {}
+                keys = json.loads(metadata.get(KEYS_METADATA, b'[]'))
+                cached = (version, parquet_file, {key: index for index, key in enumerate(keys)})
+                self._files[dataset] = cached
+            return cached[1], cached[2]
+
+    def keys(self, dataset):
+        return list(self._open(dataset)[1])
+
+    def read(self, dataset, keys=None, columns=None, with_keys=False):
+        """Lit uniquement les groupes de lignes des clés et les colonnes demandées"""
+        parquet_file, row_groups = self._open(dataset)
+        if keys is None:
+            indices = list(range(parquet_file.num_row_groups))
+        else:
+            indices = [row_groups[key_to_str(key)] for key in keys if key_to_str(key) in row_groups]
+
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns) + ([KEY_COLUMN] if with_keys else [])
+
+        table = parquet_file.read_row_groups(indices, columns=read_columns)
+        frame = table.to_pandas()
+        if not with_keys and KEY_COLUMN in frame.columns:
+            frame = frame.drop(columns=KEY_COLUMN)
+        # Les stockages écrits avant le schéma typé sont convertis à la lecture
+        return enforce_schema(frame)
+
+
+class StoreSource:
+    """Lit depuis le stockage colonne, ou depuis la source de repli si le jeu manque"""
+
+    def __init__(self, store, fallback):
+        self.store = store
+        self.fallback = fallback
+
+    def datasets(self):
+        return self.fallback.datasets()
+
+    def keys(self, dataset):
+        return self.store.keys(dataset) if self.store.has(dataset) else self.fallback.keys(dataset)
+
+    def version(self, dataset):
+        return self.store.version(dataset) if self.store.has(dataset) else self.fallback.version(dataset)
+
+    def read(self, dataset, keys, columns=None, with_keys=False):
+        if self.store.has(dataset):
+            return self.store.read(dataset, keys, columns, with_keys)
+        return self.fallback.read(dataset, keys, columns, with_keys)
+
+
+def open_data_source(generator_source, root=None):
+    """Source configurée : stockage colonne si FEDER_STORE_DIR est défini, générateurs sinon"""
+    root = root or os.environ.get('FEDER_STORE_DIR')
+    if not root:
+        return generator_source
+    return StoreSource(ColumnarStore(root), generator_source)
+
+
+def build_store(source, root, datasets=None):
+    """Matérialise les jeux de données d'une source dans un répertoire Parquet"""
+    store = ColumnarStore(root)
+    for dataset in datasets or source.datasets():
+        frame = source.read(dataset, source.keys(dataset), with_keys=True)
+        store.write(dataset, frame)
+    return store
+
+
+if __name__ == "__main__":
+    from feder_core.core import FEDERCore
+
+    target = sys.argv[1] if len(sys.argv) > 1 else os.environ.get('FEDER_STORE_DIR', 'store')
+    built = build_store(FEDERCore().generator_source, target)
+    for name in sorted(os.listdir(built.root)):
+        print(os.path.join(built.root, name))
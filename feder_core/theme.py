@@ -0,0 +1,81 @@
+"""Mise en page commune des dashboards : configuration Streamlit et feuille de style"""
+import streamlit as st
+
+# Feuille de style partagée (cartes, en-têtes, statuts du portail, niveaux de risque)
+DASHBOARD_CSS = """
+<style>
+    .main-header { 
+        font-size: 2.5rem; 
+        background: linear-gradient(45deg, #003399, #0055A4, #0077CC);
+        -webkit-background-clip: text; 
+        -webkit-text-fill-color: transparent; 
+        text-align: center; 
+        margin-bottom: 1rem; 
+        font-weight: bold; 
+    }
+    .eu-card { 
+        background: linear-gradient(135deg, #003399, #0055A4);
+        color: white; 
+        padding: 1.5rem; 
+        border-radius: 15px; 
+        margin: 0.5rem 0; 
+        box-shadow: 0 8px 25px rgba(0,0,0,0.15);
+        border-left: 5px solid #FFCC00;
+    }
+    .program-card {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        margin: 1rem 0;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+    .section-header { 
+        color: #2c3e50; 
+        border-bottom: 3px solid #003399; 
+        padding-bottom: 0.5rem; 
+        margin-top: 2rem; 
+        font-size: 1.5rem; 
+        font-weight: bold;
+    }
+    .api-status {
+        padding: 0.5rem;
+        border-radius: 5px;
+        margin: 0.2rem 0;
+        font-weight: bold;
+    }
+    .api-success { background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
+    .api-warning { background-color: #fff3cd; color: #856404; border: 1px solid #ffeaa7; }
+    .api-error { background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
+    .new-program {
+        background: linear-gradient(135deg, #11998e, #38ef7d);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        margin: 1rem 0;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+    .insight-card {
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        color: white;
+        padding: 1.5rem;
+        border-radius: 15px;
+        margin: 1rem 0;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+    .risk-high { background-color: #f8d7da; color: #721c24; padding: 0.5rem; border-radius: 5px; }
+    .risk-medium { background-color: #fff3cd; color: #856404; padding: 0.5rem; border-radius: 5px; }
+    .risk-low { background-color: #d4edda; color: #155724; padding: 0.5rem; border-radius: 5px; }
+</style>
+"""
+
+
+def configure_page(page_title):
+    """Configure la page et injecte le CSS ; doit précéder tout autre appel Streamlit"""
+    st.set_page_config(
+        page_title=page_title,
+        page_icon="🇪🇺",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    st.markdown(DASHBOARD_CSS, unsafe_allow_html=True)
@@ -0,0 +1,174 @@
+"""Moteur de prévision par séries : choix du modèle par backtest à origine glissante
+
+Quatre modèles sont mis en concurrence sur chaque série (programme, indicateur) :
+tendance linéaire, log-linéaire (croissance géométrique), lissage exponentiel de Holt
+et Holt à tendance amortie. Les paramètres de lissage sont choisis sur une grille,
+évaluée en un seul passage vectorisé. Chaque modèle est rejoué depuis plusieurs origines
+successives ; celui dont l'erreur absolue moyenne en pourcentage (MAPE) est la plus faible
+est retenu. Les backtests des différentes séries tournent dans un pool de processus
+quand leur volume le justifie, et la sélection est conservée par version des données.
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from feder_core.models import data_version, fit_linear, predict_linear
+from feder_core.pool import default_workers, pool_map
+
+DEFAULT_HORIZON = 3
+MIN_TRAIN = 4
+
+# Grille des paramètres de lissage : niveau (alpha), tendance (beta), amortissement (phi)
+SMOOTHING_LEVELS = np.linspace(0.1, 0.9, 9)
+DAMPING_FACTORS = np.array([0.8, 0.85, 0.9, 0.95, 0.98])
+SMOOTHING_GRID_SIZE = len(SMOOTHING_LEVELS) ** 2 * (1 + len(DAMPING_FACTORS))
+
+SeriesSelection = namedtuple('SeriesSelection', ['model', 'errors', 'years', 'prediction'])
+
+
+def forecast_linear(years, values, future_years):
+    """Tendance linéaire (moindres carrés)"""
+    return predict_linear(fit_linear(years, values), future_years)
+
+
+def forecast_log_linear(years, values, future_years):
+    """Croissance géométrique : régression linéaire sur le logarithme de la série"""
+    if np.any(values <= 0):
+        return np.full(len(future_years), np.nan)
+    return np.exp(predict_linear(fit_linear(years, np.log(values)), future_years))
+
+
+def _smoothing(values, alphas, betas, phis):
+    """Holt sur toute la grille à la fois : niveau et tendance finaux de la meilleure combinaison"""
+    level = np.full(len(alphas), values[0])
+    trend = np.full(len(alphas), values[1] - values[0])
+    sse = np.zeros(len(alphas))
+
+    for value in values[1:]:
+        forecast = level + phis * trend
+        sse += (value - forecast) ** 2
+        new_level = alphas * value + (1.0 - alphas) * forecast
+        trend = betas * (new_level - level) + (1.0 - betas) * phis * trend
+        level = new_level
+
+    best = int(np.argmin(sse))
+    return level[best], trend[best], phis[best]
+
+
+def _smoothing_forecast(values, horizon, phis):
+    alphas, betas, phis = (grid.ravel() for grid in np.meshgrid(SMOOTHING_LEVELS, SMOOTHING_LEVELS, phis))
+    level, trend, phi = _smoothing(np.asarray(values, dtype=np.float64), alphas, betas, phis)
+    # Tendance cumulée phi + phi² + ... + phi^h
+    return level + trend * np.cumsum(phi ** np.arange(1, horizon + 1))
+
+
+def forecast_holt(years, values, future_years):
+    """Lissage exponentiel double de Holt (tendance additive)"""
+    return _smoothing_forecast(values, len(future_years), np.array([1.0]))
+
+
+def forecast_damped(years, values, future_years):
+    """Holt à tendance amortie"""
+    return _smoothing_forecast(values, len(future_years), DAMPING_FACTORS)
+
+
+# Nom affiché -> fonction de prévision ; à erreur égale, le premier est retenu
+FORECAST_MODELS = {
+    'Linéaire': forecast_linear,
+    'Log-linéaire': forecast_log_linear,
+    'Holt': forecast_holt,
+    'Holt amorti': forecast_damped
+}
+
+
+def backtest(years, values, horizon=DEFAULT_HORIZON, min_train=MIN_TRAIN):
+    """MAPE (%) de chaque modèle sur les origines glissantes min_train, ..., n - 1"""
+    years = np.asarray(years, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    errors = {}
+
+    for name, forecaster in FORECAST_MODELS.items():
+        predictions, actuals = [], []
+        for origin in range(min(min_train, len(values) - 1), len(values)):
+            stop = min(origin + horizon, len(values))
+            predictions.append(forecaster(years[:origin], values[:origin], years[origin:stop]))
+            actuals.append(values[origin:stop])
+        prediction = np.concatenate(predictions)
+        actual = np.concatenate(actuals)
+
+        # Modèle inapplicable (log d'une série non positive) ou aucune valeur non nulle à comparer
+        observed = actual != 0
+        if np.isnan(prediction).any() or not observed.any():
+            errors[name] = np.inf
+        else:
+            errors[name] = float(np.mean(np.abs(prediction[observed] - actual[observed]) / np.abs(actual[observed])) * 100)
+
+    return errors
+
+
+def select_model(years, values, horizon=DEFAULT_HORIZON):
+    """Backtest puis prévision avec le modèle retenu (exécutable dans un processus séparé)"""
+    years = np.asarray(years, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    errors = backtest(years, values, horizon)
+    model = min(errors, key=errors.get)
+    future_years = years[-1] + np.arange(1, horizon + 1)
+    prediction = FORECAST_MODELS[model](years, values, future_years)
+    return SeriesSelection(model, errors, future_years, prediction)
+
+
+class ForecastSelector:
+    """Modèle retenu par (programme, indicateur, version des données, horizon)"""
+
+    def __init__(self, workers=None):
+        self.workers = workers or default_workers('FEDER_FORECAST_WORKERS')
+        self._selections = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def select_many(self, series, horizon=DEFAULT_HORIZON):
+        """Sélectionne les modèles de plusieurs séries : {(programme, indicateur): (années, valeurs)}"""
+        keys = {
+            name: (*name, data_version(years, values), horizon)
+            for name, (years, values) in series.items()
+        }
+        with self._lock:
+            missing = [name for name, key in keys.items() if key not in self._selections]
+            self.hits += len(series) - len(missing)
+
+        if missing:
+            # Backtests des séries manquantes répartis sur le pool de processus ; chaque
+            # origine rejoue le lissage sur toute la grille : coût ~ longueur² × grille
+            selections = pool_map(
+                select_model,
+                ((series[name][0], series[name][1], horizon) for name in missing),
+                self.workers,
+                work=sum(len(series[name][1]) ** 2 for name in missing) * SMOOTHING_GRID_SIZE
+            )
+            with self._lock:
+                self.misses += len(missing)
+                for name, selection in zip(missing, selections):
+                    self._selections[keys[name]] = selection
+
+        with self._lock:
+            return {name: self._selections[key] for name, key in keys.items()}
+
+    def invalidate(self):
+        """Supprime toutes les sélections"""
+        with self._lock:
+            self._selections.clear()
+
+    def stats(self):
+        """Retourne les compteurs du cache"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._selections)}
+
+
+_forecast_selector = ForecastSelector()
+
+
+def get_forecast_selector():
+    """Retourne le sélecteur de modèles du processus"""
+    return _forecast_selector
@@ -0,0 +1,1337 @@
+"""Vues Streamlit partagées par les dashboards FEDER
+
+DashboardViews s'utilise avec FEDERCore : chaque page compose les deux et choisit
+les vues qu'elle expose dans sa navigation.
+"""
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from feder_core.correlation import METHODS, POOLED_KEY
+from feder_core.export import EXPORT_FORMATS, available_formats, export_bytes, export_file_name
+from feder_core.figures import frame_version
+from feder_core.health import get_portal_monitor, STATUS_OK, STATUS_LIMITED, STATUS_OFFLINE
+from feder_core.reference import PERFORMANCE_INDICATORS
+from feder_core.roi import DEFAULT_SWEEP_LEVELS, DEFAULT_SWEEP_SPAN, DEFAULT_UNIT_VALUES, DEFAULT_WEIGHTS, ROI_DIMENSIONS
+from feder_core.roi import heatmap_frame, scenario_totals, tornado_frame
+
+
+class DashboardViews:
+    """Sections d'affichage communes (en-tête, cartes, analyses, benchmarking)"""
+
+    # Titres de l'en-tête, redéfinis par chaque page
+    HEADER_TITLE = "DASHBOARD FEDER EUROPE"
+    HEADER_SUBTITLE = "Fonds Européen de Développement Régional - Analyse des Programmes 2014-2027"
+    
+    def display_header(self):
+        """Affiche l'en-tête du dashboard"""
+        st.markdown(f'<h1 class="main-header">🇪🇺 {self.HEADER_TITLE}</h1>', unsafe_allow_html=True)
+        st.markdown(f"""
+        <div style='text-align: center; background: linear-gradient(45deg, #003399, #0055A4); color: white; padding: 1rem; border-radius: 10px; margin-bottom: 2rem;'>
+            <h3>{self.HEADER_SUBTITLE}</h3>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    def display_portal_status(self):
+        """Affiche le dernier statut connu du portail (sondé en arrière-plan)"""
+        st.sidebar.markdown("### 🔌 Statut des Données")
+        
+        status = get_portal_monitor().status()['status']
+        
+        if status == STATUS_OK:
+            st.sidebar.markdown('<div class="api-status api-success">✅ Portail FEDER - Accessible</div>', unsafe_allow_html=True)
+        elif status == STATUS_LIMITED:
+            st.sidebar.markdown('<div class="api-status api-warning">⚠️ Portail FEDER - Limité</div>', unsafe_allow_html=True)
+        elif status == STATUS_OFFLINE:
+            st.sidebar.markdown('<div class="api-status api-error">❌ Portail FEDER - Hors ligne</div>', unsafe_allow_html=True)
+        else:
+            st.sidebar.markdown('<div class="api-status api-warning">⏳ Portail FEDER - Vérification en cours</div>', unsafe_allow_html=True)
+    
+    def display_export_buttons(self, df, name):
+        """Boutons de téléchargement du tableau ; le fichier n'est produit qu'au clic"""
+        formats = available_formats()
+        for col, fmt in zip(st.columns(len(formats)), formats):
+            with col:
+                st.download_button(
+                    f"⬇️ {fmt.upper()}",
+                    data=lambda fmt=fmt: export_bytes(df, fmt),
+                    file_name=export_file_name(name, fmt),
+                    mime=EXPORT_FORMATS[fmt][1],
+                    key=f"export_{name}_{fmt}",
+                    on_click='ignore'
+                )
+    
+    def display_program_cards(self):
+        """Affiche les cartes des programmes spécifiques"""
+        st.markdown('<h3 class="section-header">🎯 PROGRAMMES FEDER SPÉCIFIQUES</h3>', unsafe_allow_html=True)
+        
+        cols = st.columns(3)
+        
+        for i, (program_id, program_info) in enumerate(self.specific_programs.items()):
+            with cols[i]:
+                st.markdown(f"""
+                <div class="program-card">
+                    <h4>📋 {program_info['territory']}</h4>
+                    <p><strong>{program_info['name']}</strong></p>
+                    <p>Budget total: <strong>{program_info['total_budget']} M€</strong></p>
+                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
+                    <p>Thèmes: {', '.join(program_info['themes'])}</p>
+                    <div style="margin-top: 1rem;">
+                        <a href="{program_info['url']}" target="_blank" style="color: white; text-decoration: underline;">
+                            🔗 Voir sur le portail UE
+                        </a>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    def display_drom_com_cards(self):
+        """Affiche les cartes des programmes 2021-2027 pour les DROM COM"""
+        st.markdown('<h3 class="section-header">🆕 PROGRAMMES FEDER 2021-2027 - DROM COM</h3>', unsafe_allow_html=True)
+        
+        cols = st.columns(2)
+        
+        for i, (program_id, program_info) in enumerate(self.drom_com_programs.items()):
+            with cols[i]:
+                st.markdown(f"""
+                <div class="new-program">
+                    <h4>📋 {program_info['territory']}</h4>
+                    <p><strong>{program_info['name']}</strong></p>
+                    <p>Budget total: <strong>{program_info['total_budget']} M€</strong></p>
+                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
+                    <p>Thèmes: {', '.join(program_info['themes'])}</p>
+                    <p>Territoires: {', '.join(program_info['territoires_cibles'])}</p>
+                    <div style="margin-top: 1rem;">
+                        <a href="{program_info['url']}" target="_blank" style="color: white; text-decoration: underline;">
+                            🔗 Voir sur le portail UE
+                        </a>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    def display_key_metrics(self, df, title="MÉTRIQUES CLÉS"):
+        """Affiche les métriques clés FEDER"""
+        st.markdown(f'<h3 class="section-header">📊 {title}</h3>', unsafe_allow_html=True)
+        
+        if df is not None:
+            total_budget = df['Budget_Total'].sum()
+            total_projects = df['Projets_Finances'].sum()
+            total_jobs = df['Emplois_Crees'].sum()
+            eu_contribution = df['Contribution_UE'].sum()
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.markdown(f"""
+                <div class="eu-card">
+                    <h4>💰 Budget Total</h4>
+                    <div style="font-size: 1.8rem; font-weight: bold;">{total_budget:.1f} M€</div>
+                    <p>Période analysée</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.markdown(f"""
+                <div class="eu-card">
+                    <h4>📋 Projets Financés</h4>
+                    <div style="font-size: 1.8rem; font-weight: bold;">{total_projects:.0f}</div>
+                    <p>Projets soutenus</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col3:
+                st.markdown(f"""
+                <div class="eu-card">
+                    <h4>👥 Emplois Créés</h4>
+                    <div style="font-size: 1.8rem; font-weight: bold;">{total_jobs:.0f}</div>
+                    <p>Emplois directs et indirects</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col4:
+                st.markdown(f"""
+                <div class="eu-card">
+                    <h4>🇪🇺 Contribution UE</h4>
+                    <div style="font-size: 1.8rem; font-weight: bold;">{eu_contribution:.1f} M€</div>
+                    <p>{(eu_contribution/total_budget*100):.1f}% du total</p>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    def display_overview(self):
+        """Affiche la synthèse des programmes et les indicateurs clés"""
+        st.markdown('<h3 class="section-header">📊 SYNTHÈSE DES PROGRAMMES FEDER</h3>', unsafe_allow_html=True)
+        
+        # Cartes des programmes
+        cols = st.columns(3)
+        for i, (program_id, program_info) in enumerate(list(self.specific_programs.items())[:3]):
+            with cols[i]:
+                st.markdown(f"""
+                <div class="program-card">
+                    <h4>📋 {program_info['territory']}</h4>
+                    <p><strong>{program_info['name']}</strong></p>
+                    <p>Budget: <strong>{program_info['total_budget']} M€</strong></p>
+                    <p>Contribution UE: <strong>{program_info['eu_contribution']} M€</strong></p>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Indicateurs clés
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown("""
+            <div class="eu-card">
+                <h4>💰 Budget Total</h4>
+                <div style="font-size: 1.8rem; font-weight: bold;">2 050 M€</div>
+                <p>Tous programmes confondus</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div class="eu-card">
+                <h4>📋 Projets</h4>
+                <div style="font-size: 1.8rem; font-weight: bold;">1 250</div>
+                <p>Projets financés</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown("""
+            <div class="eu-card">
+                <h4>👥 Emplois</h4>
+                <div style="font-size: 1.8rem; font-weight: bold;">4 500</div>
+                <p>Emplois créés</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown("""
+            <div class="eu-card">
+                <h4>🇪🇺 UE</h4>
+                <div style="font-size: 1.8rem; font-weight: bold;">75%</div>
+                <p>Taux de cofinancement</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Insights clés
+        st.markdown('<h3 class="section-header">💡 INSIGHTS CLÉS</h3>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("""
+            <div class="insight-card">
+                <h4>🎯 Performance Élevée</h4>
+                <p>Les programmes FEDER affichent un taux de réalisation moyen de 85%, dépassant les objectifs initiaux.</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown("""
+            <div class="insight-card">
+                <h4>📈 Croissance Soutenue</h4>
+                <p>Les investissements FEDER génèrent un retour économique estimé à 3.2x le montant investi.</p>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    def create_territory_dashboard(self):
+        """Affiche le tableau de bord d'un territoire choisi dans la barre latérale"""
+        # Sélection du territoire
+        st.sidebar.markdown("## 🗺️ Sélection du Territoire")
+        
+        type_territoire = st.sidebar.selectbox(
+            "Type de Territoire:",
+            ["DROM", "COM"]
+        )
+        
+        territoire = st.sidebar.selectbox(
+            "Territoire:",
+            list(self.territoires[type_territoire].keys())
+        )
+        
+        # Génération des données
+        df = self.generate_territory_data(territoire, type_territoire)
+        
+        # Affichage des données
+        self.display_key_metrics(df, f"MÉTRIQUES - {territoire}")
+        
+        # Graphiques du territoire
+        st.markdown('<h3 class="section-header">📈 ÉVOLUTION DES INDICATEURS</h3>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig_budget = px.line(
+                df, 
+                x='Année', 
+                y=['Budget_Total', 'Contribution_UE'],
+                title=f'Évolution des Financements - {territoire}',
+                markers=True
+            )
+            fig_budget.update_layout(height=400)
+            st.plotly_chart(fig_budget, use_container_width=True)
+        
+        with col2:
+            fig_results = px.line(
+                df,
+                x='Année',
+                y=['Projets_Finances', 'Emplois_Crees'],
+                title=f'Résultats des Projets - {territoire}',
+                markers=True
+            )
+            fig_results.update_layout(height=400)
+            st.plotly_chart(fig_results, use_container_width=True)
+    
+    def create_program_page(self):
+        """Affiche le programme 2014-2020 choisi dans la barre latérale"""
+        st.sidebar.markdown("## 🎯 Sélection du Programme")
+        
+        selected_program = st.sidebar.selectbox(
+            "Programme:",
+            list(self.specific_programs.keys()),
+            format_func=lambda x: self.specific_programs[x]['territory']
+        )
+        
+        self.create_program_details(selected_program)
+    
+    def create_drom_com_page(self):
+        """Affiche le programme DROM COM choisi, suivi de la comparaison 2021-2027"""
+        st.sidebar.markdown("## 🆕 Sélection du Programme DROM COM")
+        
+        selected_program = st.sidebar.selectbox(
+            "Programme:",
+            list(self.drom_com_programs.keys()),
+            format_func=lambda x: self.drom_com_programs[x]['territory']
+        )
+        
+        self.create_drom_com_details(selected_program)
+        
+        # Ajout d'une section de comparaison
+        st.markdown("---")
+        self.create_drom_com_comparison()
+    
+    def create_comparison_charts(self):
+        """Crée des graphiques comparatifs entre les programmes"""
+        st.markdown('<h3 class="section-header">📈 COMPARAISON DES PROGRAMMES FEDER</h3>', unsafe_allow_html=True)
+        
+        combined_data = self.generate_programs_batch(
+            self.specific_programs.keys(),
+            columns=['Année', 'Territoire', 'Budget_Total', 'Contribution_UE', 'Projets_Finances', 'Emplois_Crees']
+        )
+        data_version = frame_version(combined_data)
+        
+        # Graphique 1: Évolution des budgets
+        fig1 = self.figure_cache.get_or_build(
+            'comparaison.evolution_budgets', data_version,
+            lambda: px.line(
+                combined_data, 
+                x='Année', 
+                y='Budget_Total', 
+                color='Territoire',
+                title='Évolution des Budgets FEDER par Programme (M€)',
+                markers=True
+            ).update_layout(height=400)
+        )
+        st.plotly_chart(fig1, use_container_width=True)
+        
+        # Graphique 2: Comparaison des totaux
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            totals = combined_data.groupby('Territoire').agg({
+                'Budget_Total': 'sum',
+                'Contribution_UE': 'sum'
+            }).reset_index()
+            
+            fig2 = self.figure_cache.get_or_build(
+                'comparaison.totaux_budgets', data_version,
+                lambda: px.bar(
+                    totals,
+                    x='Territoire',
+                    y=['Budget_Total', 'Contribution_UE'],
+                    title='Budget Total et Contribution UE par Programme (M€)',
+                    barmode='group'
+                ).update_layout(height=400)
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        with col2:
+            results = combined_data.groupby('Territoire').agg({
+                'Projets_Finances': 'sum',
+                'Emplois_Crees': 'sum'
+            }).reset_index()
+            
+            fig3 = self.figure_cache.get_or_build(
+                'comparaison.projets_emplois', data_version,
+                lambda: px.bar(
+                    results,
+                    x='Territoire',
+                    y=['Projets_Finances', 'Emplois_Crees'],
+                    title='Projets Financés et Emplois Créés',
+                    barmode='group'
+                ).update_layout(height=400)
+            )
+            st.plotly_chart(fig3, use_container_width=True)
+    
+    def create_program_details(self, program_id):
+        """Affiche les détails d'un programme spécifique"""
+        program_info = self.specific_programs[program_id]
+        program_data = self.generate_program_data(program_id)
+        
+        st.markdown(f'<h3 class="section-header">📋 DÉTAILS DU PROGRAMME - {program_info["territory"].upper()}</h3>', unsafe_allow_html=True)
+        
+        # Métriques du programme
+        self.display_key_metrics(program_data, f"MÉTRIQUES - {program_info['territory']}")
+        
+        # Graphiques spécifiques au programme
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig_budget = px.area(
+                program_data, 
+                x='Année', 
+                y=['Budget_Total', 'Contribution_UE', 'Cofinancement_Local'],
+                title=f'Évolution des Financements - {program_info["territory"]}',
+                color_discrete_map={
+                    'Budget_Total': '#003399',
+                    'Contribution_UE': '#0055A4', 
+                    'Cofinancement_Local': '#FFCC00'
+                }
+            )
+            fig_budget.update_layout(height=400)
+            st.plotly_chart(fig_budget, use_container_width=True)
+        
+        with col2:
+            fig_results = go.Figure()
+            fig_results.add_trace(go.Scatter(
+                x=program_data['Année'], y=program_data['Projets_Finances'],
+                name='Projets Financés', line=dict(color='#28a745')
+            ))
+            fig_results.add_trace(go.Scatter(
+                x=program_data['Année'], y=program_data['Emplois_Crees'],
+                name='Emplois Créés', line=dict(color='#dc3545'),
+                yaxis='y2'
+            ))
+            
+            fig_results.update_layout(
+                title=f'Résultats - {program_info["territory"]}',
+                xaxis_title='Année',
+                yaxis_title='Nombre de Projets',
+                yaxis2=dict(title='Emplois Créés', overlaying='y', side='right'),
+                height=400
+            )
+            st.plotly_chart(fig_results, use_container_width=True)
+        
+        # Informations sur le programme
+        st.markdown("#### 📝 Informations du Programme")
+        col_info1, col_info2 = st.columns(2)
+        
+        with col_info1:
+            st.metric("Type de programme", program_info["type"])
+            st.metric("Période de programmation", "2014-2020")
+            st.metric("Taux de cofinancement UE", "75%")
+        
+        with col_info2:
+            st.metric("Thèmes principaux", ", ".join(program_info["themes"]))
+            st.metric("Lien vers le portail", f"[Voir le programme]({program_info['url']})")
+    
+    def create_drom_com_details(self, program_id):
+        """Affiche les détails d'un programme DROM COM 2021-2027"""
+        program_info = self.drom_com_programs[program_id]
+        program_data = self.generate_drom_com_data(program_id)
+        
+        st.markdown(f'<h3 class="section-header">📋 DÉTAILS DU PROGRAMME - {program_info["territory"].upper()} 2021-2027</h3>', unsafe_allow_html=True)
+        
+        # Métriques du programme
+        self.display_key_metrics(program_data, f"MÉTRIQUES - {program_info['territory']} 2021-2027")
+        
+        # Graphiques spécifiques au programme
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig_budget = px.area(
+                program_data, 
+                x='Année', 
+                y=['Budget_Total', 'Contribution_UE', 'Cofinancement_Local'],
+                title=f'Évolution des Financements - {program_info["territory"]} 2021-2027',
+                color_discrete_map={
+                    'Budget_Total': '#11998e',
+                    'Contribution_UE': '#38ef7d', 
+                    'Cofinancement_Local': '#FFCC00'
+                }
+            )
+            fig_budget.update_layout(height=400)
+            st.plotly_chart(fig_budget, use_container_width=True)
+        
+        with col2:
+            fig_results = go.Figure()
+            fig_results.add_trace(go.Scatter(
+                x=program_data['Année'], y=program_data['Projets_Finances'],
+                name='Projets Financés', line=dict(color='#28a745')
+            ))
+            fig_results.add_trace(go.Scatter(
+                x=program_data['Année'], y=program_data['Emplois_Crees'],
+                name='Emplois Créés', line=dict(color='#dc3545'),
+                yaxis='y2'
+            ))
+            
+            fig_results.update_layout(
+                title=f'Résultats - {program_info["territory"]} 2021-2027',
+                xaxis_title='Année',
+                yaxis_title='Nombre de Projets',
+                yaxis2=dict(title='Emplois Créés', overlaying='y', side='right'),
+                height=400
+            )
+            st.plotly_chart(fig_results, use_container_width=True)
+        
+        # Informations sur le programme
+        st.markdown("#### 📝 Informations du Programme")
+        col_info1, col_info2 = st.columns(2)
+        
+        with col_info1:
+            st.metric("Type de programme", program_info["type"])
+            st.metric("Période de programmation", "2021-2027")
+            st.metric("Taux de cofinancement UE", "75%")
+        
+        with col_info2:
+            st.metric("Thèmes principaux", ", ".join(program_info["themes"]))
+            st.metric("Territoires cibles", ", ".join(program_info["territoires_cibles"]))
+            st.metric("Lien vers le portail", f"[Voir le programme]({program_info['url']})")
+        
+        # Tableau des territoires cibles
+        st.markdown("#### 🗺️ Répartition par Territoire Cible")
+        
+        if program_info["type"] == "DROM":
+            territoires_data = {
+                'Territoire': program_info["territoires_cibles"],
+                'Budget_Alloué': [250, 300, 280, 220, 200],  # Millions d'euros
+                'Projets_Prevus': [90, 105, 98, 77, 70],
+                'Objectifs_Emplois': [700, 800, 750, 580, 530]
+            }
+        else:  # COM
+            territoires_data = {
+                'Territoire': program_info["territoires_cibles"],
+                'Budget_Alloué': [70, 50, 80, 75, 75],  # Millions d'euros
+                'Projets_Prevus': [26, 18, 30, 28, 28],
+                'Objectifs_Emplois': [200, 140, 240, 225, 225]
+            }
+        
+        df_territoires = pd.DataFrame(territoires_data)
+        st.dataframe(df_territoires, use_container_width=True)
+        self.display_export_buttons(df_territoires, f"repartition_{program_id}")
+        
+        # Graphique de répartition
+        fig_repartition = self.figure_cache.get_or_build(
+            f'drom_com.repartition.{program_id}', frame_version(df_territoires),
+            lambda: px.bar(
+                df_territoires,
+                x='Territoire',
+                y='Budget_Alloué',
+                title=f'Répartition du Budget par Territoire - {program_info["territory"]} (M€)',
+                color='Budget_Alloué',
+                color_continuous_scale='Viridis'
+            ).update_layout(height=400)
+        )
+        st.plotly_chart(fig_repartition, use_container_width=True)
+    
+    def create_efficiency_analysis(self):
+        """Analyse l'efficacité des programmes"""
+        st.markdown('<h3 class="section-header">📊 ANALYSE D\'EFFICACITÉ</h3>', unsafe_allow_html=True)
+        
+        combined_data = self.generate_programs_batch(
+            self.specific_programs.keys(),
+            columns=['Année', 'Territoire', 'Budget_Total', 'Projets_Finances', 'Emplois_Crees']
+        )
+        
+        # Calcul des indicateurs d'efficacité
+        combined_data['Efficacite_Emploi'] = combined_data['Emplois_Crees'] / combined_data['Budget_Total']
+        combined_data['Efficacite_Projet'] = combined_data['Projets_Finances'] / combined_data['Budget_Total']
+        combined_data['Cout_Emploi'] = combined_data['Budget_Total'] / combined_data['Emplois_Crees']
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Efficacité moyenne par programme
+            efficacite_moyenne = combined_data.groupby('Territoire').agg({
+                'Efficacite_Emploi': 'mean',
+                'Efficacite_Projet': 'mean'
+            }).reset_index()
+            
+            fig_eff = self.figure_cache.get_or_build(
+                'efficacite.moyenne', frame_version(efficacite_moyenne),
+                lambda: px.bar(
+                    efficacite_moyenne,
+                    x='Territoire',
+                    y=['Efficacite_Emploi', 'Efficacite_Projet'],
+                    title='Efficacité Moyenne des Programmes',
+                    labels={'value': 'Valeur', 'variable': 'Indicateur'},
+                    barmode='group'
+                ).update_layout(height=400)
+            )
+            st.plotly_chart(fig_eff, use_container_width=True)
+        
+        with col2:
+            # Coût par emploi créé
+            cout_emploi = combined_data.groupby('Territoire')['Cout_Emploi'].mean().reset_index()
+            
+            fig_cout = self.figure_cache.get_or_build(
+                'efficacite.cout_emploi', frame_version(cout_emploi),
+                lambda: px.bar(
+                    cout_emploi,
+                    x='Territoire',
+                    y='Cout_Emploi',
+                    title='Coût Moyen par Emploi Créé (M€/emploi)',
+                    color='Cout_Emploi',
+                    color_continuous_scale='Viridis'
+                ).update_layout(height=400)
+            )
+            st.plotly_chart(fig_cout, use_container_width=True)
+    
+    def create_drom_com_comparison(self):
+        """Crée une comparaison entre les programmes DROM COM 2021-2027"""
+        st.markdown('<h3 class="section-header">📈 COMPARAISON DES PROGRAMMES DROM COM 2021-2027</h3>', unsafe_allow_html=True)
+        
+        combined_data = self.generate_programs_batch(
+            self.drom_com_programs.keys(), 'drom_com',
+            columns=['Année', 'Territoire', 'Budget_Total', 'Contribution_UE', 'Projets_Finances', 'Emplois_Crees']
+        )
+        
+        # Graphique 1: Évolution des budgets
+        fig1 = px.line(
+            combined_data, 
+            x='Année', 
+            y='Budget_Total', 
+            color='Territoire',
+            title='Évolution des Budgets FEDER par Programme DROM COM (M€)',
+            markers=True
+        )
+        fig1.update_layout(height=400)
+        st.plotly_chart(fig1, use_container_width=True)
+        
+        # Graphique 2: Comparaison des totaux
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            totals = combined_data.groupby('Territoire').agg({
+                'Budget_Total': 'sum',
+                'Contribution_UE': 'sum'
+            }).reset_index()
+            
+            fig2 = px.bar(
+                totals,
+                x='Territoire',
+                y=['Budget_Total', 'Contribution_UE'],
+                title='Budget Total et Contribution UE par Programme DROM COM (M€)',
+                barmode='group'
+            )
+            fig2.update_layout(height=400)
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        with col2:
+            results = combined_data.groupby('Territoire').agg({
+                'Projets_Finances': 'sum',
+                'Emplois_Crees': 'sum'
+            }).reset_index()
+            
+            fig3 = px.bar(
+                results,
+                x='Territoire',
+                y=['Projets_Finances', 'Emplois_Crees'],
+                title='Projets Financés et Emplois Créés',
+                barmode='group'
+            )
+            fig3.update_layout(height=400)
+            st.plotly_chart(fig3, use_container_width=True)
+    
+    def create_risk_dashboard(self):
+        """Crée un dashboard de gestion des risques"""
+        st.markdown('<h3 class="section-header">⚠️ TABLEAU DE BORD DES RISQUES</h3>', unsafe_allow_html=True)
+        
+        # Sélection du programme pour l'analyse de risque
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        selected_program = st.selectbox(
+            "Sélectionner un programme pour l'analyse des risques :",
+            list(all_programs.keys()),
+            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
+        )
+        
+        risk_analysis = self.perform_risk_analysis(selected_program)
+        
+        if risk_analysis:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Score de risque global
+                st.markdown(f"""
+                <div class="{risk_analysis['risk_class']}">
+                    <h4>Score de Risque Global</h4>
+                    <div style="font-size: 2rem; font-weight: bold;">
+                        {risk_analysis['risk_score']:.2f} - {risk_analysis['risk_level']}
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                quantiles = risk_analysis['score_quantiles']
+                probabilities = risk_analysis['level_probabilities']
+                st.caption(
+                    f"Médiane sur {risk_analysis['scenarios']:,} scénarios corrélés · "
+                    f"intervalle 90 % : {quantiles[0.05]:.2f} - {quantiles[0.95]:.2f} · "
+                    + " · ".join(f"{level} {probability:.0%}" for level, probability in probabilities.items())
+                )
+                
+                # Graphique des facteurs de risque
+                risk_df = pd.DataFrame(list(risk_analysis['risk_factors'].items()), 
+                                     columns=['Facteur', 'Score'])
+                
+                fig_risk = px.bar(
+                    risk_df,
+                    x='Facteur',
+                    y='Score',
+                    title='Facteurs de Risque par Catégorie',
+                    color='Score',
+                    color_continuous_scale='Reds'
+                )
+                fig_risk.update_layout(height=400)
+                st.plotly_chart(fig_risk, use_container_width=True)
+            
+            with col2:
+                # Mesures d'atténuation
+                st.markdown("#### 🛡️ Mesures d'Atténuation Recommandées")
+                
+                for factor, measures in risk_analysis['mitigation_measures'].items():
+                    with st.expander(f"📌 {factor}"):
+                        for measure in measures:
+                            st.markdown(f"- {measure}")
+                
+                # Part de chaque facteur dans la variance du score global
+                contribution_df = pd.DataFrame(list(risk_analysis['factor_contributions'].items()),
+                                               columns=['Facteur', 'Contribution'])
+                fig_contribution = px.bar(
+                    contribution_df.sort_values('Contribution'),
+                    x='Contribution',
+                    y='Facteur',
+                    orientation='h',
+                    title='Contribution à la Variance du Score'
+                )
+                fig_contribution.update_layout(height=350, xaxis_tickformat='.0%')
+                st.plotly_chart(fig_contribution, use_container_width=True)
+    
+    def create_roi_dashboard(self):
+        """Crée un dashboard d'analyse du ROI"""
+        st.markdown('<h3 class="section-header">💰 ANALYSE DU RETOUR SUR INVESTISSEMENT</h3>', unsafe_allow_html=True)
+        
+        # Sélection du programme
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        selected_program = st.selectbox(
+            "Sélectionner un programme pour l'analyse ROI :",
+            list(all_programs.keys()),
+            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
+        )
+        
+        # Scénario de pondération et de valeurs unitaires (ratios du programme en cache)
+        with st.expander("🎚️ Scénario de pondération et valeurs unitaires"):
+            col_weights, col_values = st.columns(2)
+            with col_weights:
+                weights = [
+                    st.slider("Poids Emploi", 0.0, 1.0, float(DEFAULT_WEIGHTS[0]), 0.05, key="roi_poids_emploi"),
+                    st.slider("Poids PME", 0.0, 1.0, float(DEFAULT_WEIGHTS[1]), 0.05, key="roi_poids_pme"),
+                    st.slider("Poids Social", 0.0, 1.0, float(DEFAULT_WEIGHTS[2]), 0.05, key="roi_poids_social")
+                ]
+            with col_values:
+                unit_values = [
+                    st.slider("Valeur par emploi (€)", 5000, 100000, int(DEFAULT_UNIT_VALUES[0]), 5000, key="roi_valeur_emploi"),
+                    st.slider("Valeur par PME (€)", 5000, 150000, int(DEFAULT_UNIT_VALUES[1]), 5000, key="roi_valeur_pme"),
+                    st.slider("Valeur par bénéficiaire (€)", 500, 20000, int(DEFAULT_UNIT_VALUES[2]), 500, key="roi_valeur_social")
+                ]
+        
+        roi_data = self.calculate_program_roi(selected_program, weights, unit_values)
+        
+        if roi_data is not None:
+            # Référence et scénario évalués ensemble
+            _, ratios = self.program_roi_ratios(selected_program)
+            reference_total, scenario_total = scenario_totals(
+                ratios,
+                [DEFAULT_WEIGHTS, weights],
+                [DEFAULT_UNIT_VALUES, unit_values]
+            )
+            
+            # Graphiques ROI
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_roi = go.Figure()
+                
+                fig_roi.add_trace(go.Scatter(
+                    x=roi_data['Année'],
+                    y=roi_data['ROI_Emploi'],
+                    name='ROI Emploi',
+                    line=dict(color='blue')
+                ))
+                
+                fig_roi.add_trace(go.Scatter(
+                    x=roi_data['Année'],
+                    y=roi_data['ROI_PME'],
+                    name='ROI PME',
+                    line=dict(color='green')
+                ))
+                
+                fig_roi.add_trace(go.Scatter(
+                    x=roi_data['Année'],
+                    y=roi_data['ROI_Social'],
+                    name='ROI Social',
+                    line=dict(color='orange')
+                ))
+                
+                fig_roi.update_layout(
+                    title='Évolution des ROI par Dimension',
+                    xaxis_title='Année',
+                    yaxis_title='Ratio ROI',
+                    height=400
+                )
+                
+                st.plotly_chart(fig_roi, use_container_width=True)
+            
+            with col2:
+                fig_roi_total = px.area(
+                    roi_data,
+                    x='Année',
+                    y='ROI_Total',
+                    title='ROI Total Pondéré',
+                    color_discrete_sequence=['purple']
+                )
+                fig_roi_total.add_trace(go.Scatter(
+                    x=roi_data['Année'],
+                    y=reference_total,
+                    name='Référence',
+                    line=dict(color='gray', dash='dash')
+                ))
+                fig_roi_total.update_layout(height=400)
+                st.plotly_chart(fig_roi_total, use_container_width=True)
+            
+            # Tableau récapitulatif
+            st.markdown("#### 📊 Récapitulatif du ROI")
+            
+            roi_summary = {
+                'ROI Moyen Emploi': roi_data['ROI_Emploi'].mean(),
+                'ROI Moyen PME': roi_data['ROI_PME'].mean(),
+                'ROI Moyen Social': roi_data['ROI_Social'].mean(),
+                'ROI Total Moyen': roi_data['ROI_Total'].mean(),
+                'ROI Final': roi_data['ROI_Total'].iloc[-1]
+            }
+            
+            for metric, value in roi_summary.items():
+                st.metric(metric, f"{value:.2f}")
+            
+            st.metric("Écart à la Référence (ROI Total Moyen)",
+                      f"{scenario_total.mean() - reference_total.mean():+.2f}")
+            
+            self.create_roi_sensitivity()
+    
+    def create_roi_sensitivity(self):
+        """Balayage de sensibilité du ROI total sur tous les programmes"""
+        st.markdown("#### 🌪️ Sensibilité du ROI Total")
+        
+        col_levels, col_span = st.columns(2)
+        with col_levels:
+            levels = st.slider("Niveaux par paramètre", 3, 9, DEFAULT_SWEEP_LEVELS, 2, key="roi_balayage_niveaux")
+        with col_span:
+            span = st.slider("Amplitude autour de la référence", 0.1, 0.9, DEFAULT_SWEEP_SPAN, 0.1, key="roi_balayage_amplitude")
+        
+        sweep = self.calculate_roi_sensitivity(levels, span)
+        st.caption(
+            f"{levels ** len(sweep.parameters):,} combinaisons × {len(sweep.programs)} programmes · "
+            f"ROI total moyen de référence : {sweep.baseline.mean():.2f}"
+        )
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Tornado : écart au ROI de référence aux bornes de chaque paramètre
+            tornado = tornado_frame(sweep)
+            reference = sweep.baseline.mean()
+            fig_tornado = go.Figure()
+            fig_tornado.add_trace(go.Bar(
+                y=tornado['Paramètre'],
+                x=tornado['ROI_Bas'] - reference,
+                base=reference,
+                orientation='h',
+                name=f"-{span:.0%}",
+                marker_color='indianred'
+            ))
+            fig_tornado.add_trace(go.Bar(
+                y=tornado['Paramètre'],
+                x=tornado['ROI_Haut'] - reference,
+                base=reference,
+                orientation='h',
+                name=f"+{span:.0%}",
+                marker_color='seagreen'
+            ))
+            fig_tornado.update_layout(title='Diagramme Tornado', barmode='overlay', xaxis_title='ROI Total Moyen', height=400)
+            st.plotly_chart(fig_tornado, use_container_width=True)
+        
+        with col2:
+            row_parameter = st.selectbox("Paramètre en lignes", sweep.parameters, index=0, key="roi_carte_lignes")
+            column_choices = [parameter for parameter in sweep.parameters if parameter != row_parameter]
+            column_parameter = st.selectbox("Paramètre en colonnes", column_choices, index=len(ROI_DIMENSIONS) - 1,
+                                            key="roi_carte_colonnes")
+            
+            surface = heatmap_frame(sweep, row_parameter, column_parameter)
+            fig_heatmap = px.imshow(
+                surface.values,
+                x=[f"{value:,.2f}" for value in surface.columns],
+                y=[f"{value:,.2f}" for value in surface.index],
+                labels=dict(x=column_parameter, y=row_parameter, color='ROI Total'),
+                color_continuous_scale='Viridis',
+                aspect='auto',
+                title='Carte de Chaleur du ROI Total Moyen'
+            )
+            fig_heatmap.update_layout(height=400)
+            st.plotly_chart(fig_heatmap, use_container_width=True)
+    
+    def create_predictive_dashboard(self):
+        """Crée un dashboard de prédictions"""
+        st.markdown('<h3 class="section-header">🔮 ANALYSE PRÉDICTIVE</h3>', unsafe_allow_html=True)
+        
+        # Sélection du programme
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        selected_program = st.selectbox(
+            "Sélectionner un programme pour l'analyse prédictive :",
+            list(all_programs.keys()),
+            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
+        )
+        
+        df = self.generate_advanced_program_data(selected_program)
+        predictions, metrics = self.create_predictive_analysis(df, selected_program)
+        
+        if predictions is not None and metrics is not None:
+            # Métriques du modèle
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("R² Budget", f"{metrics['budget_r2']:.3f}")
+            with col2:
+                st.metric("R² Emplois", f"{metrics['emplois_r2']:.3f}")
+            with col3:
+                st.metric("Tendance Budget", metrics['budget_trend'])
+            with col4:
+                st.metric("Tendance Emplois", metrics['emplois_trend'])
+            
+            # Modèle retenu par backtest à origine glissante et son erreur
+            if 'budget_model' in metrics:
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Modèle Budget", metrics['budget_model'],
+                              f"MAPE backtest {metrics['budget_mape']:.1f} %", delta_color='off')
+                with col2:
+                    st.metric("Modèle Emplois", metrics['emplois_model'],
+                              f"MAPE backtest {metrics['emplois_mape']:.1f} %", delta_color='off')
+            
+            # Graphiques prédictifs
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                fig_pred_budget = go.Figure()
+                
+                # Données historiques
+                fig_pred_budget.add_trace(go.Scatter(
+                    x=df['Année'],
+                    y=df['Budget_Total'],
+                    name='Budget Historique',
+                    line=dict(color='blue')
+                ))
+                
+                # Prédictions
+                fig_pred_budget.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Budget_Predit'],
+                    name='Budget Prédit',
+                    line=dict(color='red', dash='dash')
+                ))
+                
+                # Intervalles de confiance
+                fig_pred_budget.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Budget_Borne_Haute'],
+                    fill=None,
+                    mode='lines',
+                    line_color='rgba(255,0,0,0.2)',
+                    showlegend=False
+                ))
+                
+                fig_pred_budget.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Budget_Borne_Basse'],
+                    fill='tonexty',
+                    mode='lines',
+                    line_color='rgba(255,0,0,0.2)',
+                    name='Intervalle de prédiction 95%'
+                ))
+                
+                # Modèle retenu, s'il diffère de la tendance linéaire
+                if metrics.get('budget_model', 'Linéaire') != 'Linéaire':
+                    fig_pred_budget.add_trace(go.Scatter(
+                        x=predictions['Années'],
+                        y=predictions['Budget_Modele_Retenu'],
+                        name=f"Budget ({metrics['budget_model']})",
+                        line=dict(color='black', dash='dot')
+                    ))
+                
+                fig_pred_budget.update_layout(
+                    title='Prédictions du Budget (M€)',
+                    xaxis_title='Année',
+                    yaxis_title='Budget (M€)',
+                    height=400
+                )
+                
+                st.plotly_chart(fig_pred_budget, use_container_width=True)
+            
+            with col2:
+                fig_pred_emplois = go.Figure()
+                
+                # Données historiques
+                fig_pred_emplois.add_trace(go.Scatter(
+                    x=df['Année'],
+                    y=df['Emplois_Crees'],
+                    name='Emplois Historique',
+                    line=dict(color='green')
+                ))
+                
+                # Prédictions
+                fig_pred_emplois.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Emplois_Predits'],
+                    name='Emplois Prédits',
+                    line=dict(color='red', dash='dash')
+                ))
+                
+                # Intervalles de confiance
+                fig_pred_emplois.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Emplois_Borne_Haute'],
+                    fill=None,
+                    mode='lines',
+                    line_color='rgba(0,255,0,0.2)',
+                    showlegend=False
+                ))
+                
+                fig_pred_emplois.add_trace(go.Scatter(
+                    x=predictions['Années'],
+                    y=predictions['Emplois_Borne_Basse'],
+                    fill='tonexty',
+                    mode='lines',
+                    line_color='rgba(0,255,0,0.2)',
+                    name='Intervalle de prédiction 95%'
+                ))
+                
+                # Modèle retenu, s'il diffère de la tendance linéaire
+                if metrics.get('emplois_model', 'Linéaire') != 'Linéaire':
+                    fig_pred_emplois.add_trace(go.Scatter(
+                        x=predictions['Années'],
+                        y=predictions['Emplois_Modele_Retenu'],
+                        name=f"Emplois ({metrics['emplois_model']})",
+                        line=dict(color='black', dash='dot')
+                    ))
+                
+                fig_pred_emplois.update_layout(
+                    title='Prédictions des Emplois Créés',
+                    xaxis_title='Année',
+                    yaxis_title="Nombre d'Emplois",
+                    height=400
+                )
+                
+                st.plotly_chart(fig_pred_emplois, use_container_width=True)
+            
+            # Tableau des prédictions
+            st.markdown("#### 📋 Prédictions Détaillées")
+            
+            pred_table = pd.DataFrame({
+                'Année': predictions['Années'],
+                'Budget Prédit (M€)': predictions['Budget_Predit'].round(2),
+                'Budget Min (M€)': predictions['Budget_Borne_Basse'].round(2),
+                'Budget Max (M€)': predictions['Budget_Borne_Haute'].round(2),
+                'Emplois Prédits': predictions['Emplois_Predits'].round(0),
+                'Emplois Min': predictions['Emplois_Borne_Basse'].round(0),
+                'Emplois Max': predictions['Emplois_Borne_Haute'].round(0)
+            })
+            
+            st.dataframe(pred_table, use_container_width=True)
+    
+    def create_performance_dashboard(self):
+        """Crée un dashboard de performance avancé"""
+        st.markdown('<h3 class="section-header">🏆 TABLEAU DE BORD DE PERFORMANCE</h3>', unsafe_allow_html=True)
+        
+        # Sélection multiple des programmes pour comparaison
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        selected_programs = st.multiselect(
+            "Sélectionner les programmes à comparer :",
+            list(all_programs.keys()),
+            default=list(all_programs.keys())[:3],
+            format_func=lambda x: f"{all_programs[x]['territory']} - {all_programs[x]['name']}"
+        )
+        
+        if selected_programs:
+            # Collecte des données
+            combined_data = self.generate_programs_batch(selected_programs, 'programmes_avances')
+            
+            if not combined_data.empty:
+                # Dernière année de chaque programme, indexée par nom en une seule passe
+                snapshot = combined_data.groupby('Programme', observed=True, sort=False).tail(1).set_index('Programme')
+                shown = [program_id for program_id in selected_programs if all_programs[program_id]['name'] in snapshot.index]
+                snapshot = snapshot.loc[[all_programs[program_id]['name'] for program_id in shown], list(PERFORMANCE_INDICATORS)]
+                
+                # Graphique radar de performance
+                fig_radar = go.Figure()
+                
+                for program_id, values in zip(shown, snapshot.values):
+                    fig_radar.add_trace(go.Scatterpolar(
+                        r=values,
+                        theta=list(PERFORMANCE_INDICATORS.values()),
+                        fill='toself',
+                        name=all_programs[program_id]['territory']
+                    ))
+                
+                fig_radar.update_layout(
+                    polar=dict(
+                        radialaxis=dict(
+                            visible=True,
+                            range=[0, 1]
+                        )),
+                    title="Radar de Performance des Programmes",
+                    height=500
+                )
+                
+                st.plotly_chart(fig_radar, use_container_width=True)
+                
+                # Tableau de performance comparative
+                st.markdown("#### 📊 Performance Comparative")
+                
+                perf_df = snapshot.rename(columns=PERFORMANCE_INDICATORS).reset_index(drop=True)
+                perf_df.insert(0, 'Programme', [all_programs[program_id]['territory'] for program_id in shown])
+                st.dataframe(perf_df.style.format({
+                    'Performance Globale': '{:.2%}',
+                    'Impact Environnemental': '{:.2%}',
+                    'Innovation': '{:.2%}',
+                    'Inclusion Sociale': '{:.2%}',
+                    'Développement Durable': '{:.2%}',
+                    'Taux de Réalisation': '{:.2%}'
+                }), use_container_width=True)
+                self.display_export_buttons(perf_df, "performance_comparative")
+    
+    def create_forecast_overview(self):
+        """Prévisions de tous les programmes pour un indicateur, issues du calcul groupé"""
+        st.markdown('<h3 class="section-header">📡 PRÉVISIONS TOUS PROGRAMMES</h3>', unsafe_allow_html=True)
+        
+        forecast = self.create_batch_forecast()
+        if forecast is None:
+            st.info("Aucune série suffisamment longue pour une prévision.")
+            return
+        
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        indicator = st.selectbox("Indicateur à prévoir :", forecast.columns, key="prevision_indicateur")
+        
+        colors = px.colors.qualitative.Plotly
+        fig_forecast = go.Figure()
+        for i, program_id in enumerate(forecast.programs):
+            color = colors[i % len(colors)]
+            label = f"{all_programs[program_id]['territory']} - {all_programs[program_id]['name']}"
+            history = self.generate_advanced_program_data(program_id)
+            years, prediction, lower, upper = forecast.lookup(program_id, indicator)
+            
+            fig_forecast.add_trace(go.Scatter(
+                x=history['Année'],
+                y=history[indicator],
+                name=label,
+                legendgroup=program_id,
+                line=dict(color=color)
+            ))
+            fig_forecast.add_trace(go.Scatter(
+                x=np.concatenate([years, years[::-1]]),
+                y=np.concatenate([upper, lower[::-1]]),
+                fill='toself',
+                fillcolor=color,
+                opacity=0.15,
+                line=dict(width=0),
+                legendgroup=program_id,
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+            fig_forecast.add_trace(go.Scatter(
+                x=years,
+                y=prediction,
+                legendgroup=program_id,
+                showlegend=False,
+                line=dict(color=color, dash='dash')
+            ))
+        
+        fig_forecast.update_layout(
+            title=f'Historique et Prévisions : {indicator}',
+            xaxis_title='Année',
+            yaxis_title=indicator,
+            height=500
+        )
+        st.plotly_chart(fig_forecast, use_container_width=True)
+        
+        # Tableaux : prévisions et qualité d'ajustement de l'indicateur
+        forecast_df = forecast.frame()
+        metrics_df = forecast.metrics()
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 📋 Prévisions")
+            st.dataframe(forecast_df[forecast_df['Indicateur'] == indicator], use_container_width=True)
+        
+        with col2:
+            st.markdown("#### 📐 Qualité des Modèles")
+            st.dataframe(metrics_df[metrics_df['Indicateur'] == indicator], use_container_width=True)
+        
+        self.display_export_buttons(forecast_df, "previsions_tous_programmes")
+    
+    def create_advanced_visualizations(self):
+        """Crée des visualisations avancées"""
+        st.markdown('<h3 class="section-header">📊 VISUALISATIONS AVANCÉES</h3>', unsafe_allow_html=True)
+        
+        # Analyse de clustering
+        st.markdown("#### 🎯 Segmentation des Territoires")
+        df_territoires, cluster_analysis, cluster_descriptions = self.create_cluster_analysis()
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Graphique des clusters
+            fig_cluster = self.figure_cache.get_or_build(
+                'visualisations.segmentation', frame_version(df_territoires),
+                lambda: px.scatter(
+                    df_territoires,
+                    x='PIB_Habitant',
+                    y='Taux_Chomage',
+                    color='Cluster',
+                    size='Population',
+                    hover_name='Territoire',
+                    title='Segmentation des Territoires FEDER',
+                    color_continuous_scale='Viridis'
+                ).update_layout(height=400)
+            )
+            st.plotly_chart(fig_cluster, use_container_width=True)
+        
+        with col2:
+            # Tableau d'analyse des clusters
+            st.markdown("**Analyse des Clusters :**")
+            for cluster, desc in cluster_descriptions.items():
+                st.markdown(f"- **Cluster {cluster}**: {desc}")
+            
+            st.markdown("**Caractéristiques moyennes par cluster :**")
+            st.dataframe(cluster_analysis.style.format({
+                'Population': '{:.0f}',
+                'PIB_Habitant': '{:.0f} €',
+                'Taux_Chomage': '{:.1f}%',
+                'IDH': '{:.3f}'
+            }))
+    
+    def create_correlation_view(self):
+        """Affiche les corrélations des indicateurs d'un programme ou de l'ensemble des programmes"""
+        st.markdown("#### 🔗 Analyse des Corrélations")
+        
+        # Toutes les matrices sont calculées ensemble et mises en cache : changer de programme est immédiat
+        correlation = self.create_correlation_analysis()
+        if correlation is None:
+            return
+        
+        all_programs = {**self.specific_programs, **self.drom_com_programs}
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            selected_key = st.selectbox(
+                "Programme :",
+                correlation.keys,
+                index=len(correlation.keys) - 1,
+                format_func=lambda key: "Ensemble des programmes" if key == POOLED_KEY
+                else f"{all_programs[key]['territory']} - {all_programs[key]['name']}",
+                key="correlation_programme"
+            )
+        with col2:
+            method = st.radio("Méthode :", METHODS, format_func=str.capitalize, key="correlation_methode")
+        
+        fig_corr = px.imshow(
+            correlation.matrix(selected_key, method),
+            title=f'Matrice de Corrélation des Indicateurs ({method.capitalize()})',
+            color_continuous_scale='RdBu',
+            zmin=-1,
+            zmax=1,
+            aspect="auto"
+        )
+        fig_corr.update_layout(height=500)
+        st.plotly_chart(fig_corr, use_container_width=True)
+        
+        # Paires les plus corrélées avec leur intervalle bootstrap à 95 %
+        st.markdown("##### Paires les plus corrélées (IC bootstrap 95 %)")
+        pairs = correlation.pairs(selected_key, method)
+        st.dataframe(pairs.head(10).style.format({
+            'Correlation': '{:.3f}',
+            'IC_Bas': '{:.3f}',
+            'IC_Haut': '{:.3f}'
+        }), use_container_width=True)
+        self.display_export_buttons(pairs, f"correlations_{selected_key}_{method}")
+    
+    def create_benchmarking(self):
+        """Compare les territoires et propose des recommandations"""
+        st.markdown('<h3 class="section-header">🏆 BENCHMARKING TERRITORIAL</h3>', unsafe_allow_html=True)
+        
+        # Comparaison des territoires
+        df_territoires, cluster_analysis, cluster_descriptions = self.create_cluster_analysis()
+        
+        # Tableau comparatif
+        comparison_data = []
+        for type_territoire, territoires in self.territoires.items():
+            for territoire, data in territoires.items():
+                comparison_data.append({
+                    'Territoire': territoire,
+                    'Type': type_territoire,
+                    'Population': data['population'],
+                    'PIB/Habitant': data['pib_habitant'],
+                    'Taux Chômage': data['taux_chomage'],
+                    'IDH': data['indice_developpement'],
+                    'Secteurs Clés': ', '.join(data['secteurs_cles'][:2]),
+                    'Risque Principal': data['risques'][0]
+                })
+        
+        # Valeurs brutes conservées pour l'export, mise en forme à l'affichage seulement
+        df_comparison = pd.DataFrame(comparison_data)
+        st.dataframe(df_comparison.style.format({
+            'Population': '{:,}',
+            'PIB/Habitant': '{:,.0f} €',
+            'Taux Chômage': '{:.1f}%',
+            'IDH': '{:.3f}'
+        }), use_container_width=True)
+        self.display_export_buttons(df_comparison, "benchmarking_territorial")
+        
+        # Recommandations par territoire
+        st.markdown("#### 📋 Recommandations Stratégiques")
+        
+        selected_territoire = st.selectbox(
+            "Sélectionner un territoire pour les recommandations :",
+            list(self.territoires["DROM"].keys()) + list(self.territoires["COM"].keys())
+        )
+        
+        # Trouver les données du territoire
+        territoire_data = None
+        for type_territoire, territoires in self.territoires.items():
+            if selected_territoire in territoires:
+                territoire_data = territoires[selected_territoire]
+                break
+        
+        if territoire_data:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("**🎯 Opportunités :**")
+                if territoire_data['taux_chomage'] > 20:
+                    st.markdown("- Fort potentiel de création d'emplois")
+                if territoire_data['pib_habitant'] < 20000:
+                    st.markdown("- Besoin de développement économique")
+                if territoire_data['indice_developpement'] < 0.8:
+                    st.markdown("- Marge de progression sociale")
+            
+            with col2:
+                st.markdown("**⚠️ Défis :**")
+                for risque in territoire_data['risques'][:3]:
+                    st.markdown(f"- {risque}")
@@ -0,0 +1,4 @@
+"""Page Benchmarking Territorial"""
+from feder_core.session import get_data_service
+
+get_data_service().create_benchmarking()
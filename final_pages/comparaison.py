@@ -0,0 +1,4 @@
+"""Page Analyse Comparative"""
+from feder_core.session import get_data_service
+
+get_data_service().create_comparison_charts()
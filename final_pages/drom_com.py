@@ -0,0 +1,4 @@
+"""Page Programmes DROM COM 2021-2027"""
+from feder_core.session import get_data_service
+
+get_data_service().create_drom_com_page()
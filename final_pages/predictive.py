@@ -0,0 +1,9 @@
+"""Page Analyse Prédictive"""
+from feder_core.profiling import register_cache_stats
+from feder_core.session import get_data_service
+from feder_core.timeseries import get_forecast_selector
+
+# Compteurs du moteur de la page pour le panneau de profilage
+register_cache_stats("Sélection de modèles", get_forecast_selector().stats, "{hits} hits, {misses} backtests")
+
+get_data_service().create_predictive_dashboard()
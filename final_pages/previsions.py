@@ -0,0 +1,9 @@
+"""Page Prévisions Tous Programmes"""
+from feder_core.forecasting import get_batch_forecaster
+from feder_core.profiling import register_cache_stats
+from feder_core.session import get_data_service
+
+# Compteurs du moteur de la page pour le panneau de profilage
+register_cache_stats("Prévisions groupées", get_batch_forecaster().stats, "{hits} hits, {misses} ajustements")
+
+get_data_service().create_forecast_overview()
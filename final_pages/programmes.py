@@ -0,0 +1,4 @@
+"""Page Programmes Spécifiques 2014-2020"""
+from feder_core.session import get_data_service
+
+get_data_service().create_program_page()
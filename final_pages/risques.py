@@ -0,0 +1,9 @@
+"""Page Analyse des Risques"""
+from feder_core.profiling import register_cache_stats
+from feder_core.risk import get_risk_engine
+from feder_core.session import get_data_service
+
+# Compteurs du moteur de la page pour le panneau de profilage
+register_cache_stats("Moteur de risques", get_risk_engine().stats, "{hits} hits, {misses} simulations, {entries} programmes")
+
+get_data_service().create_risk_dashboard()
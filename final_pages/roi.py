@@ -0,0 +1,9 @@
+"""Page Analyse du ROI"""
+from feder_core.profiling import register_cache_stats
+from feder_core.roi import get_roi_engine
+from feder_core.session import get_data_service
+
+# Compteurs du moteur de la page pour le panneau de profilage
+register_cache_stats("Moteur ROI", get_roi_engine().stats, "{hits} hits, {misses} calculs, {entries} programmes")
+
+get_data_service().create_roi_dashboard()
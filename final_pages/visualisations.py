@@ -0,0 +1,4 @@
+"""Page Visualisations Avancées"""
+from feder_core.session import get_data_service
+
+get_data_service().create_advanced_visualizations()
@@ -0,0 +1,7 @@
+"""Page Vue d'Ensemble : cartes des programmes et synthèse"""
+from feder_core.session import get_data_service
+
+dashboard = get_data_service()
+dashboard.display_program_cards()
+dashboard.display_drom_com_cards()
+dashboard.display_overview()
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Les tests importent feder_core depuis la racine du dépôt
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
@@ -0,0 +1,35 @@
+"""Application multipage Final.py : service de session et panneau de profilage"""
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from feder_core.session import SESSION_KEY
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    monkeypatch.setenv('FEDER_PORTAL_URL', 'http://127.0.0.1:9/')
+    monkeypatch.setenv('FEDER_ARTIFACT_DIR', str(tmp_path))
+    monkeypatch.setenv('FEDER_PROFILE', '1')
+    return AppTest.from_file(os.path.join(ROOT, 'Final.py'), default_timeout=60)
+
+
+def test_service_survives_reruns(app):
+    app.run()
+    service = app.session_state[SESSION_KEY]
+
+    app.run()
+    app.switch_page('final_pages/risques.py').run()
+    assert not app.exception
+    assert app.session_state[SESSION_KEY] is service
+
+
+def test_pages_register_engine_stats(app):
+    app.run()
+    app.switch_page('final_pages/risques.py').run()
+    assert not app.exception
+    captions = [caption.value for caption in app.caption]
+    assert any(caption.startswith("Moteur de risques : ") for caption in captions)
@@ -0,0 +1,37 @@
+"""Cache des DataFrames générés"""
+import pandas as pd
+
+from feder_core.cache import DataCache
+
+
+def test_hit_returns_copy_without_rebuilding():
+    cache = DataCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return pd.DataFrame({'Budget_Total': [1.0, 2.0]})
+
+    first = cache.get_or_build('generate_program_data', 'P1', build)
+    first['Ajout'] = 0
+    second = cache.get_or_build('generate_program_data', 'P1', build)
+
+    assert len(builds) == 1
+    assert list(second.columns) == ['Budget_Total']
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1, 'hit_ratio': 0.5}
+
+
+def test_invalidation_bumps_version():
+    cache = DataCache()
+    cache.get_or_build('generate_program_data', 'P1', lambda: pd.DataFrame({'x': [1]}))
+    cache.get_or_build('generate_program_data', 'P2', lambda: pd.DataFrame({'x': [2]}))
+    version = cache.version('generate_program_data', 'P1')
+
+    assert cache.invalidate('generate_program_data', 'P1') == 1
+    assert cache.version('generate_program_data', 'P1') is None
+    rebuilt = cache.get_or_build('generate_program_data', 'P1', lambda: pd.DataFrame({'x': [3]}))
+
+    assert rebuilt['x'].tolist() == [3]
+    assert cache.version('generate_program_data', 'P1') > version
+    assert cache.stats()['entries'] == 2
+    assert cache.invalidate() == 2
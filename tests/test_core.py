@@ -0,0 +1,34 @@
+"""Modèle de données commun aux dashboards"""
+import numpy as np
+import pytest
+
+from feder_core.core import FEDERCore
+
+COLUMNS = ['Année', 'Territoire', 'Budget_Total']
+
+
+@pytest.fixture(scope='module')
+def core():
+    return FEDERCore()
+
+
+def test_programs_batch_keeps_requested_order(core):
+    program_ids = list(core.specific_programs)
+    for requested in (program_ids, program_ids[::-1]):
+        frame = core.generate_programs_batch(requested, columns=COLUMNS)
+        territories = [core.specific_programs[program_id]['territory'] for program_id in requested]
+        assert list(dict.fromkeys(frame['Territoire'])) == territories
+        assert list(frame['Territoire'].cat.categories) == territories
+        assert list(frame.columns) == COLUMNS
+        assert frame.equals(core.generate_programs_batch(requested, columns=COLUMNS, use_cache=False))
+
+
+def test_program_roi_matches_direct_analysis(core):
+    program_id = next(iter(core.specific_programs))
+    df = core.generate_advanced_program_data(program_id)
+    weights = np.array([0.5, 0.3, 0.2])
+    expected = core.calculate_roi_analysis(df, weights)
+    assert core.calculate_program_roi(program_id, weights).equals(expected)
+    # Un DataFrame modifié est analysé tel quel, sans passer par les ratios du programme
+    scaled = df.assign(Budget_Total=df['Budget_Total'] * 2)
+    assert not core.calculate_roi_analysis(scaled, weights).equals(expected)
@@ -0,0 +1,47 @@
+"""Corrélations masquées comparées à DataFrame.corr"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from feder_core.correlation import POOLED_KEY, CorrelationEngine, average_ranks, correlations, stack_rows
+
+
+def frames_with_gaps(seed=0):
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for program_id, length in (('P1', 12), ('P2', 7), ('P3', 20)):
+        budget = rng.normal(1e6, 2e5, length)
+        frame = pd.DataFrame({
+            'Budget': budget,
+            'Emplois': np.round(budget / 1e5 + rng.normal(0, 2, length)),
+            'PME': rng.integers(0, 4, length).astype(float),
+            'Taux': rng.random(length)
+        })
+        frame = frame.mask(rng.random(frame.shape) < 0.2)
+        frames[program_id] = frame
+    return frames
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_masked_correlations_match_pandas(method):
+    frames = frames_with_gaps()
+    columns = list(frames['P1'].columns)
+    values, mask = stack_rows(frames, columns)
+    matrices = correlations(values, mask)[method]
+
+    expected = [*frames.values(), pd.concat(frames.values(), ignore_index=True)]
+    for matrix, frame in zip(matrices, expected):
+        np.testing.assert_allclose(matrix, frame.corr(method=method).to_numpy(), atol=1e-10, equal_nan=True)
+
+
+def test_average_ranks_share_ties():
+    values = np.array([[3.0, 1.0, 3.0, np.nan, 2.0]])[..., None]
+    ranks = average_ranks(values, ~np.isnan(values))[0, :, 0]
+    np.testing.assert_array_equal(ranks[[0, 1, 2, 4]], [3.5, 1.0, 3.5, 2.0])
+
+
+def test_engine_pairs_carry_bootstrap_bounds():
+    result = CorrelationEngine(resamples=50, workers=1).analyze(frames_with_gaps())
+    pairs = result.pairs(POOLED_KEY, 'spearman').dropna()
+    assert len(pairs) > 0
+    assert (pairs['IC_Bas'] <= pairs['IC_Haut']).all()
@@ -0,0 +1,59 @@
+"""Boutons d'export sur une page réelle du dashboard"""
+import io
+import os
+
+import pandas as pd
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from feder_core.export import available_formats, export_bytes
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NAME = 'benchmarking_territorial'
+
+
+def read_export(fmt, content):
+    if fmt == 'csv':
+        return pd.read_csv(io.BytesIO(content), encoding='utf-8-sig')
+    if fmt == 'parquet':
+        return pd.read_parquet(io.BytesIO(content))
+    return pd.read_excel(io.BytesIO(content))
+
+
+@pytest.fixture
+def offline_env(monkeypatch, tmp_path):
+    """Sonde du portail vers un port fermé, artefacts dans un répertoire jetable"""
+    monkeypatch.setenv('FEDER_PORTAL_URL', 'http://127.0.0.1:9/')
+    monkeypatch.setenv('FEDER_ARTIFACT_DIR', str(tmp_path))
+
+
+def test_export_bytes_round_trip():
+    frame = pd.DataFrame({'Territoire': ['Guadeloupe', 'Réunion'], 'Budget': [1.5, 2.0]})
+    for fmt in available_formats():
+        content = export_bytes(frame, fmt)
+        assert isinstance(content, bytes)
+        pd.testing.assert_frame_equal(read_export(fmt, content), frame)
+
+
+@pytest.mark.parametrize('fmt', ['csv', 'xlsx', 'parquet'])
+def test_download_button_serves_file(fmt, offline_env):
+    if fmt not in available_formats():
+        pytest.skip(f"dépendance de l'export {fmt} absente")
+
+    at = AppTest.from_file(os.path.join(ROOT, 'Final.py'), default_timeout=60)
+    at.run()
+    at.switch_page('final_pages/benchmarking.py').run()
+    button = at.download_button(key=f"export_{NAME}_{fmt}")
+    assert button.proto.label == f"⬇️ {fmt.upper()}"
+    # Téléchargement différé : le fichier n'est produit qu'au clic, sans rerun
+    assert button.proto.deferred_file_id
+    assert button.proto.ignore_rerun
+
+    button.click().run()
+    assert not at.exception
+
+    # Contenu : le tableau affiché par la page, exporté comme le fait le bouton
+    shown = next(frame.value for frame in at.dataframe if 'Population' in frame.value.columns)
+    exported = read_export(fmt, export_bytes(shown, fmt))
+    assert list(exported.columns[:3]) == ['Territoire', 'Type', 'Population']
+    assert len(exported) == len(shown) > 0
@@ -0,0 +1,65 @@
+"""Prévisions linéaires groupées"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from feder_core.forecasting import BatchForecaster
+from feder_core.models import fit_linear, predict_linear
+
+# Longueurs différentes : alignement sur la grille masquée, ddl dans et hors de la table de Student
+LENGTHS = {'P1': 5, 'P2': 10, 'P3': 22, 'P4': 37}
+
+
+def program_frames(seed=0):
+    rng = np.random.default_rng(seed)
+    frames = {}
+    for program_id, length in LENGTHS.items():
+        years = np.arange(2030 - length, 2030)
+        frames[program_id] = pd.DataFrame({
+            'Année': years,
+            'Budget_Total': 100.0 + 3.0 * (years - years[0]) + rng.normal(0, 4, length),
+            'Emplois_Crees': 20.0 - 0.5 * (years - years[0]) + rng.normal(0, 1, length)
+        })
+    return frames
+
+
+def test_batch_matches_single_series_fits():
+    frames = program_frames()
+    forecast = BatchForecaster().forecast(frames)
+    for program_id, df in frames.items():
+        for column in forecast.columns:
+            fit = fit_linear(df['Année'], df[column])
+            years, prediction, _, _ = forecast.lookup(program_id, column)
+            np.testing.assert_array_equal(years, df['Année'].iloc[-1] + np.arange(1, 4))
+            np.testing.assert_allclose(prediction, predict_linear(fit, years), rtol=1e-9)
+
+
+def test_prediction_interval_matches_student_t():
+    stats = pytest.importorskip('scipy.stats')
+    frames = program_frames()
+    forecast = BatchForecaster().forecast(frames)
+
+    for program_id, df in frames.items():
+        x = df['Année'].to_numpy(dtype=np.float64)
+        for column in forecast.columns:
+            y = df[column].to_numpy()
+            n = len(x)
+            slope, intercept = np.polyfit(x, y, 1)
+            s = np.sqrt(np.sum((y - (intercept + slope * x)) ** 2) / (n - 2))
+
+            years, prediction, lower, upper = forecast.lookup(program_id, column)
+            leverage = 1.0 / n + (years - x.mean()) ** 2 / np.sum((x - x.mean()) ** 2)
+            half_width = stats.t.ppf(0.975, n - 2) * s * np.sqrt(1.0 + leverage)
+
+            np.testing.assert_allclose(prediction, intercept + slope * years, rtol=1e-9)
+            # Table de Student à 3 décimales, interpolée en 1/ddl entre ses lignes
+            np.testing.assert_allclose(upper - prediction, half_width, rtol=1e-3)
+            np.testing.assert_allclose(prediction - lower, half_width, rtol=1e-3)
+
+
+def test_forecaster_reuses_result_for_same_data():
+    forecaster = BatchForecaster()
+    first = forecaster.forecast(program_frames())
+    assert forecaster.forecast(program_frames()) is first
+    assert forecaster.forecast(program_frames(seed=1)) is not first
+    assert forecaster.stats() == {'hits': 1, 'misses': 2, 'entries': 2}
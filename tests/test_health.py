@@ -0,0 +1,85 @@
+"""Sonde de santé du portail contre un serveur HTTP local"""
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from feder_core.health import (STATUS_LIMITED, STATUS_OFFLINE, STATUS_OK, STATUS_UNKNOWN,
+                               PortalHealthMonitor)
+
+SLOW_SECONDS = 1.0
+
+
+class PortalHandler(BaseHTTPRequestHandler):
+    """/ok répond 200, /limite 503, /lent 200 après SLOW_SECONDS"""
+
+    def do_GET(self):
+        if self.path == '/lent':
+            time.sleep(SLOW_SECONDS)
+        self.send_response(503 if self.path == '/limite' else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def portal():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PortalHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def closed_port_url():
+    # Port libéré aussitôt réservé : la connexion est refusée
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+def test_portal_up(portal):
+    monitor = PortalHealthMonitor(url=f"{portal}/ok", timeout=2.0)
+    assert monitor.status()['status'] == STATUS_UNKNOWN
+
+    result = monitor.probe()
+    assert (result['status'], result['http_status']) == (STATUS_OK, 200)
+    assert monitor.status() == result
+
+
+def test_portal_limited(portal):
+    result = PortalHealthMonitor(url=f"{portal}/limite", timeout=2.0).probe()
+    assert (result['status'], result['http_status']) == (STATUS_LIMITED, 503)
+
+
+def test_portal_down():
+    result = PortalHealthMonitor(url=closed_port_url(), timeout=2.0).probe()
+    assert (result['status'], result['http_status']) == (STATUS_OFFLINE, None)
+
+
+def test_portal_timeout(portal):
+    result = PortalHealthMonitor(url=f"{portal}/lent", timeout=0.2).probe()
+    assert result['status'] == STATUS_OFFLINE
+    assert result['latency'] < SLOW_SECONDS
+
+
+def test_background_probe_and_expiry(portal):
+    monitor = PortalHealthMonitor(url=f"{portal}/ok", interval=60.0, timeout=2.0, ttl=0.5)
+    monitor.start()
+    try:
+        deadline = time.monotonic() + 5.0
+        while monitor.status()['status'] == STATUS_UNKNOWN and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert monitor.status()['status'] == STATUS_OK
+    finally:
+        monitor.stop()
+
+    # Statut périmé au-delà du ttl : la page affiche « inconnu » plutôt qu'un vieux résultat
+    time.sleep(0.6)
+    assert monitor.status()['status'] == STATUS_UNKNOWN
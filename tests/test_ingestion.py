@@ -0,0 +1,103 @@
+"""Ingestion paginée du portail, sur une session simulée ou des réponses enregistrées"""
+import os
+
+import pytest
+
+from feder_core.ingestion import (STATUS_UNCHANGED, STATUS_UPDATED, FixtureSession, PortalClient,
+                                  RecordedResponse, SnapshotChanged, ingest)
+from feder_core.store import ColumnarStore
+
+DATASET = 'portail_programmes'
+ROWS = 7
+PAGE_SIZE = 3
+
+
+class PortalStub:
+    """Session simulée : ressource de ROWS lignes, ETag propre à chaque page
+
+    changes : nombre de lectures de pages suivantes qui modifient le jeu côté portail.
+    """
+
+    def __init__(self, declared=True, changes=0):
+        self.declared = declared
+        self.changes = changes
+        self.version = 1
+        self.calls = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append((url, params, headers))
+        if '/api/views/' in url:
+            if not self.declared:
+                return RecordedResponse(404, {}, None)
+            fields = [':id', 'code', 'montant']
+            return RecordedResponse(200, {}, {'columns': [{'fieldName': field} for field in fields]})
+
+        offset, limit = params['$offset'], params['$limit']
+        etag = f'"v{self.version}-{offset}"'
+        if (headers or {}).get('If-None-Match') == etag:
+            return RecordedResponse(304, {'ETag': etag}, None)
+        # SODA omet les champs nuls : 'montant' n'apparaît qu'à partir de la ligne 3
+        rows = [{'code': str(index), **({'montant': str(index * 10)} if index >= 3 else {})}
+                for index in range(offset, min(offset + limit, ROWS))]
+        if offset and self.changes:
+            self.changes -= 1
+            self.version += 1
+        return RecordedResponse(200, {'ETag': etag}, rows)
+
+
+def client(session):
+    return PortalClient(base_url='http://portail.test', session=session, page_size=PAGE_SIZE)
+
+
+def stored(root):
+    return ColumnarStore(str(root)).read(DATASET).to_dict('list')
+
+
+def test_replays_recorded_fixture_without_network(tmp_path):
+    fixtures = str(tmp_path / 'fixtures')
+    recorded = ingest(str(tmp_path / 'a'), [DATASET], client(FixtureSession(fixtures, 'record', PortalStub())))
+    assert recorded[0]['status'] == STATUS_UPDATED
+
+    # Autre hôte, aucune session réelle : tout vient des enregistrements
+    replayed = ingest(str(tmp_path / 'b'), [DATASET],
+                      PortalClient(base_url='http://ailleurs.test', session=FixtureSession(fixtures), page_size=PAGE_SIZE))
+    assert replayed[0]['rows'] == ROWS
+    assert stored(tmp_path / 'b') == stored(tmp_path / 'a')
+
+    # Le rafraîchissement rejoue la revalidation enregistrée : 304, rien n'est réécrit
+    assert ingest(str(tmp_path / 'b'), [DATASET], client(FixtureSession(fixtures)))[0]['status'] == STATUS_UNCHANGED
+
+
+def test_unchanged_dataset_is_not_downloaded(tmp_path):
+    portal = PortalStub()
+    first = ingest(str(tmp_path), [DATASET], client(portal))[0]
+    assert (first['status'], first['rows'], first['pages']) == (STATUS_UPDATED, ROWS, 3)
+    mtime = os.path.getmtime(ColumnarStore(str(tmp_path)).path(DATASET))
+
+    portal.calls.clear()
+    second = ingest(str(tmp_path), [DATASET], client(portal))[0]
+    assert (second['status'], second['rows'], second['pages']) == (STATUS_UNCHANGED, ROWS, 0)
+    # Métadonnées puis première page conditionnelle, aucune autre page
+    assert [call[1] and call[1]['$offset'] for call in portal.calls] == [None, 0]
+    assert os.path.getmtime(ColumnarStore(str(tmp_path)).path(DATASET)) == mtime
+
+
+def test_change_during_read_restarts(tmp_path):
+    portal = PortalStub(changes=1)
+    result = ingest(str(tmp_path), [DATASET], client(portal))[0]
+    assert result['rows'] == ROWS
+    assert portal.version == 2
+
+    # Un jeu qui change à chaque lecture finit par abandonner, sans toucher au stockage
+    with pytest.raises(SnapshotChanged):
+        ingest(str(tmp_path / 'instable'), [DATASET], client(PortalStub(changes=100)))
+    assert not ColumnarStore(str(tmp_path / 'instable')).has(DATASET)
+
+
+@pytest.mark.parametrize('declared', [True, False])
+def test_schema_is_union_of_columns(tmp_path, declared):
+    ingest(str(tmp_path), [DATASET], client(PortalStub(declared=declared)))
+    frame = ColumnarStore(str(tmp_path)).read(DATASET)
+    assert list(frame.columns) == ['code', 'montant']
+    assert frame['montant'].isna().sum() == 3
+    assert frame['montant'].iloc[3:].tolist() == ['30', '40', '50', '60']
@@ -0,0 +1,23 @@
+"""Pool de processus partagé et nombre de processus configuré"""
+import pytest
+
+from feder_core import pool
+
+
+def test_default_workers_reads_environment(monkeypatch):
+    monkeypatch.setenv('FEDER_FORECAST_WORKERS', ' 3 ')
+    assert pool.default_workers('FEDER_FORECAST_WORKERS') == 3
+    monkeypatch.delenv('FEDER_FORECAST_WORKERS')
+    assert pool.default_workers('FEDER_FORECAST_WORKERS') >= 1
+
+
+@pytest.mark.parametrize('value', ['0', '-2', 'quatre', '1.5'])
+def test_default_workers_rejects_invalid_values(monkeypatch, value):
+    monkeypatch.setenv('FEDER_BOOTSTRAP_WORKERS', value)
+    with pytest.raises(ValueError, match='FEDER_BOOTSTRAP_WORKERS'):
+        pool.default_workers('FEDER_BOOTSTRAP_WORKERS')
+
+
+def test_small_work_stays_in_process(monkeypatch):
+    monkeypatch.setattr(pool, '_get_executor', lambda workers: pytest.fail("pool créé pour un petit calcul"))
+    assert pool.pool_map(divmod, [(7, 2), (9, 4)], workers=4, work=pool.POOL_MIN_WORK - 1) == [(3, 1), (2, 1)]
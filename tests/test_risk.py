@@ -0,0 +1,47 @@
+"""Simulation Monte-Carlo des risques programme"""
+import math
+
+import numpy as np
+
+from feder_core.risk import RISK_CORRELATION, RISK_FACTORS, normal_cdf, simulate_factors, summarize
+
+PROGRAM_ID = '2021FR16FFPR001'
+
+
+def test_normal_cdf_matches_erf():
+    z = np.linspace(-6.0, 6.0, 241)
+    expected = [0.5 * (1.0 + math.erf(value / math.sqrt(2.0))) for value in z]
+    np.testing.assert_allclose(normal_cdf(z), expected, atol=1.5e-7)
+
+
+def test_copula_marginals_stay_within_factor_bounds():
+    factors = simulate_factors(PROGRAM_ID, scenarios=20000)
+    bounds = np.array(list(RISK_FACTORS.values()))
+    assert factors.shape == (20000, len(RISK_FACTORS))
+    assert (factors >= bounds[:, 0]).all() and (factors <= bounds[:, 1]).all()
+
+    # Marges uniformes sur les bornes : moyenne au milieu, écart-type (haute - basse) / sqrt(12)
+    widths = bounds[:, 1] - bounds[:, 0]
+    np.testing.assert_allclose(factors.mean(axis=0), bounds.mean(axis=1), atol=0.02 * widths.max())
+    np.testing.assert_allclose(factors.std(axis=0), widths / np.sqrt(12.0), rtol=0.03)
+
+
+def test_copula_keeps_factor_correlation():
+    factors = simulate_factors(PROGRAM_ID, scenarios=20000)
+    # Spearman d'une copule gaussienne : (6 / pi) arcsin(rho / 2)
+    ranks = factors.argsort(axis=0).argsort(axis=0)
+    expected = 6.0 / np.pi * np.arcsin(RISK_CORRELATION / 2.0)
+    np.testing.assert_allclose(np.corrcoef(ranks, rowvar=False), expected, atol=0.03)
+
+
+def test_simulation_is_reproducible_per_program():
+    np.testing.assert_array_equal(simulate_factors(PROGRAM_ID, 500), simulate_factors(PROGRAM_ID, 500))
+    assert not np.array_equal(simulate_factors(PROGRAM_ID, 500), simulate_factors('2014FR16RFOP001', 500))
+
+
+def test_euler_contributions_sum_to_one():
+    factors = simulate_factors(PROGRAM_ID, scenarios=5000)
+    summary = summarize(PROGRAM_ID, factors)
+    assert math.isclose(sum(summary.contributions.values()), 1.0, rel_tol=1e-9)
+    assert math.isclose(sum(summary.level_probabilities.values()), 1.0, rel_tol=1e-9)
+    assert summary.quantiles[0.05] <= summary.quantiles[0.5] <= summary.quantiles[0.95]
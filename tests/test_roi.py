@@ -0,0 +1,64 @@
+"""Moteur ROI et balayage de sensibilité"""
+import numpy as np
+import pandas as pd
+
+from feder_core.cache import DataCache
+from feder_core.roi import ROIEngine, roi_analysis, sensitivity_sweep
+
+
+def program_frame(budget_scale=1.0):
+    return pd.DataFrame({
+        'Année': np.arange(2021, 2028),
+        'Budget_Total': np.linspace(10e6, 16e6, 7) * budget_scale,
+        'Emplois_Crees': np.arange(50, 120, 10),
+        'PME_Soutenues': np.arange(5, 12),
+        'Beneficiaires_Directs': np.arange(1000, 8000, 1000)
+    })
+
+
+def test_ratios_follow_data_cache_version():
+    cache = DataCache()
+    engine = ROIEngine()
+    df = cache.get_or_build('generate_advanced_program_data', 'P1', program_frame)
+    version = cache.version('generate_advanced_program_data', 'P1')
+
+    years, ratios = engine.ratios('P1', version, df)
+    # Même version : aucune relecture du DataFrame
+    assert engine.ratios('P1', version, None)[1] is ratios
+    assert engine.stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+
+    cache.invalidate('generate_advanced_program_data', 'P1')
+    rebuilt = cache.get_or_build('generate_advanced_program_data', 'P1', lambda: program_frame(2.0))
+    new_version = cache.version('generate_advanced_program_data', 'P1')
+    assert new_version != version
+    _, new_ratios = engine.ratios('P1', new_version, rebuilt)
+    np.testing.assert_allclose(new_ratios, ratios / 2.0)
+
+
+def test_ratios_without_version_are_not_kept():
+    engine = ROIEngine()
+    years, ratios = engine.ratios('P1', None, program_frame())
+    expected = roi_analysis(program_frame(), weights=[1.0, 0.0, 0.0], unit_values=[1.0, 1.0, 1.0])
+    np.testing.assert_allclose(ratios[:, 0], expected['ROI_Total'])
+    assert engine.stats()['entries'] == 0
+
+
+def test_sweep_baseline_matches_roi_analysis():
+    frames = {'P1': program_frame(), 'P2': program_frame(0.5)}
+    program_ratios = {
+        program_id: ROIEngine().ratios(program_id, None, df)[1] for program_id, df in frames.items()
+    }
+    result = sensitivity_sweep(program_ratios, levels=5, span=0.4)
+
+    expected = [roi_analysis(df)['ROI_Total'].mean() for df in frames.values()]
+    np.testing.assert_allclose(result.baseline, expected)
+    # Point central de la grille : paramètres de référence
+    np.testing.assert_allclose(result.totals[(2,) * len(result.parameters)], expected)
+    assert result.totals.shape == (5,) * len(result.parameters) + (2,)
+
+
+def test_sweep_is_linear_in_each_parameter():
+    result = sensitivity_sweep({'P1': ROIEngine().ratios('P1', None, program_frame())[1]}, levels=3, span=0.5)
+    # Pas constants de la valeur sociale : effet constant sur le ROI moyen
+    low, mid, high = (result.totals[(1, 1, 1, 1, 1, level, 0)] for level in range(3))
+    np.testing.assert_allclose(high - mid, mid - low)
@@ -0,0 +1,41 @@
+"""Schéma typé des séries FEDER"""
+import numpy as np
+import pandas as pd
+
+from feder_core.schema import FRAME_SCHEMA, enforce_schema, memory_summary
+from feder_core.synthetic import synthetic_program_frame
+
+
+def untyped_frame(rows=40):
+    return pd.DataFrame({
+        'Programme': ['2014FR16RFOP001'] * rows,
+        'Territoire': ['Guadeloupe'] * rows,
+        'Année': np.arange(2014, 2014 + rows, dtype=np.int64),
+        'Emplois_Crees': np.arange(rows, dtype=np.int64),
+        'Taux_Realisation': np.linspace(0.5, 1.0, rows),
+        'Budget_Total': np.linspace(10.0, 20.0, rows)
+    })
+
+
+def test_enforce_schema_applies_declared_types():
+    typed = enforce_schema(untyped_frame())
+    for column in typed.columns:
+        if column in FRAME_SCHEMA:
+            assert typed[column].dtype == FRAME_SCHEMA[column]
+    # Montants non déclarés : float64 conservé
+    assert typed['Budget_Total'].dtype == np.float64
+    pd.testing.assert_frame_equal(typed.astype(untyped_frame().dtypes), untyped_frame(), check_exact=False, rtol=1e-6)
+
+
+def test_enforce_schema_is_idempotent_and_smaller():
+    typed = enforce_schema(untyped_frame())
+    assert enforce_schema(typed) is typed
+    assert memory_summary(typed)['reduction'] > 1.0
+
+
+def test_synthetic_frame_follows_schema():
+    frame = synthetic_program_frame(25)
+    assert len(frame) == 250
+    # Déjà typé à l'assemblage : enforce_schema n'a rien à convertir
+    assert enforce_schema(frame) is frame
+    assert frame['Programme'].cat.categories.size == 25
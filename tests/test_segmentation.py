@@ -0,0 +1,28 @@
+"""Artefact de segmentation K-means des territoires"""
+import copy
+
+import numpy as np
+
+from feder_core.reference import TERRITOIRES
+from feder_core.segmentation import (SegmentationArtifact, artifact_path, load_or_fit_segmentation,
+                                     territories_digest, territory_frame)
+
+
+def test_artifact_round_trip(tmp_path):
+    # Données propres au test : empreinte distincte de celle du dashboard
+    territoires = copy.deepcopy(TERRITOIRES)
+    territoires['DROM']['Mayotte']['population'] += 1
+    digest = territories_digest(territoires)
+
+    fitted = load_or_fit_segmentation(territoires, str(tmp_path))
+    path = artifact_path(digest, str(tmp_path))
+    loaded = SegmentationArtifact.load(path)
+
+    assert loaded.digest == digest == fitted.digest
+    assert loaded.territories == fitted.territories
+    np.testing.assert_array_equal(loaded.labels, fitted.labels)
+    np.testing.assert_allclose(loaded.centroids, fitted.centroids)
+
+    # Les territoires ajustés retombent sur leur propre centroïde
+    frame = territory_frame(territoires)
+    np.testing.assert_array_equal(loaded.assign(frame), loaded.labels_for(frame['Territoire']))
@@ -0,0 +1,37 @@
+"""Choix du modèle de prévision par backtest à origine glissante"""
+import numpy as np
+
+from feder_core.timeseries import FORECAST_MODELS, ForecastSelector, backtest, select_model
+
+YEARS = np.arange(2014, 2026, dtype=np.float64)
+
+
+def test_linear_data_selects_linear_model():
+    rng = np.random.default_rng(0)
+    values = 50.0 + 4.0 * (YEARS - YEARS[0]) + rng.normal(0, 0.2, len(YEARS))
+    selection = select_model(YEARS, values, horizon=3)
+    assert selection.model == 'Linéaire'
+    assert set(selection.errors) == set(FORECAST_MODELS)
+    np.testing.assert_array_equal(selection.years, [2026, 2027, 2028])
+    np.testing.assert_allclose(selection.prediction, 50.0 + 4.0 * (selection.years - YEARS[0]), rtol=0.01)
+
+
+def test_geometric_growth_selects_log_linear_model():
+    values = 10.0 * 1.25 ** (YEARS - YEARS[0])
+    assert select_model(YEARS, values).model == 'Log-linéaire'
+
+
+def test_log_linear_is_excluded_for_non_positive_series():
+    values = np.linspace(-5.0, 20.0, len(YEARS))
+    errors = backtest(YEARS, values)
+    assert errors['Log-linéaire'] == np.inf
+    assert np.isfinite(errors['Linéaire'])
+
+
+def test_selector_caches_by_data_version():
+    selector = ForecastSelector(workers=1)
+    series = {('P1', 'Budget_Total'): (YEARS, 3.0 * YEARS), ('P2', 'Budget_Total'): (YEARS, YEARS ** 1.5)}
+    first = selector.select_many(series)
+    second = selector.select_many(series)
+    assert all(second[name] is first[name] for name in series)
+    assert selector.stats() == {'hits': 2, 'misses': 2, 'entries': 2}